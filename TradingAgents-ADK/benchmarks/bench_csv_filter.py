@@ -0,0 +1,125 @@
+"""
+Benchmark the binary-search CSV date filter against the pandas round trip it replaced.
+
+The old _filter_csv_by_date_range parsed the whole Alpha Vantage response with
+pandas, filtered the date column and re-serialized the table. The new one
+binary-searches the ISO date prefixes of the lines and slices the text. Both
+run on a synthetic newest-first daily series (20 years by default).
+
+Before timing, the two are compared on random ranges. The pandas path
+re-serializes values, so the outputs are compared as parsed tables (same rows,
+same values) rather than as text.
+
+Usage (from the TradingAgents-ADK directory):
+    python benchmarks/bench_csv_filter.py [--rows 5215] [--ranges 500] [--repeat 200] [--seed 0]
+"""
+
+import argparse
+import os
+import sys
+import time
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.dataflows.alpha_vantage_common import _filter_csv_by_date_range  # noqa: E402
+
+
+def synthetic_csv(rows: int, seed: int, newest_first: bool = True) -> str:
+    """A TIME_SERIES_DAILY_ADJUSTED-style CSV on business days."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2005-01-03", periods=rows)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, rows)))
+    frame = pd.DataFrame({
+        "timestamp": dates.strftime("%Y-%m-%d"),
+        "open": np.round(close * (1 + rng.normal(0, 0.005, rows)), 4),
+        "high": np.round(close * 1.01, 4),
+        "low": np.round(close * 0.99, 4),
+        "close": np.round(close, 4),
+        "adjusted_close": np.round(close, 4),
+        "volume": rng.integers(1_000_000, 10_000_000, rows),
+        "dividend_amount": 0.0,
+        "split_coefficient": 1.0,
+    })
+    if newest_first:
+        frame = frame.iloc[::-1]
+    return frame.to_csv(index=False)
+
+
+def pandas_filter(csv_data: str, start_date: str, end_date: str) -> str:
+    """The pre-bisect _filter_csv_by_date_range body."""
+    df = pd.read_csv(StringIO(csv_data))
+    date_col = df.columns[0]
+    df[date_col] = pd.to_datetime(df[date_col])
+    start_dt = pd.to_datetime(start_date)
+    end_dt = pd.to_datetime(end_date)
+    filtered_df = df[(df[date_col] >= start_dt) & (df[date_col] <= end_dt)]
+    return filtered_df.to_csv(index=False)
+
+
+def _parsed(csv_data: str) -> pd.DataFrame:
+    df = pd.read_csv(StringIO(csv_data))
+    df[df.columns[0]] = pd.to_datetime(df[df.columns[0]])
+    return df.reset_index(drop=True)
+
+
+def random_ranges(csv_data: str, count: int, seed: int):
+    """Random [start, end] pairs, including ones outside the series and empty ones."""
+    rng = np.random.default_rng(seed)
+    lines = csv_data.splitlines()[1:]
+    first, last = sorted([lines[0][:10], lines[-1][:10]])
+    days = pd.date_range(pd.Timestamp(first) - pd.Timedelta(days=30), pd.Timestamp(last) + pd.Timedelta(days=30))
+    for _ in range(count):
+        a, b = sorted(rng.integers(0, len(days), 2))
+        yield days[a].strftime("%Y-%m-%d"), days[b].strftime("%Y-%m-%d")
+
+
+def check_equivalent(csv_data: str, ranges) -> int:
+    checked = 0
+    for start_date, end_date in ranges:
+        expected = _parsed(pandas_filter(csv_data, start_date, end_date))
+        actual = _parsed(_filter_csv_by_date_range(csv_data, start_date, end_date))
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+        checked += 1
+    return checked
+
+
+def per_call(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5215, help="Daily rows in the synthetic response")
+    parser.add_argument("--ranges", type=int, default=500, help="Random ranges checked for equivalence")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed calls per path")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    checked = 0
+    for newest_first in (True, False):
+        csv_data = synthetic_csv(args.rows, args.seed, newest_first)
+        checked += check_equivalent(csv_data, random_ranges(csv_data, args.ranges, args.seed))
+    print(f"Outputs match on {checked} random ranges (both sort orders).")
+
+    csv_data = synthetic_csv(args.rows, args.seed)
+    lines = csv_data.splitlines()
+    # One quarter from the middle of the series, a typical tool call
+    end_date = lines[len(lines) // 2][:10]
+    start_date = (pd.Timestamp(end_date) - pd.DateOffset(months=3)).strftime("%Y-%m-%d")
+
+    old = per_call(lambda: pandas_filter(csv_data, start_date, end_date), args.repeat)
+    new = per_call(lambda: _filter_csv_by_date_range(csv_data, start_date, end_date), args.repeat)
+    print(f"{args.rows} rows, {start_date} to {end_date}, {args.repeat} calls each")
+    print(f"pandas round trip: {old * 1e3:8.3f} ms per call")
+    print(f"bisect:            {new * 1e3:8.3f} ms per call ({old / new:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
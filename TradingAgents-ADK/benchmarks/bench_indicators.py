@@ -0,0 +1,126 @@
+"""
+Benchmark the NumPy indicator engine against the stockstats path it replaced.
+
+The old path wrapped the whole price history with stockstats, computed one
+column and walked every row with iterrows() to build a date -> value dict. The
+new path computes the column with IndicatorFrame. Both run on the same
+synthetic daily series (15 years by default), and every indicator is checked
+for equivalence before it is timed, both on the clean series and on a copy
+with a few NaN price bars (as dividend/split-only rows from yfinance have).
+
+Usage (from the TradingAgents-ADK directory):
+    python benchmarks/bench_indicators.py [--rows 3800] [--repeat 5] [--seed 0]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.dataflows.indicators import SUPPORTED_INDICATORS, IndicatorFrame  # noqa: E402
+from tradingagents.dataflows.price_store import frame_from_records, records_from_frame  # noqa: E402
+
+
+def synthetic_prices(rows: int, seed: int) -> pd.DataFrame:
+    """Random-walk daily OHLCV bars on business days, indexed by Date like yfinance."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, rows)))
+    open_ = close * (1 + rng.normal(0, 0.005, rows))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, rows))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, rows))
+    volume = rng.integers(1_000_000, 10_000_000, rows).astype(float)
+    index = pd.bdate_range("2010-01-04", periods=rows, name="Date")
+    return pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+        index=index,
+    )
+
+
+def with_nan_bars(data: pd.DataFrame, count: int, seed: int) -> pd.DataFrame:
+    """Copy of data with the OHLC values of count random bars set to NaN."""
+    rng = np.random.default_rng(seed + 1)
+    data = data.copy()
+    rows = rng.choice(np.arange(1, len(data)), size=min(count, len(data) - 1), replace=False)
+    data.iloc[rows, data.columns.get_indexer(["Open", "High", "Low", "Close"])] = np.nan
+    return data
+
+
+def stockstats_bulk(data: pd.DataFrame, indicator: str) -> dict:
+    """The pre-vectorization _get_stock_stats_bulk body: stockstats plus iterrows."""
+    from stockstats import wrap
+
+    df = wrap(data.copy())
+    df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
+    df[indicator]
+
+    result_dict = {}
+    for _, row in df.iterrows():
+        indicator_value = row[indicator]
+        if pd.isna(indicator_value):
+            result_dict[row["Date"]] = "N/A"
+        else:
+            result_dict[row["Date"]] = str(indicator_value)
+    return result_dict
+
+
+def engine_column(records: np.ndarray, indicator: str) -> np.ndarray:
+    return IndicatorFrame(records).get(indicator)
+
+
+def check_equivalent(expected: dict, dates: np.ndarray, values: np.ndarray, indicator: str) -> None:
+    date_strs = np.datetime_as_string(dates, unit="D")
+    assert list(expected) == list(date_strs), f"{indicator}: dates differ"
+    old = np.array([np.nan if v == "N/A" else float(v) for v in expected.values()])
+    assert np.array_equal(np.isnan(old), np.isnan(values)), f"{indicator}: NaN positions differ"
+    assert np.allclose(old, values, rtol=1e-9, atol=1e-9, equal_nan=True), f"{indicator}: values differ"
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=3800, help="Daily bars in the synthetic series")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path; the best is reported")
+    parser.add_argument("--nan-bars", type=int, default=3, help="NaN price bars in the equivalence check")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = synthetic_prices(args.rows, args.seed)
+    records = records_from_frame(data)
+    frame = frame_from_records(records)
+
+    nan_records = records_from_frame(with_nan_bars(data, args.nan_bars, args.seed))
+    nan_frame = frame_from_records(nan_records)
+    for indicator in SUPPORTED_INDICATORS:
+        check_equivalent(
+            stockstats_bulk(nan_frame, indicator), nan_records["date"], engine_column(nan_records, indicator), indicator
+        )
+
+    print(f"{args.rows} bars, best of {args.repeat}")
+    print(f"{'indicator':<14}{'stockstats':>14}{'engine':>12}{'speedup':>10}")
+    total_old = total_new = 0.0
+    for indicator in SUPPORTED_INDICATORS:
+        check_equivalent(stockstats_bulk(frame, indicator), records["date"], engine_column(records, indicator), indicator)
+        old = best_of(lambda: stockstats_bulk(frame, indicator), args.repeat)
+        new = best_of(lambda: engine_column(records, indicator), args.repeat)
+        total_old += old
+        total_new += new
+        print(f"{indicator:<14}{old * 1e3:>11.2f} ms{new * 1e3:>9.3f} ms{old / new:>9.0f}x")
+    print(f"{'total':<14}{total_old * 1e3:>11.2f} ms{total_new * 1e3:>9.3f} ms{total_old / total_new:>9.0f}x")
+    print(f"All indicators match stockstats, with and without {args.nan_bars} NaN bars.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Benchmark the hash-set deduplication of Finnhub insider entries against the list scan it replaced.
+
+The old insider reports checked every entry with `entry not in seen_dicts`, a
+linear scan over a list of dicts, and built the report with repeated +=. The
+new ones key entries by their canonical JSON in a set (local._unique_entries)
+and join the report once. Both build the insider transactions and insider
+sentiment reports for one synthetic ticker with many filings over the 15-day
+lookback, some of them repeated across dates. The reports must be identical.
+
+The new reports are produced by the real functions in dataflows.local, with
+get_data_in_range pointed at the synthetic data, so only the report building
+is timed and not the file lookup.
+
+Usage (from the TradingAgents-ADK directory):
+    python benchmarks/bench_insider_dedup.py [--filings 10000] [--duplicates 0.2] [--repeat 3] [--seed 0]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.dataflows import local  # noqa: E402
+
+CURR_DATE = "2024-06-15"
+LOOKBACK_DAYS = 15
+
+
+def synthetic_filings(filings: int, duplicates: float, seed: int, kind: str) -> dict:
+    """{date: [entries]} over the lookback window, with a share of entries repeated on other dates."""
+    rng = np.random.default_rng(seed)
+    end = datetime.strptime(CURR_DATE, "%Y-%m-%d")
+    dates = [(end - timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range(LOOKBACK_DAYS)]
+
+    distinct = max(1, int(filings * (1 - duplicates)))
+    entries = []
+    for i in range(distinct):
+        if kind == "insider_trans":
+            entries.append({
+                "name": f"Insider {i % 500}",
+                "share": int(rng.integers(1_000, 1_000_000)),
+                "change": int(rng.integers(-50_000, 50_000)),
+                "filingDate": dates[i % len(dates)],
+                "transactionDate": dates[(i + 1) % len(dates)],
+                "transactionCode": "SPMA"[i % 4],
+                "transactionPrice": round(float(rng.uniform(10, 500)), 2),
+                "id": f"filing-{i}",
+                "symbol": "SYN",
+                "isDerivative": bool(i % 7 == 0),
+                "currency": "USD",
+            })
+        else:
+            entries.append({
+                "symbol": "SYN",
+                "year": 2000 + i // 12,
+                "month": i % 12 + 1,
+                "change": int(rng.integers(-50_000, 50_000)),
+                "mspr": round(float(rng.uniform(-100, 100)), 6),
+            })
+    repeats = [dict(entries[j]) for j in rng.integers(0, distinct, filings - distinct)]
+
+    data = {date: [] for date in dates}
+    for position, entry in enumerate(entries + repeats):
+        data[dates[position % len(dates)]].append(entry)
+    return data
+
+
+def list_dedup_transactions(ticker: str, curr_date: str, data: dict) -> str:
+    """The pre-set get_finnhub_company_insider_transactions report building."""
+    before = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=LOOKBACK_DAYS)).strftime("%Y-%m-%d")
+    result_str = ""
+    seen_dicts = []
+    for date, senti_list in data.items():
+        for entry in senti_list:
+            if entry not in seen_dicts:
+                result_str += f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
+                seen_dicts.append(entry)
+    return f"## {ticker} insider transactions from {before} to {curr_date}:\n" + result_str
+
+
+def list_dedup_sentiment(ticker: str, curr_date: str, data: dict) -> str:
+    """The pre-set get_finnhub_company_insider_sentiment report building."""
+    before = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=LOOKBACK_DAYS)).strftime("%Y-%m-%d")
+    result_str = ""
+    seen_dicts = []
+    for date, senti_list in data.items():
+        for entry in senti_list:
+            if entry not in seen_dicts:
+                result_str += f"### {entry['year']}-{entry['month']}:\nChange: {entry['change']}\nMonthly Share Purchase Ratio: {entry['mspr']}\n\n"
+                seen_dicts.append(entry)
+    return f"## {ticker} Insider Sentiment Data for {before} to {curr_date}:\n" + result_str
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filings", type=int, default=10000, help="Entries for the ticker over the lookback")
+    parser.add_argument("--duplicates", type=float, default=0.2, help="Share of entries that repeat an earlier one")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per path; the best is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cases = [
+        ("insider_trans", list_dedup_transactions, local.get_finnhub_company_insider_transactions),
+        ("insider_senti", list_dedup_sentiment, local.get_finnhub_company_insider_sentiment),
+    ]
+    print(f"{args.filings} entries over {LOOKBACK_DAYS} days, {args.duplicates:.0%} repeated, best of {args.repeat}")
+    for data_type, old_report, new_report in cases:
+        data = synthetic_filings(args.filings, args.duplicates, args.seed, data_type)
+        local.get_data_in_range = lambda *_args, **_kwargs: data
+
+        # The new report appends an explanation paragraph to the same text
+        old_text = old_report("SYN", CURR_DATE, data)
+        new_text = new_report("SYN", CURR_DATE)
+        assert new_text.startswith(old_text), f"{data_type}: reports differ"
+        assert new_text[len(old_text):].startswith("The change field"), f"{data_type}: reports differ"
+
+        old = best_of(lambda: old_report("SYN", CURR_DATE, data), args.repeat)
+        new = best_of(lambda: new_report("SYN", CURR_DATE), args.repeat)
+        print(f"{data_type}: list scan {old * 1e3:9.1f} ms, hash set {new * 1e3:7.1f} ms ({old / new:.0f}x)")
+    print("Reports are identical.")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Run multi-agent trading analysis using Google ADK
 
 import os
 import sys
+import logging
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -15,6 +16,7 @@ from google.genai import types
 from tradingagents.agent import root_agent
 from tradingagents.config.default_config import ADK_CONFIG
 from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows import instrumentation
 from tradingagents.default_config import DEFAULT_CONFIG
 
 load_dotenv()
@@ -35,6 +37,10 @@ def run_trading_analysis(ticker: str, trade_date: str = None):
         trade_date = datetime.now().strftime("%Y-%m-%d")
     
     set_config(DEFAULT_CONFIG)
+
+    instrumentation_config = DEFAULT_CONFIG.get("instrumentation", {})
+    if instrumentation_config.get("enabled", False):
+        instrumentation.enable_instrumentation(log_spans=instrumentation_config.get("log_spans", False))
     
     print(f"\n{'='*80}")
     print(f"TradingAgents ADK - Multi-Agent Trading Analysis")
@@ -76,6 +82,13 @@ Then provide your final trading recommendation."""
     
     for part in response.candidates[0].content.parts:
         print(part.text)
+
+    summary = instrumentation.get_summary()
+    if summary is not None:
+        print("\n" + "="*80)
+        print("DATA VENDOR SUMMARY")
+        print("="*80)
+        print(summary.format())
     
     return response
 
@@ -100,6 +113,11 @@ def main():
     )
     
     args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if os.getenv("ADK_DEBUG") else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
     
     run_trading_analysis(args.ticker, args.date)
 
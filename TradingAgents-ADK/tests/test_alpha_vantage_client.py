@@ -0,0 +1,127 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from tradingagents.dataflows import alpha_vantage_common, config
+from tradingagents.dataflows.alpha_vantage_common import AlphaVantageClient, AlphaVantageRateLimitError
+
+CSV_BODY = "timestamp,open,high,low,close,volume\n2024-01-02,1,2,0.5,1.5,100\n"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so connection reuse is observable
+
+    def do_GET(self):
+        server = self.server
+        server.client_ports.append(self.client_address[1])
+        status, body = server.responses.pop(0)
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(tmp_path, monkeypatch):
+    """Serve queued (status, body) responses on localhost in place of the Alpha Vantage API."""
+    original = config.get_config()
+    config.set_config({
+        "data_cache_dir": str(tmp_path),
+        "alpha_vantage": dict(original["alpha_vantage"], rate_limit=True, calls_per_minute=1000),
+    })
+    monkeypatch.setenv("ALPHA_VANTAGE_API_KEY", "test-key")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.responses = []
+    server.client_ports = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(alpha_vantage_common, "API_BASE_URL", f"http://127.0.0.1:{server.server_port}/query")
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    config.set_config(original)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = AlphaVantageClient(timeout=(2, 5), max_retries=3, backoff_factor=0)
+    tokens = []
+    wait_for_token = client.wait_for_token
+    monkeypatch.setattr(client, "wait_for_token", lambda: (tokens.append(1), wait_for_token()))
+    client.tokens = tokens
+    yield client
+    client.close()
+
+
+def test_session_reuses_one_connection(stub_server, client):
+    stub_server.responses.extend([(200, CSV_BODY)] * 3)
+
+    for _ in range(3):
+        assert client.request("TIME_SERIES_DAILY", {"symbol": "IBM"}) == CSV_BODY
+
+    assert len(stub_server.client_ports) == 3
+    assert len(set(stub_server.client_ports)) == 1
+
+
+def test_retries_429_and_503_with_a_token_per_attempt(stub_server, client):
+    stub_server.responses.extend([(429, "busy"), (503, "unavailable"), (200, CSV_BODY)])
+
+    assert client.request("TIME_SERIES_DAILY", {"symbol": "IBM"}) == CSV_BODY
+    assert len(stub_server.client_ports) == 3
+    assert len(client.tokens) == 3
+
+
+def test_gives_up_after_max_retries(stub_server, client):
+    stub_server.responses.extend([(503, "unavailable")] * 4)
+
+    with pytest.raises(requests.HTTPError) as excinfo:
+        client.request("TIME_SERIES_DAILY", {"symbol": "IBM"})
+
+    assert excinfo.value.response.status_code == 503
+    assert len(client.tokens) == 4
+
+
+def test_rate_limit_message_raises_rate_limit_error(stub_server, client):
+    message = {"Information": "Thank you for using Alpha Vantage! Our standard API rate limit is 25 requests per day."}
+    stub_server.responses.append((200, json.dumps(message)))
+
+    with pytest.raises(AlphaVantageRateLimitError):
+        client.request("TIME_SERIES_DAILY", {"symbol": "IBM"})
+
+
+def _run_async(client, calls):
+    """Run request_async calls in order on one event loop and return their results."""
+    async def run():
+        try:
+            return [await client.request_async("TIME_SERIES_DAILY", {"symbol": "IBM"}) for _ in range(calls)]
+        finally:
+            await client.aclose()
+
+    return asyncio.run(run())
+
+
+def test_async_session_reuses_one_connection(stub_server, client):
+    pytest.importorskip("aiohttp")
+    stub_server.responses.extend([(200, CSV_BODY)] * 3)
+
+    assert _run_async(client, 3) == [CSV_BODY] * 3
+    assert len(set(stub_server.client_ports)) == 1
+
+
+def test_async_retries_429_and_503_with_a_token_per_attempt(stub_server, client):
+    pytest.importorskip("aiohttp")
+    stub_server.responses.extend([(429, "busy"), (503, "unavailable"), (200, CSV_BODY)])
+
+    assert _run_async(client, 1) == [CSV_BODY]
+    assert len(stub_server.client_ports) == 3
+    assert len(client.tokens) == 3
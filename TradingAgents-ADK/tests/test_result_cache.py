@@ -0,0 +1,76 @@
+import pytest
+
+from tradingagents.dataflows import config, interface
+from tradingagents.dataflows.result_cache import is_cacheable, reset_result_cache
+
+
+@pytest.fixture
+def routed(tmp_path, monkeypatch):
+    """Route get_balance_sheet to a single fake vendor with the result cache on disk."""
+    original = config.get_config()
+    config.set_config({
+        "data_cache_dir": str(tmp_path),
+        "data_vendors": dict(original["data_vendors"], fundamental_data="yfinance"),
+        "tool_vendors": {},
+        "result_cache": dict(original["result_cache"], enabled=True, disk=True),
+        "single_flight": {"enabled": False},
+    })
+    reset_result_cache()
+
+    responses = []
+    calls = []
+
+    def fake_balance_sheet(ticker, freq="quarterly", curr_date=None):
+        calls.append(ticker)
+        return responses.pop(0)
+
+    monkeypatch.setitem(interface.VENDOR_METHODS, "get_balance_sheet", {"yfinance": fake_balance_sheet})
+    yield responses, calls
+
+    config.set_config(original)
+    reset_result_cache()
+
+
+def test_error_result_is_not_cached(routed):
+    responses, calls = routed
+    responses.extend([
+        "Error retrieving balance sheet for AAPL: connection reset",
+        "# Balance Sheet data for AAPL (quarterly)\nTotal Assets,1",
+    ])
+
+    first = interface.route_to_vendor("get_balance_sheet", "AAPL", "quarterly", "2024-01-02")
+    second = interface.route_to_vendor("get_balance_sheet", "AAPL", "quarterly", "2024-01-02")
+
+    assert first.startswith("Error retrieving")
+    assert second.startswith("# Balance Sheet")
+    assert len(calls) == 2
+
+
+def test_successful_result_is_cached(routed):
+    responses, calls = routed
+    responses.append("# Balance Sheet data for AAPL (quarterly)\nTotal Assets,1")
+
+    first = interface.route_to_vendor("get_balance_sheet", "AAPL", "quarterly", "2024-01-02")
+    second = interface.route_to_vendor("get_balance_sheet", "AAPL", "quarterly", "2024-01-02")
+
+    assert first == second
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("result", [
+    None,
+    "",
+    "   ",
+    "No cash flow data found for symbol 'XYZ'",
+    '{\n    "Error Message": "Invalid API call."\n}',
+    '{"Note": "Thank you for using Alpha Vantage!"}',
+    "  Error retrieving macd data: timeout",
+])
+def test_is_cacheable_rejects_empty_and_error_results(result):
+    assert not is_cacheable(result)
+
+
+def test_is_cacheable_accepts_reports():
+    assert is_cacheable("## AAPL News, from 2024-01-01 to 2024-01-02:\n### Headline")
+    assert is_cacheable({"AAPL": 1})
+    assert is_cacheable("## AAPL News, from 2024-01-01 to 2024-01-02:\n### Headline\nError rates fell at the plant")
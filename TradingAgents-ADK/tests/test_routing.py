@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from tradingagents.dataflows import async_interface, config, interface
+
+
+@pytest.fixture
+def vendors(tmp_path, monkeypatch):
+    """get_balance_sheet routed to a failing primary vendor with a working fallback."""
+    original = config.get_config()
+    config.set_config({
+        "data_cache_dir": str(tmp_path),
+        "data_vendors": dict(original["data_vendors"], fundamental_data="alpha_vantage"),
+        "tool_vendors": {},
+        "result_cache": dict(original["result_cache"], enabled=False),
+        "single_flight": {"enabled": False},
+        "hedging": dict(original["hedging"], enabled=False),
+        "circuit_breaker": dict(original["circuit_breaker"], enabled=False),
+    })
+    calls = []
+
+    def failing(ticker, freq="quarterly", curr_date=None):
+        calls.append("alpha_vantage")
+        raise ConnectionError("connection reset")
+
+    def working(ticker, freq="quarterly", curr_date=None):
+        calls.append("yfinance")
+        return f"# Balance Sheet data for {ticker}"
+
+    monkeypatch.setitem(interface.VENDOR_METHODS, "get_balance_sheet", {"alpha_vantage": failing, "yfinance": working})
+    yield calls
+    config.set_config(original)
+
+
+def test_sync_router_falls_back(vendors):
+    assert interface.route_to_vendor("get_balance_sheet", "AAPL") == "# Balance Sheet data for AAPL"
+    assert vendors == ["alpha_vantage", "yfinance"]
+
+
+def test_async_router_follows_the_same_chain(vendors):
+    result = asyncio.run(async_interface.route_to_vendor_async("get_balance_sheet", "AAPL"))
+
+    assert result == "# Balance Sheet data for AAPL"
+    assert vendors == ["alpha_vantage", "yfinance"]
+
+
+def test_all_vendors_failing_raises(vendors, monkeypatch):
+    monkeypatch.setitem(interface.VENDOR_METHODS, "get_balance_sheet", {
+        "alpha_vantage": interface.VENDOR_METHODS["get_balance_sheet"]["alpha_vantage"],
+    })
+
+    with pytest.raises(RuntimeError):
+        interface.route_to_vendor("get_balance_sheet", "AAPL")
+    with pytest.raises(RuntimeError):
+        asyncio.run(async_interface.route_to_vendor_async("get_balance_sheet", "AAPL"))
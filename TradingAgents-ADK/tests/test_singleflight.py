@@ -0,0 +1,42 @@
+import asyncio
+
+from tradingagents.dataflows.singleflight import SingleFlight
+
+
+def test_cancelled_leader_does_not_cancel_waiters():
+    group = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "shared"
+
+    async def run():
+        leader = asyncio.ensure_future(group.do_async("key", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(group.do_async("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await waiter, leader.cancelled()
+
+    assert asyncio.run(run()) == ("shared", True)
+    assert calls == [1]
+    assert group.stats()["in_flight"] == 0
+
+
+def test_async_errors_reach_every_caller():
+    group = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("connection reset")
+
+    async def run():
+        return await asyncio.gather(
+            group.do_async("key", fetch), group.do_async("key", fetch), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert [type(result) for result in results] == [ConnectionError, ConnectionError]
+    assert group.stats()["executed"] == 1
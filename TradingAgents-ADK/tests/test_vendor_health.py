@@ -0,0 +1,60 @@
+import pytest
+
+from tradingagents.dataflows import config, interface, vendor_health
+from tradingagents.dataflows.vendor_health import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def breakers(monkeypatch):
+    """A fresh vendor health registry with the circuit breaker enabled."""
+    original = config.get_config()
+    config.set_config({"circuit_breaker": dict(original["circuit_breaker"], enabled=True, failure_threshold=3)})
+    registry = vendor_health.VendorHealthRegistry()
+    monkeypatch.setattr(vendor_health, "_vendor_health", registry)
+    monkeypatch.setattr(interface, "get_vendor_health", lambda: registry)
+    yield registry
+    config.set_config(original)
+
+
+def _call(error=None, result="ok"):
+    def impl(*args, **kwargs):
+        if error is not None:
+            raise error
+        return result
+    return interface._call_vendor_impl("get_indicators", impl, "alpha_vantage", ("AAPL",), {})
+
+
+def test_caller_errors_do_not_trip_the_breaker(breakers):
+    for _ in range(5):
+        assert _call(ValueError("Indicator foo is not supported")) == (False, None)
+
+    assert breakers.breaker("alpha_vantage", "get_indicators").state == CLOSED
+
+
+def test_transport_errors_trip_the_breaker(breakers):
+    for _ in range(3):
+        _call(ConnectionError("connection reset"))
+
+    assert breakers.breaker("alpha_vantage", "get_indicators").state == OPEN
+
+
+def test_error_strings_count_as_failures(breakers):
+    for _ in range(3):
+        assert _call(result="Error retrieving data for AAPL: timeout") == (True, "Error retrieving data for AAPL: timeout")
+
+    assert breakers.breaker("alpha_vantage", "get_indicators").state == OPEN
+
+
+def test_half_open_admits_a_single_probe():
+    breaker = CircuitBreaker(failure_threshold=1, base_cooldown=0.0)
+    breaker.record_failure()
+    assert breaker.state == HALF_OPEN
+
+    assert breaker.acquire()
+    assert not breaker.acquire()
+
+    breaker.release()
+    assert breaker.acquire()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.acquire() and breaker.acquire()
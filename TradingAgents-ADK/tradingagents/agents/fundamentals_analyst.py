@@ -14,6 +14,7 @@ from tradingagents.tools.fundamental_tools import (
     get_balance_sheet,
     get_cashflow,
     get_income_statement,
+    get_financial_statements_asof,
 )
 
 
@@ -30,10 +31,11 @@ FUNDAMENTALS_ANALYST_INSTRUCTION = """You are a Fundamentals Analyst specializin
 - `get_balance_sheet(ticker, freq, curr_date)`: Balance sheet data (quarterly/annual)
 - `get_cashflow(ticker, freq, curr_date)`: Cash flow statement data
 - `get_income_statement(ticker, freq, curr_date)`: Income statement data
+- `get_financial_statements_asof(ticker, freq, curr_date)`: Balance sheet, cash flow and income statement in one call
 
 **Workflow**:
 - Start with get_fundamentals for comprehensive overview
-- Use specific financial statement tools for detailed analysis
+- Call get_financial_statements_asof once for all three statements; use the individual statement tools only if you need one statement at another frequency
 - Analyze trends and key metrics across time periods
 - Include as much detail as possible
 - Provide finegrained analysis - avoid vague statements
@@ -54,5 +56,5 @@ fundamentals_analyst_agent = types.Agent(
     name="Fundamentals Analyst",
     model="gemini-2.0-flash-exp",
     instructions=FUNDAMENTALS_ANALYST_INSTRUCTION,
-    tools=[get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement],
+    tools=[get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement, get_financial_statements_asof],
 )
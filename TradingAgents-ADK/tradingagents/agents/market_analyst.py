@@ -24,7 +24,7 @@ MARKET_ANALYST_INSTRUCTION = """You are a Market Analyst specializing in technic
 
 3. **Workflow**:
    - ALWAYS call get_stock_data first to retrieve price data
-   - Then call get_indicators with specific indicator names
+   - Then call get_indicators once with the list of selected indicator names
    - Analyze trends with detail - avoid vague statements like "trends are mixed"
    - Provide finegrained insights that help traders make decisions
    - Append a markdown table at the end summarizing key findings
@@ -1,12 +1,22 @@
 import os
+import re
+import asyncio
+import threading
+import time
+import weakref
 import requests
-import pandas as pd
 import json
 from datetime import datetime
-from io import StringIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .config import get_config
+from .rate_limiter import RateLimitTimeout, get_rate_limiter
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
+# Responses retried by AlphaVantageClient, each retry taking its own rate limit token
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
 def get_api_key() -> str:
     """Retrieve the API key for Alpha Vantage from environment variables."""
     api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
@@ -39,17 +49,13 @@ class AlphaVantageRateLimitError(Exception):
     """Exception raised when Alpha Vantage API rate limit is exceeded."""
     pass
 
-def _make_api_request(function_name: str, params: dict) -> dict | str:
-    """Helper function to make API requests and handle responses.
-    
-    Raises:
-        AlphaVantageRateLimitError: When API rate limit is exceeded
-    """
+def _build_api_params(function_name: str, params: dict, api_key: str = None) -> dict:
+    """Build the full query parameters for an Alpha Vantage request."""
     # Create a copy of params to avoid modifying the original
     api_params = params.copy()
     api_params.update({
         "function": function_name,
-        "apikey": get_api_key(),
+        "apikey": api_key or get_api_key(),
         "source": "trading_agents",
     })
     
@@ -62,12 +68,11 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
     elif "entitlement" in api_params:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
-    
-    response = requests.get(API_BASE_URL, params=api_params)
-    response.raise_for_status()
 
-    response_text = response.text
-    
+    return api_params
+
+def _check_response_text(response_text: str) -> str:
+    """Raise AlphaVantageRateLimitError if the response body reports a rate limit."""
     # Check if response is JSON (error responses are typically JSON)
     try:
         response_json = json.loads(response_text)
@@ -82,12 +87,236 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
 
     return response_text
 
+class AlphaVantageClient:
+    """
+    Shared Alpha Vantage HTTP client.
+
+    Keeps one connection-pooled requests.Session so repeated calls reuse keep-alive
+    connections instead of paying TCP and TLS setup per request, asks for gzip
+    responses, applies the configured connect/read timeouts and retries transient
+    failures (connection errors, 429 and 5xx) with exponential backoff. The API key
+    is read from the environment once, on the first request.
+
+    Every attempt first takes a token from the per-API-key token bucket (see
+    rate_limiter), which queues and paces calls to stay inside the configured quotas
+    across threads and processes. Connection errors never reach the server, so the
+    session's adapter retries those; 429 and 5xx responses are retried by request()
+    so each re-send is paced by the bucket too.
+
+    request_async() applies the same policy over one pooled aiohttp session per
+    event loop.
+    """
+
+    def __init__(
+        self,
+        timeout=(5.0, 30.0),
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        pool_maxsize: int = 16,
+    ):
+        self.timeout = tuple(timeout) if isinstance(timeout, (list, tuple)) else timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.pool_maxsize = pool_maxsize
+        self._api_key = None
+        # Event loop -> aiohttp.ClientSession; sessions are bound to the loop that made them
+        self._async_sessions = weakref.WeakKeyDictionary()
+        self._async_lock = threading.Lock()
+
+        retry = Retry(
+            total=max_retries,
+            read=0,
+            status=0,
+            backoff_factor=backoff_factor,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate"})
+
+    @property
+    def api_key(self) -> str:
+        if self._api_key is None:
+            self._api_key = get_api_key()
+        return self._api_key
+
+    def request(self, function_name: str, params: dict) -> str:
+        """Issue one API call and return the response body.
+
+        Raises:
+            AlphaVantageRateLimitError: When API rate limit is exceeded
+        """
+        api_params = _build_api_params(function_name, params, self.api_key)
+
+        for attempt in range(self.max_retries + 1):
+            self.wait_for_token()
+            response = self.session.get(API_BASE_URL, params=api_params, timeout=self.timeout)
+            if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                break
+            time.sleep(self._retry_delay(response, attempt))
+        response.raise_for_status()
+
+        return _check_response_text(response.text)
+
+    async def request_async(self, function_name: str, params: dict) -> str:
+        """Async counterpart of request() on the event loop's pooled aiohttp session.
+
+        Raises:
+            AlphaVantageRateLimitError: When API rate limit is exceeded
+        """
+        import aiohttp
+
+        api_params = _build_api_params(function_name, params, self.api_key)
+        session = self._async_session()
+
+        for attempt in range(self.max_retries + 1):
+            # Queue in a worker thread; the caller's priority lane carries over with the context
+            await asyncio.to_thread(self.wait_for_token)
+            try:
+                async with session.get(API_BASE_URL, params=api_params) as response:
+                    if response.status not in RETRY_STATUSES or attempt == self.max_retries:
+                        response.raise_for_status()
+                        response_text = await response.text()
+                        break
+                    delay = self._retry_delay(response, attempt)
+            except aiohttp.ClientConnectorError:
+                # Like the sync adapter, retry connection failures with backoff
+                if attempt == self.max_retries:
+                    raise
+                delay = self.backoff_factor * (2 ** attempt)
+            await asyncio.sleep(delay)
+
+        return _check_response_text(response_text)
+
+    def _async_session(self):
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            session = self._async_sessions.get(loop)
+            if session is None or session.closed:
+                if isinstance(self.timeout, tuple):
+                    timeout = aiohttp.ClientTimeout(sock_connect=self.timeout[0], sock_read=self.timeout[1])
+                else:
+                    timeout = aiohttp.ClientTimeout(total=self.timeout)
+                session = aiohttp.ClientSession(
+                    timeout=timeout,
+                    connector=aiohttp.TCPConnector(limit=self.pool_maxsize),
+                    headers={"Accept-Encoding": "gzip, deflate"},
+                    auto_decompress=True,
+                )
+                self._async_sessions[loop] = session
+            return session
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session of the running event loop, if one was opened."""
+        with self._async_lock:
+            session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    def _retry_delay(self, response, attempt: int) -> float:
+        """Seconds to wait before re-sending: Retry-After if given, else exponential backoff."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        return self.backoff_factor * (2 ** attempt)
+
+    def wait_for_token(self) -> None:
+        """
+        Block until the rate limiter admits one call in the caller's priority lane.
+
+        Raises:
+            AlphaVantageRateLimitError: If the quota stays exhausted for longer than
+                alpha_vantage.max_queue_seconds
+        """
+        av_config = get_config().get("alpha_vantage", {})
+        if not av_config.get("rate_limit", True):
+            return
+        limiter = get_rate_limiter(
+            "alpha_vantage",
+            self.api_key,
+            os.path.join(get_config()["data_cache_dir"], "rate_limits"),
+            {
+                "minute": (av_config.get("calls_per_minute", 60), 60.0),
+                "day": (av_config.get("calls_per_day"), 24 * 60 * 60.0),
+            },
+        )
+        try:
+            limiter.acquire(max_wait=av_config.get("max_queue_seconds", 120))
+        except RateLimitTimeout as e:
+            raise AlphaVantageRateLimitError(f"Alpha Vantage client-side quota exhausted: {e}")
+
+    def close(self) -> None:
+        self.session.close()
+        # Async sessions can only be closed on their own loop (see aclose); drop
+        # the rest so a reset client does not hand them out again
+        with self._async_lock:
+            self._async_sessions.clear()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> AlphaVantageClient:
+    """Return the process-wide Alpha Vantage client, configured from alpha_vantage settings."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                av_config = get_config().get("alpha_vantage", {})
+                _client = AlphaVantageClient(
+                    timeout=av_config.get("timeout_seconds", (5.0, 30.0)),
+                    max_retries=av_config.get("max_retries", 3),
+                    backoff_factor=av_config.get("backoff_factor", 0.5),
+                    pool_maxsize=av_config.get("pool_maxsize", 16),
+                )
+    return _client
+
+
+def reset_client() -> None:
+    """Close the shared client so the next request picks up new settings or API key."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+
+
+def _make_api_request(function_name: str, params: dict) -> dict | str:
+    """Helper function to make API requests and handle responses.
+    
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+    """
+    return get_client().request(function_name, params)
+
+async def _make_api_request_async(function_name: str, params: dict) -> dict | str:
+    """Async counterpart of _make_api_request built on aiohttp.
+    
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+    """
+    return await get_client().request_async(function_name, params)
+
 
 
 def _filter_csv_by_date_range(csv_data: str, start_date: str, end_date: str) -> str:
     """
     Filter CSV data to include only rows within the specified date range.
 
+    Rows must be sorted by the date in their first column, oldest or newest first
+    (Alpha Vantage returns newest first). Instead of parsing the whole table, the
+    range is located by binary search on the ISO date prefix of each line, and the
+    matching lines are returned as one slice of the original text.
+
     Args:
         csv_data: CSV string from Alpha Vantage API
         start_date: Start date in yyyy-mm-dd format
@@ -99,24 +328,46 @@ def _filter_csv_by_date_range(csv_data: str, start_date: str, end_date: str) ->
     if not csv_data or csv_data.strip() == "":
         return csv_data
 
-    try:
-        # Parse CSV data
-        df = pd.read_csv(StringIO(csv_data))
+    body_start = csv_data.find("\n") + 1
+    if body_start == 0 or body_start == len(csv_data):
+        return csv_data
+    last_start = max(body_start, csv_data.rfind("\n", body_start, len(csv_data.rstrip())) + 1)
+    first_day = csv_data[body_start:body_start + 10]
+    last_day = csv_data[last_start:last_start + 10]
+    if not (_ISO_DATE.match(first_day) and _ISO_DATE.match(last_day)):
+        # If filtering fails, return original data with a warning
+        print("Warning: Failed to filter CSV data by date range: unrecognized date column")
+        return csv_data
 
-        # Assume the first column is the date column (timestamp)
-        date_col = df.columns[0]
-        df[date_col] = pd.to_datetime(df[date_col])
+    start_day = str(start_date)[:10]
+    end_day = str(end_date)[:10]
+    end = len(csv_data)
+    if first_day <= last_day:
+        lo = _bisect_lines(csv_data, body_start, end, lambda day: day < start_day)
+        hi = _bisect_lines(csv_data, lo, end, lambda day: day <= end_day)
+    else:
+        lo = _bisect_lines(csv_data, body_start, end, lambda day: day > end_day)
+        hi = _bisect_lines(csv_data, lo, end, lambda day: day >= start_day)
 
-        # Filter by date range
-        start_dt = pd.to_datetime(start_date)
-        end_dt = pd.to_datetime(end_date)
+    return csv_data[:body_start] + csv_data[lo:hi]
 
-        filtered_df = df[(df[date_col] >= start_dt) & (df[date_col] <= end_dt)]
 
-        # Convert back to CSV string
-        return filtered_df.to_csv(index=False)
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}$")
 
-    except Exception as e:
-        # If filtering fails, return original data with a warning
-        print(f"Warning: Failed to filter CSV data by date range: {e}")
-        return csv_data
+
+def _bisect_lines(text: str, lo: int, hi: int, before) -> int:
+    """
+    Return the offset of the first line in text[lo:hi] whose date prefix is not before.
+
+    lo must be the start of a line, and before must hold for a prefix of the lines
+    and not for the rest. Lines are located by searching for newlines around the
+    midpoint, so no line offsets are materialized.
+    """
+    while lo < hi:
+        mid = max(lo, text.rfind("\n", lo, (lo + hi) // 2) + 1)
+        if before(text[mid:mid + 10]):
+            next_line = text.find("\n", mid, hi)
+            lo = hi if next_line == -1 else next_line + 1
+        else:
+            hi = mid
+    return lo
@@ -1,4 +1,6 @@
-from .alpha_vantage_common import _make_api_request
+import asyncio
+
+from .alpha_vantage_common import _make_api_request, _make_api_request_async
 
 
 def get_fundamentals(ticker: str, curr_date: str = None) -> str:
@@ -75,3 +77,53 @@ def get_income_statement(ticker: str, freq: str = "quarterly", curr_date: str =
 
     return _make_api_request("INCOME_STATEMENT", params)
 
+
+def get_financial_statements(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """
+    Retrieve the balance sheet, cash flow and income statement for a given ticker symbol using Alpha Vantage.
+
+    Args:
+        ticker (str): Ticker symbol of the company
+        freq (str): Reporting frequency: annual/quarterly (default quarterly) - not used for Alpha Vantage
+        curr_date (str): Current date you are trading at, yyyy-mm-dd (not used for Alpha Vantage)
+
+    Returns:
+        str: The three statement responses, separated by blank lines
+    """
+    return "\n\n".join(
+        [
+            get_balance_sheet(ticker, freq, curr_date),
+            get_cashflow(ticker, freq, curr_date),
+            get_income_statement(ticker, freq, curr_date),
+        ]
+    )
+
+
+async def get_fundamentals_async(ticker: str, curr_date: str = None) -> str:
+    """Async counterpart of get_fundamentals."""
+    return await _make_api_request_async("OVERVIEW", {"symbol": ticker})
+
+
+async def get_balance_sheet_async(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """Async counterpart of get_balance_sheet."""
+    return await _make_api_request_async("BALANCE_SHEET", {"symbol": ticker})
+
+
+async def get_cashflow_async(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """Async counterpart of get_cashflow."""
+    return await _make_api_request_async("CASH_FLOW", {"symbol": ticker})
+
+
+async def get_income_statement_async(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """Async counterpart of get_income_statement."""
+    return await _make_api_request_async("INCOME_STATEMENT", {"symbol": ticker})
+
+
+async def get_financial_statements_async(ticker: str, freq: str = "quarterly", curr_date: str = None) -> str:
+    """Async counterpart of get_financial_statements; the three requests run concurrently."""
+    statements = await asyncio.gather(
+        get_balance_sheet_async(ticker, freq, curr_date),
+        get_cashflow_async(ticker, freq, curr_date),
+        get_income_statement_async(ticker, freq, curr_date),
+    )
+    return "\n\n".join(statements)
@@ -1,8 +1,35 @@
-from .alpha_vantage_common import _make_api_request
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date
+from io import StringIO
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .alpha_vantage_common import _make_api_request, AlphaVantageRateLimitError
+from .alpha_vantage_stock import get_daily_adjusted_records
+from .indicators import IndicatorFrame
+from .date_index import to_days, window_bounds
+from .utils import split_indicator_names
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+# IndicatorFrame per symbol over its cached daily adjusted series (local indicator source)
+_local_frames = OrderedDict()
+_local_frames_lock = threading.Lock()
+_MAX_LOCAL_FRAMES = 64
+
+# Parsed indicator endpoint responses per (function, params, day) (remote indicator source)
+_responses = OrderedDict()
+_responses_lock = threading.Lock()
+_MAX_RESPONSES = 256
 
 def get_indicator(
     symbol: str,
-    indicator: str,
+    indicator: Union[str, List[str]],
     curr_date: str,
     look_back_days: int,
     interval: str = "daily",
@@ -12,9 +39,14 @@ def get_indicator(
     """
     Returns Alpha Vantage technical indicator values over a time window.
 
+    With alpha_vantage.indicator_source set to "local" (the default), indicators are
+    computed from one cached TIME_SERIES_DAILY_ADJUSTED download per symbol per day;
+    "remote" calls the Alpha Vantage indicator endpoint for each indicator instead.
+
     Args:
         symbol: ticker symbol of the company
-        indicator: technical indicator to get the analysis and report of
+        indicator: technical indicator(s) to get the analysis and report of; a list
+            or comma-separated names returns one section per indicator
         curr_date: The current trading date you are trading on, YYYY-mm-dd
         look_back_days: how many days to look back
         interval: Time interval (daily, weekly, monthly)
@@ -27,6 +59,12 @@ def get_indicator(
     from datetime import datetime
     from dateutil.relativedelta import relativedelta
 
+    if not isinstance(indicator, str) or "," in indicator:
+        return "\n\n".join(
+            get_indicator(symbol, name, curr_date, look_back_days, interval, time_period, series_type)
+            for name in split_indicator_names(indicator)
+        )
+
     supported_indicators = {
         "close_50_sma": ("50 SMA", "close"),
         "close_200_sma": ("200 SMA", "close"),
@@ -39,7 +77,8 @@ def get_indicator(
         "boll_ub": ("Bollinger Upper Band", "close"),
         "boll_lb": ("Bollinger Lower Band", "close"),
         "atr": ("ATR", None),
-        "vwma": ("VWMA", "close")
+        "vwma": ("VWMA", "close"),
+        "mfi": ("MFI", None)
     }
 
     indicator_descriptions = {
@@ -54,7 +93,8 @@ def get_indicator(
         "boll_ub": "Bollinger Upper Band: Typically 2 standard deviations above the middle line. Usage: Signals potential overbought conditions and breakout zones. Tips: Confirm signals with other tools; prices may ride the band in strong trends.",
         "boll_lb": "Bollinger Lower Band: Typically 2 standard deviations below the middle line. Usage: Indicates potential oversold conditions. Tips: Use additional analysis to avoid false reversal signals.",
         "atr": "ATR: Averages true range to measure volatility. Usage: Set stop-loss levels and adjust position sizes based on current market volatility. Tips: It's a reactive measure, so use it as part of a broader risk management strategy.",
-        "vwma": "VWMA: A moving average weighted by volume. Usage: Confirm trends by integrating price action with volume data. Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+        "vwma": "VWMA: A moving average weighted by volume. Usage: Confirm trends by integrating price action with volume data. Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses.",
+        "mfi": "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
     }
 
     if indicator not in supported_indicators:
@@ -65,6 +105,26 @@ def get_indicator(
     curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date_dt - relativedelta(days=look_back_days)
 
+    local_source = get_config().get("alpha_vantage", {}).get("indicator_source", "local") == "local"
+    if local_source:
+        try:
+            ind_string = _get_indicator_local(symbol, indicator, curr_date_dt, before)
+        except AlphaVantageRateLimitError:
+            # Let the router fall back to another vendor
+            raise
+        except Exception as e:
+            # Fall back to the indicator endpoint below
+            logger.warning(
+                "Error computing Alpha Vantage indicator data for %s, using the indicator endpoint: %s", indicator, e
+            )
+        else:
+            return (
+                f"## {indicator.upper()} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
+                + ind_string
+                + "\n\n"
+                + indicator_descriptions.get(indicator, "No description available.")
+            )
+
     # Get the full data for the period instead of making individual calls
     _, required_series_type = supported_indicators[indicator]
 
@@ -72,151 +132,156 @@ def get_indicator(
     if required_series_type:
         series_type = required_series_type
 
-    try:
-        # Get indicator data for the period
-        if indicator == "close_50_sma":
-            data = _make_api_request("SMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "50",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "close_200_sma":
-            data = _make_api_request("SMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "200",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "close_10_ema":
-            data = _make_api_request("EMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "10",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macd":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macds":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macdh":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "rsi":
-            data = _make_api_request("RSI", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": str(time_period),
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator in ["boll", "boll_ub", "boll_lb"]:
-            data = _make_api_request("BBANDS", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "20",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "atr":
-            data = _make_api_request("ATR", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": str(time_period),
-                "datatype": "csv"
-            })
-        elif indicator == "vwma":
-            # Alpha Vantage doesn't have direct VWMA, so we'll return an informative message
-            # In a real implementation, this would need to be calculated from OHLCV data
-            return f"## VWMA (Volume Weighted Moving Average) for {symbol}:\n\nVWMA calculation requires OHLCV data and is not directly available from Alpha Vantage API.\nThis indicator would need to be calculated from the raw stock data using volume-weighted price averaging.\n\n{indicator_descriptions.get('vwma', 'No description available.')}"
-        else:
-            return f"Error: Indicator {indicator} not implemented yet."
+    if indicator == "vwma":
+        if local_source:
+            # The local computation failed and there is no endpoint to fall back to
+            raise ValueError("VWMA is only available from the local indicator source")
+        # Alpha Vantage doesn't have direct VWMA; the local indicator source computes it
+        return f"## VWMA (Volume Weighted Moving Average) for {symbol}:\n\nVWMA calculation requires OHLCV data and is not directly available from Alpha Vantage API.\nThis indicator would need to be calculated from the raw stock data using volume-weighted price averaging.\n\n{indicator_descriptions.get('vwma', 'No description available.')}"
 
-        # Parse CSV data and extract values for the date range
-        lines = data.strip().split('\n')
-        if len(lines) < 2:
-            return f"Error: No data returned for {indicator}"
+    # MACD and BBANDS responses carry all three columns, so macd/macds/macdh and the
+    # Bollinger trio share one memoized request. Failures raise so the router can
+    # fall back to another vendor.
+    function_name, params = _remote_request(indicator, symbol, interval, time_period, series_type)
+    days, columns = _fetch_indicator_table(function_name, params)
 
-        # Parse header and data
-        header = [col.strip() for col in lines[0].split(',')]
-        try:
-            date_col_idx = header.index('time')
-        except ValueError:
-            return f"Error: 'time' column not found in data for {indicator}. Available columns: {header}"
-
-        # Map internal indicator names to expected CSV column names from Alpha Vantage
-        col_name_map = {
-            "macd": "MACD", "macds": "MACD_Signal", "macdh": "MACD_Hist",
-            "boll": "Real Middle Band", "boll_ub": "Real Upper Band", "boll_lb": "Real Lower Band",
-            "rsi": "RSI", "atr": "ATR", "close_10_ema": "EMA",
-            "close_50_sma": "SMA", "close_200_sma": "SMA"
-        }
-
-        target_col_name = col_name_map.get(indicator)
-
-        if not target_col_name:
-            # Default to the second column if no specific mapping exists
-            value_col_idx = 1
-        else:
-            try:
-                value_col_idx = header.index(target_col_name)
-            except ValueError:
-                return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}"
-
-        result_data = []
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            values = line.split(',')
-            if len(values) > value_col_idx:
-                try:
-                    date_str = values[date_col_idx].strip()
-                    # Parse the date
-                    date_dt = datetime.strptime(date_str, "%Y-%m-%d")
-
-                    # Check if date is in our range
-                    if before <= date_dt <= curr_date_dt:
-                        value = values[value_col_idx].strip()
-                        result_data.append((date_dt, value))
-                except (ValueError, IndexError):
-                    continue
-
-        # Sort by date and format output
-        result_data.sort(key=lambda x: x[0])
-
-        ind_string = ""
-        for date_dt, value in result_data:
-            ind_string += f"{date_dt.strftime('%Y-%m-%d')}: {value}\n"
-
-        if not ind_string:
-            ind_string = "No data available for the specified date range.\n"
-
-        result_str = (
-            f"## {indicator.upper()} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
-            + ind_string
-            + "\n\n"
-            + indicator_descriptions.get(indicator, "No description available.")
+    target_col_name = REMOTE_COLUMNS[indicator]
+    if target_col_name not in columns:
+        raise ValueError(
+            f"Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {list(columns)}"
         )
 
-        return result_str
+    values = columns[target_col_name]
+    lo, hi = window_bounds(days, before.date(), curr_date_dt.date())
+    ind_string = "".join(
+        f"{day}: {value}\n"
+        for day, value in zip(days[lo:hi].astype(str), values[lo:hi])
+        if not np.isnan(value)
+    )
+
+    if not ind_string:
+        ind_string = "No data available for the specified date range.\n"
+
+    result_str = (
+        f"## {indicator.upper()} values from {before.strftime('%Y-%m-%d')} to {curr_date}:\n\n"
+        + ind_string
+        + "\n\n"
+        + indicator_descriptions.get(indicator, "No description available.")
+    )
+
+    return result_str
+
+
+# Alpha Vantage endpoint and CSV column for each indicator served remotely
+REMOTE_COLUMNS = {
+    "macd": "MACD", "macds": "MACD_Signal", "macdh": "MACD_Hist",
+    "boll": "Real Middle Band", "boll_ub": "Real Upper Band", "boll_lb": "Real Lower Band",
+    "rsi": "RSI", "atr": "ATR", "mfi": "MFI", "close_10_ema": "EMA",
+    "close_50_sma": "SMA", "close_200_sma": "SMA"
+}
+
+
+def _remote_request(indicator: str, symbol: str, interval: str, time_period: int, series_type: str):
+    """Return the (function, params) Alpha Vantage request serving indicator."""
+    params = {"symbol": symbol, "interval": interval, "datatype": "csv"}
+    if indicator in ("close_50_sma", "close_200_sma", "close_10_ema"):
+        function_name = "EMA" if indicator == "close_10_ema" else "SMA"
+        params.update(time_period=indicator.split("_")[1], series_type=series_type)
+    elif indicator in ("macd", "macds", "macdh"):
+        function_name = "MACD"
+        params["series_type"] = series_type
+    elif indicator in ("boll", "boll_ub", "boll_lb"):
+        function_name = "BBANDS"
+        params.update(time_period="20", series_type=series_type)
+    elif indicator == "rsi":
+        function_name = "RSI"
+        params.update(time_period=str(time_period), series_type=series_type)
+    elif indicator in ("atr", "mfi"):
+        function_name = indicator.upper()
+        params["time_period"] = str(time_period)
+    else:
+        raise ValueError(f"Indicator {indicator} not implemented yet.")
+    return function_name, params
+
+
+def _fetch_indicator_table(function_name: str, params: dict):
+    """
+    Fetch and parse an indicator endpoint response, memoized per request and day.
+
+    Only tables with a "time" column and at least one row are memoized, so an error
+    payload or an empty response is not served for the rest of the day.
+
+    Returns:
+        (days, columns): ascending datetime64[D] array and a dict of float arrays per
+        CSV column (the "time" column holds the same days)
+
+    Raises:
+        ValueError: If the response is not a non-empty indicator table
+    """
+    key = (function_name, tuple(sorted(params.items())), date.today().isoformat())
+    with _responses_lock:
+        if key in _responses:
+            _responses.move_to_end(key)
+            return _responses[key]
+
+    response = _make_api_request(function_name, params)
+    table = _parse_indicator_csv(response)
+    days, columns = table
+    if len(days) == 0 or "time" not in columns:
+        # e.g. {"Error Message": ...} or {"Note": ...} instead of CSV rows
+        raise ValueError(f"Unexpected {function_name} response: {str(response)[:200]}")
+
+    with _responses_lock:
+        _responses[key] = table
+        while len(_responses) > _MAX_RESPONSES:
+            _responses.popitem(last=False)
+    return table
+
+
+def _parse_indicator_csv(data: str):
+    """Parse an Alpha Vantage indicator CSV in one pass into sorted typed arrays."""
+    frame = pd.read_csv(StringIO(data)) if data and data.strip() else pd.DataFrame()
+    frame.columns = [str(col).strip() for col in frame.columns]
+    if frame.empty:
+        return np.array([], dtype="datetime64[D]"), {}
+
+    date_col = "time" if "time" in frame.columns else frame.columns[0]
+    days = to_days(frame[date_col])
+    order = np.argsort(days, kind="stable")
+    columns = {
+        col: (days[order] if col == date_col else pd.to_numeric(frame[col], errors="coerce").to_numpy(dtype=float)[order])
+        for col in frame.columns
+    }
+    return days[order], columns
+
+
+def _get_indicator_local(symbol: str, indicator: str, curr_date_dt, before) -> str:
+    """Format one locally computed indicator over [before, curr_date_dt], oldest first."""
+    frame = _get_local_frame(symbol)
+    values = frame.get(indicator)
+    lo, hi = window_bounds(frame.dates, before.date(), curr_date_dt.date())
+
+    ind_string = "".join(
+        f"{day}: {'N/A' if np.isnan(value) else value}\n"
+        for day, value in zip(frame.dates[lo:hi].astype(str), values[lo:hi])
+    )
+    return ind_string or "No data available for the specified date range.\n"
+
+
+def _get_local_frame(symbol: str) -> IndicatorFrame:
+    """Return the IndicatorFrame over the symbol's cached daily adjusted series."""
+    records = get_daily_adjusted_records(symbol)
+    key = symbol.upper()
+    with _local_frames_lock:
+        cached = _local_frames.get(key)
+        if cached is not None and cached.records is records:
+            _local_frames.move_to_end(key)
+            return cached
 
-    except Exception as e:
-        print(f"Error getting Alpha Vantage indicator data for {indicator}: {e}")
-        return f"Error retrieving {indicator} data: {str(e)}"
+    frame = IndicatorFrame(records)
+    with _local_frames_lock:
+        _local_frames[key] = frame
+        _local_frames.move_to_end(key)
+        while len(_local_frames) > _MAX_LOCAL_FRAMES:
+            _local_frames.popitem(last=False)
+    return frame
@@ -1,5 +1,34 @@
-from datetime import datetime
-from .alpha_vantage_common import _make_api_request, _filter_csv_by_date_range
+import os
+import json
+import math
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from io import StringIO
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .price_store import records_from_frame
+from .singleflight import get_single_flight
+from .rate_limiter import background_priority
+from .alpha_vantage_common import (
+    AlphaVantageRateLimitError,
+    _make_api_request,
+    _make_api_request_async,
+    _filter_csv_by_date_range,
+)
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+# Full adjusted daily series per (symbol, day) used for local indicator computation
+_daily_series_cache = OrderedDict()
+_daily_series_lock = threading.Lock()
+_MAX_DAILY_SERIES = 64
 
 def get_stock(
     symbol: str,
@@ -10,6 +39,9 @@ def get_stock(
     Returns raw daily OHLCV values, adjusted close values, and historical split/dividend events
     filtered to the specified date range.
 
+    The series is served from the on-disk daily series cache (see DailySeriesCache),
+    so only the first call per symbol and day reaches the API.
+
     Args:
         symbol: The name of the equity. For example: symbol=IBM
         start_date: Start date in yyyy-mm-dd format
@@ -18,6 +50,65 @@ def get_stock(
     Returns:
         CSV string containing the daily adjusted time series data filtered to the date range.
     """
+    response = get_daily_adjusted_csv(symbol, start_date)
+
+    return _filter_csv_by_date_range(response, start_date, end_date)
+
+
+async def get_stock_async(
+    symbol: str,
+    start_date: str,
+    end_date: str
+) -> str:
+    """Async counterpart of get_stock."""
+    response = await get_daily_adjusted_csv_async(symbol, start_date)
+
+    return _filter_csv_by_date_range(response, start_date, end_date)
+
+
+def get_stock_batch(
+    symbols: list,
+    start_date: str,
+    end_date: str
+) -> dict:
+    """
+    Fetch daily adjusted series for several symbols through a paced request queue.
+
+    Alpha Vantage has no multi-symbol endpoint, so requests are issued one at a time in
+    the rate limiter's background lane, which paces them to the configured quotas and
+    lets interactive calls go first. The queue stops at the first rate-limit error so
+    the remaining symbols can fall back to another vendor.
+
+    Returns:
+        Dict mapping each symbol that returned data to a date-indexed DataFrame
+    """
+    frames = {}
+    for symbol in symbols:
+        try:
+            with background_priority():
+                csv_data = get_stock(symbol, start_date, end_date)
+            if not _is_series_csv(csv_data):
+                # Error payloads (e.g. an invalid symbol) come back as JSON text
+                raise ValueError(csv_data.strip()[:200])
+            frame = pd.read_csv(StringIO(csv_data))
+            if frame.empty:
+                continue
+            date_col = frame.columns[0]
+            frame[date_col] = pd.to_datetime(frame[date_col])
+        except AlphaVantageRateLimitError as e:
+            logger.warning("Alpha Vantage rate limit reached after %d of %d symbols: %s", len(frames), len(symbols), e)
+            break
+        except Exception as e:
+            logger.warning("Alpha Vantage daily series for %s failed: %s", symbol, e)
+            continue
+
+        frames[symbol] = frame.set_index(date_col).sort_index()
+
+    return frames
+
+
+def _outputsize_for(start_date: str) -> str:
+    """Pick the TIME_SERIES_DAILY_ADJUSTED outputsize for a range starting at start_date."""
     # Parse dates to determine the range
     start_dt = datetime.strptime(start_date, "%Y-%m-%d")
     today = datetime.now()
@@ -25,14 +116,273 @@ def get_stock(
     # Choose outputsize based on whether the requested range is within the latest 100 days
     # Compact returns latest 100 data points, so check if start_date is recent enough
     days_from_today_to_start = (today - start_dt).days
-    outputsize = "compact" if days_from_today_to_start < 100 else "full"
+    return "compact" if days_from_today_to_start < 100 else "full"
 
-    params = {
+
+def _daily_adjusted_params(symbol: str, outputsize: str) -> dict:
+    return {
         "symbol": symbol,
         "outputsize": outputsize,
         "datatype": "csv",
     }
 
-    response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", params)
 
-    return _filter_csv_by_date_range(response, start_date, end_date)
\ No newline at end of file
+class DailySeriesCache:
+    """
+    Persistent per-symbol cache of raw TIME_SERIES_DAILY_ADJUSTED CSV responses.
+
+    Each symbol is stored as {SYMBOL}.csv (the API's newest-first rows) plus a small
+    {SYMBOL}.json recording the day it was fetched, whether it holds the full history,
+    and the oldest date it covers. Within a day every date range is sliced from the
+    cached text; on later days a compact download (latest 100 bars) is merged onto
+    the cached history instead of replacing it, and the full series is only fetched
+    again if the overlapping adjusted closes disagree, which means the history was
+    re-adjusted for a split or dividend.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+
+    def _paths(self, symbol: str):
+        base = os.path.join(self.root_dir, symbol.upper())
+        return f"{base}.csv", f"{base}.json"
+
+    def read(self, symbol: str):
+        """Return (csv_text, meta) for symbol, or (None, None) if it is not cached."""
+        data_path, meta_path = self._paths(symbol)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(data_path) as f:
+                text = f.read()
+        except (OSError, ValueError):
+            return None, None
+        return text, meta
+
+    def write(self, symbol: str, text: str, full: bool) -> None:
+        """Atomically replace the cached series for symbol."""
+        rows = text.splitlines()
+        meta = {
+            "fetched": date.today().isoformat(),
+            "full": full,
+            "oldest": rows[-1][:10] if len(rows) > 1 else None,
+        }
+        os.makedirs(self.root_dir, exist_ok=True)
+        data_path, meta_path = self._paths(symbol)
+        self._replace(data_path, text)
+        # Metadata goes last: a crash in between only makes the next read refetch
+        self._replace(meta_path, json.dumps(meta))
+
+    def _replace(self, path: str, content: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def plan(self, symbol: str, start_date: Optional[str]):
+        """
+        Decide how to serve a series starting at start_date (None for the full history).
+
+        Returns:
+            (cached_text, outputsize): outputsize is None when cached_text can be served
+            as is, otherwise the download to make ("compact" to top up cached_text)
+        """
+        text, meta = self.read(symbol)
+        wanted = "full" if start_date is None else _outputsize_for(start_date)
+        if text is None:
+            return None, wanted
+
+        covers = meta["full"] or (
+            start_date is not None and meta["oldest"] is not None and meta["oldest"] <= start_date
+        )
+        if not covers:
+            return None, "full"
+        if meta["fetched"] == date.today().isoformat():
+            return text, None
+
+        rows = text.splitlines()
+        newest = rows[1][:10] if len(rows) > 1 else None
+        if newest is None or _outputsize_for(newest) == "full":
+            # Too far behind for the latest 100 bars to close the gap
+            return None, "full"
+        return text, "compact"
+
+    def store(self, symbol: str, cached_text: Optional[str], response: str, outputsize: str) -> Optional[str]:
+        """
+        Merge a downloaded response into the cache and return the resulting series.
+
+        Returns:
+            The series to serve, or None if a compact top-up revealed a re-adjusted
+            history and the full series has to be downloaded instead
+        """
+        if not _is_series_csv(response):
+            # Error payloads are passed through to the caller but never cached
+            return response
+        if cached_text is None or outputsize == "full":
+            self.write(symbol, response, full=outputsize == "full")
+            return response
+
+        merged = _merge_series(cached_text, response)
+        if merged is None:
+            logger.info("Alpha Vantage series cache: %s history was re-adjusted, refetching", symbol)
+            return None
+        _, meta = self.read(symbol)
+        self.write(symbol, merged, full=bool(meta and meta["full"]))
+        return merged
+
+
+def _is_series_csv(text: str) -> bool:
+    return isinstance(text, str) and text.startswith("timestamp,")
+
+
+def _merge_series(cached_text: str, response: str) -> Optional[str]:
+    """
+    Put the rows of a compact response on top of the cached rows older than it.
+
+    Returns None if a shared date, other than the newest cached one (which may have
+    been a partial session), has a different adjusted close.
+    """
+    cached_rows = cached_text.splitlines()
+    new_rows = response.splitlines()
+    header, new_rows = new_rows[0], new_rows[1:]
+    if not new_rows:
+        return cached_text
+    oldest_new = new_rows[-1][:10]
+
+    column = header.split(",").index("adjusted_close") if "adjusted_close" in header else None
+    fetched = {row[:10]: row.split(",") for row in new_rows}
+    older = []
+    for i, row in enumerate(cached_rows[1:]):
+        day = row[:10]
+        if day < oldest_new:
+            older.append(row)
+        elif i > 0 and column is not None and day in fetched:
+            stored = row.split(",")
+            if not math.isclose(float(stored[column]), float(fetched[day][column]), rel_tol=1e-6):
+                return None
+
+    return "\n".join([header] + new_rows + older) + "\n"
+
+
+_series_cache: Optional[DailySeriesCache] = None
+
+
+def get_series_cache() -> DailySeriesCache:
+    """Return the daily series cache under data_cache_dir/alpha_vantage/daily_adjusted."""
+    global _series_cache
+    root_dir = os.path.join(get_config()["data_cache_dir"], "alpha_vantage", "daily_adjusted")
+    if _series_cache is None or _series_cache.root_dir != root_dir:
+        _series_cache = DailySeriesCache(root_dir)
+    return _series_cache
+
+
+def get_daily_adjusted_csv(symbol: str, start_date: Optional[str] = None) -> str:
+    """
+    Return the raw TIME_SERIES_DAILY_ADJUSTED CSV for symbol covering start_date onwards.
+
+    Args:
+        symbol: Ticker symbol
+        start_date: Oldest date needed, or None for the full history
+
+    Returns:
+        Newest-first CSV text, possibly reaching further back than start_date
+    """
+    symbol = symbol.upper()
+    cache = get_series_cache()
+
+    def fetch():
+        cached_text, outputsize = cache.plan(symbol, start_date)
+        if outputsize is None:
+            return cached_text
+        response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", _daily_adjusted_params(symbol, outputsize))
+        series = cache.store(symbol, cached_text, response, outputsize)
+        if series is None:
+            response = _make_api_request("TIME_SERIES_DAILY_ADJUSTED", _daily_adjusted_params(symbol, "full"))
+            series = cache.store(symbol, None, response, "full")
+        return series
+
+    if not get_config().get("alpha_vantage", {}).get("cache_daily_series", True):
+        outputsize = "full" if start_date is None else _outputsize_for(start_date)
+        return _make_api_request("TIME_SERIES_DAILY_ADJUSTED", _daily_adjusted_params(symbol, outputsize))
+    return get_single_flight().do(f"alpha_vantage_series:{symbol}:{start_date}", fetch)
+
+
+async def get_daily_adjusted_csv_async(symbol: str, start_date: Optional[str] = None) -> str:
+    """Async counterpart of get_daily_adjusted_csv."""
+    symbol = symbol.upper()
+    cache = get_series_cache()
+
+    if not get_config().get("alpha_vantage", {}).get("cache_daily_series", True):
+        outputsize = "full" if start_date is None else _outputsize_for(start_date)
+        return await _make_api_request_async("TIME_SERIES_DAILY_ADJUSTED", _daily_adjusted_params(symbol, outputsize))
+
+    async def fetch():
+        cached_text, outputsize = cache.plan(symbol, start_date)
+        if outputsize is None:
+            return cached_text
+        response = await _make_api_request_async("TIME_SERIES_DAILY_ADJUSTED", _daily_adjusted_params(symbol, outputsize))
+        series = cache.store(symbol, cached_text, response, outputsize)
+        if series is None:
+            response = await _make_api_request_async("TIME_SERIES_DAILY_ADJUSTED", _daily_adjusted_params(symbol, "full"))
+            series = cache.store(symbol, None, response, "full")
+        return series
+
+    return await get_single_flight().do_async(f"alpha_vantage_series:{symbol}:{start_date}", fetch)
+
+
+def get_daily_adjusted_records(symbol: str) -> np.ndarray:
+    """
+    Return the full split/dividend-adjusted daily history of symbol as a price array.
+
+    TIME_SERIES_DAILY_ADJUSTED is downloaded at most once per symbol per day, so
+    every indicator computed locally for a ticker shares a single request.
+
+    Returns:
+        Date-sorted structured array with the price_store.PRICE_DTYPE fields
+    """
+    key = (symbol.upper(), date.today().isoformat())
+    with _daily_series_lock:
+        if key in _daily_series_cache:
+            _daily_series_cache.move_to_end(key)
+            return _daily_series_cache[key]
+
+    records = get_single_flight().do(
+        f"alpha_vantage_daily:{key[0]}:{key[1]}",
+        lambda: _download_daily_adjusted(symbol),
+    )
+    with _daily_series_lock:
+        _daily_series_cache[key] = records
+        while len(_daily_series_cache) > _MAX_DAILY_SERIES:
+            _daily_series_cache.popitem(last=False)
+    return records
+
+
+def _download_daily_adjusted(symbol: str) -> np.ndarray:
+    """Load the full daily adjusted series and adjust OHLC like yfinance's auto_adjust."""
+    response = get_daily_adjusted_csv(symbol)
+    frame = pd.read_csv(StringIO(response))
+    if "timestamp" not in frame.columns or "adjusted_close" not in frame.columns:
+        raise ValueError(f"Unexpected TIME_SERIES_DAILY_ADJUSTED response for {symbol}: {response[:200]}")
+
+    factor = frame["adjusted_close"] / frame["close"]
+    adjusted = pd.DataFrame(
+        {
+            "Open": frame["open"] * factor,
+            "High": frame["high"] * factor,
+            "Low": frame["low"] * factor,
+            "Close": frame["adjusted_close"],
+            "Volume": frame["volume"],
+            "Dividends": frame["dividend_amount"],
+            # Alpha Vantage reports 1.0 on days without a split, yfinance reports 0
+            "Stock Splits": frame["split_coefficient"].where(frame["split_coefficient"] != 1.0, 0.0),
+        }
+    )
+    adjusted.index = pd.to_datetime(frame["timestamp"])
+    return records_from_frame(adjusted)
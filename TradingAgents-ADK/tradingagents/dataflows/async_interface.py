@@ -0,0 +1,193 @@
+import time
+import asyncio
+import logging
+
+from .interface import (
+    VENDOR_METHODS,
+    get_category_for_method,
+    get_vendor,
+    _lookup_cached,
+    _route_plan,
+    _record_success,
+    _record_failure,
+    _admit,
+    _single_flight_enabled,
+)
+from .vendor_health import get_vendor_health
+from .result_cache import MISS, get_ttl, is_cacheable, make_cache_key
+from .singleflight import get_single_flight
+from .hedging import hedge_delay
+
+# Sync implementations with a native async counterpart
+from .alpha_vantage import (
+    get_stock as get_alpha_vantage_stock,
+    get_stock_async as get_alpha_vantage_stock_async,
+    get_fundamentals as get_alpha_vantage_fundamentals,
+    get_fundamentals_async as get_alpha_vantage_fundamentals_async,
+    get_balance_sheet as get_alpha_vantage_balance_sheet,
+    get_balance_sheet_async as get_alpha_vantage_balance_sheet_async,
+    get_cashflow as get_alpha_vantage_cashflow,
+    get_cashflow_async as get_alpha_vantage_cashflow_async,
+    get_income_statement as get_alpha_vantage_income_statement,
+    get_income_statement_async as get_alpha_vantage_income_statement_async,
+    get_financial_statements as get_alpha_vantage_financial_statements,
+    get_financial_statements_async as get_alpha_vantage_financial_statements_async,
+    get_insider_transactions as get_alpha_vantage_insider_transactions,
+    get_insider_transactions_async as get_alpha_vantage_insider_transactions_async,
+    get_news as get_alpha_vantage_news,
+    get_news_async as get_alpha_vantage_news_async,
+)
+from .google import get_google_news, get_google_news_async
+from .openai import (
+    get_stock_news_openai,
+    get_stock_news_openai_async,
+    get_global_news_openai,
+    get_global_news_openai_async,
+    get_fundamentals_openai,
+    get_fundamentals_openai_async,
+)
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+# Mapping of sync vendor implementations to their native async counterparts.
+# Implementations missing here run in a worker thread via asyncio.to_thread.
+ASYNC_IMPLEMENTATIONS = {
+    get_alpha_vantage_stock: get_alpha_vantage_stock_async,
+    get_alpha_vantage_fundamentals: get_alpha_vantage_fundamentals_async,
+    get_alpha_vantage_balance_sheet: get_alpha_vantage_balance_sheet_async,
+    get_alpha_vantage_cashflow: get_alpha_vantage_cashflow_async,
+    get_alpha_vantage_income_statement: get_alpha_vantage_income_statement_async,
+    get_alpha_vantage_financial_statements: get_alpha_vantage_financial_statements_async,
+    get_alpha_vantage_insider_transactions: get_alpha_vantage_insider_transactions_async,
+    get_alpha_vantage_news: get_alpha_vantage_news_async,
+    get_google_news: get_google_news_async,
+    get_stock_news_openai: get_stock_news_openai_async,
+    get_global_news_openai: get_global_news_openai_async,
+    get_fundamentals_openai: get_fundamentals_openai_async,
+}
+
+
+async def _call_vendor_impl_async(method: str, impl_func, vendor: str, args: tuple, kwargs: dict):
+    """Await a single vendor implementation, returning (succeeded, result)."""
+    if not _admit(method, vendor):
+        return False, None
+    logger.debug("Calling %s from vendor '%s'", impl_func.__name__, vendor)
+    started = time.perf_counter()
+    try:
+        async_impl = ASYNC_IMPLEMENTATIONS.get(impl_func)
+        if async_impl is not None:
+            result = await async_impl(*args, **kwargs)
+        else:
+            result = await asyncio.to_thread(impl_func, *args, **kwargs)
+    except Exception as e:
+        _record_failure(method, impl_func.__name__, vendor, args, kwargs, time.perf_counter() - started, e)
+        return False, None
+    except BaseException:
+        # Cancelled (e.g. the losing side of a hedge); frees a half-open probe
+        get_vendor_health().release(vendor, method)
+        raise
+
+    _record_success(method, impl_func.__name__, vendor, args, kwargs, time.perf_counter() - started, result)
+    return True, result
+
+
+async def _run_concurrently_async(method: str, calls: list, args: tuple, kwargs: dict, deadline) -> dict:
+    """Async counterpart of interface._run_concurrently."""
+    logger.debug("%s - Running %d primary implementation(s) concurrently", method, len(calls))
+    tasks = [
+        asyncio.ensure_future(_call_vendor_impl_async(method, impl_func, vendor, args, kwargs))
+        for vendor, impl_func in calls
+    ]
+    await asyncio.wait(tasks, timeout=deadline)
+
+    results_by_vendor = {vendor: [] for vendor, _ in calls}
+    for (vendor, impl_func), task in zip(calls, tasks):
+        if not task.done():
+            task.cancel()
+            logger.warning("%s from vendor '%s' exceeded the %ss deadline", impl_func.__name__, vendor, deadline)
+            continue
+        succeeded, result = task.result()
+        if succeeded:
+            results_by_vendor[vendor].append(result)
+    return results_by_vendor
+
+
+async def _run_hedged_async(method: str, primary: tuple, hedge: tuple, args: tuple, kwargs: dict) -> dict:
+    """Async counterpart of interface._run_hedged; the losing task is cancelled."""
+    primary_vendor, primary_impl = primary
+    hedge_vendor, hedge_impl = hedge
+
+    primary_task = asyncio.ensure_future(_call_vendor_impl_async(method, primary_impl, primary_vendor, args, kwargs))
+    delay = hedge_delay(primary_vendor, method)
+    done, _ = await asyncio.wait([primary_task], timeout=delay)
+    if done:
+        succeeded, result = primary_task.result()
+        return {primary_vendor: [result] if succeeded else []}
+
+    logger.info("%s - '%s' slower than %.2fs, hedging with '%s'", method, primary_vendor, delay, hedge_vendor)
+    hedge_task = asyncio.ensure_future(_call_vendor_impl_async(method, hedge_impl, hedge_vendor, args, kwargs))
+    vendors_by_task = {primary_task: primary_vendor, hedge_task: hedge_vendor}
+    results_by_vendor = {primary_vendor: [], hedge_vendor: []}
+
+    pending = set(vendors_by_task)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            succeeded, result = task.result()
+            if succeeded:
+                winner = vendors_by_task[task]
+                logger.info("%s - hedge won by '%s'", method, winner)
+                results_by_vendor[winner] = [result]
+                for loser in pending:
+                    loser.cancel()
+                return results_by_vendor
+    return results_by_vendor
+
+
+async def route_to_vendor_async(method: str, *args, **kwargs):
+    """
+    Async counterpart of route_to_vendor with the same caching, circuit breaker,
+    fan-out, hedging and fallback semantics.
+    """
+    category = get_category_for_method(method)
+    vendor_config = get_vendor(category, method)
+
+    # Handle comma-separated vendors
+    primary_vendors = [v.strip() for v in vendor_config.split(',')]
+
+    if method not in VENDOR_METHODS:
+        raise ValueError(f"Method '{method}' not supported")
+
+    cache, cache_key, cached = _lookup_cached(method, vendor_config, args, kwargs)
+    if cached is not MISS:
+        return cached
+
+    async def fetch():
+        final_result = await _route_uncached_async(method, primary_vendors, args, kwargs)
+        if cache is not None and is_cacheable(final_result):
+            cache.set(cache_key, final_result, get_ttl(category))
+        return final_result
+
+    # Identical calls already in flight on this event loop share one vendor fetch
+    if not _single_flight_enabled():
+        return await fetch()
+    flight_key = cache_key or make_cache_key(method, vendor_config, args, kwargs)
+    return await get_single_flight().do_async(flight_key, fetch)
+
+
+async def _route_uncached_async(method: str, primary_vendors: list, args: tuple, kwargs: dict):
+    """Async driver of interface._route_plan, the same chain as interface._route_uncached."""
+    plan = _route_plan(method, primary_vendors)
+    outcome = None
+    while True:
+        try:
+            step = plan.send(outcome)
+        except StopIteration as finished:
+            return finished.value
+        kind = step[0]
+        if kind == "fan_out":
+            outcome = await _run_concurrently_async(method, step[1], args, kwargs, step[2])
+        elif kind == "hedge":
+            outcome = await _run_hedged_async(method, step[1], step[2], args, kwargs)
+        else:
+            outcome = await _call_vendor_impl_async(method, step[2], step[1], args, kwargs)
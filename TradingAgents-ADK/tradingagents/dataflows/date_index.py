@@ -0,0 +1,82 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def to_days(values) -> np.ndarray:
+    """
+    Convert dates to a datetime64[D] array (int64 day ordinals underneath).
+
+    Accepts a scalar, a sequence, a Series, or a DatetimeIndex. Strings only need to
+    start with YYYY-mm-dd, so timestamps such as "2024-01-02 00:00:00-05:00" keep
+    their calendar day instead of being shifted by a timezone conversion.
+    """
+    if np.ndim(values) == 0:
+        return np.datetime64(str(values)[:10], "D")
+
+    if isinstance(values, pd.DatetimeIndex):
+        index = values
+    elif isinstance(values, pd.Series) and pd.api.types.is_datetime64_any_dtype(values):
+        index = pd.DatetimeIndex(values)
+    else:
+        array = np.asarray(values)
+        if np.issubdtype(array.dtype, np.datetime64):
+            return array.astype("datetime64[D]")
+        return pd.Series(array).astype(str).str[:10].to_numpy().astype("datetime64[D]")
+
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy().astype("datetime64[D]")
+
+
+def window_bounds(
+    days: np.ndarray,
+    start,
+    end,
+    inclusive_end: bool = True,
+) -> Tuple[int, int]:
+    """
+    Binary-search the positions [lo, hi) of a sorted day array that fall in the window.
+
+    Args:
+        days: Ascending datetime64[D] array (see to_days)
+        start: First date of the window (inclusive)
+        end: Last date of the window; inclusive unless inclusive_end is False
+
+    Returns:
+        (lo, hi) such that days[lo:hi] is the window
+    """
+    lo = int(np.searchsorted(days, to_days(start), side="left"))
+    hi = int(np.searchsorted(days, to_days(end), side="right" if inclusive_end else "left"))
+    return lo, max(lo, hi)
+
+
+def find_day(days: np.ndarray, day) -> Optional[int]:
+    """Return the position of day in a sorted day array, or None if it is absent."""
+    day = to_days(day)
+    pos = int(np.searchsorted(days, day, side="left"))
+    if pos < len(days) and days[pos] == day:
+        return pos
+    return None
+
+
+def slice_by_date(
+    frame: pd.DataFrame,
+    start,
+    end,
+    date_column: Optional[str] = None,
+    inclusive_end: bool = True,
+) -> pd.DataFrame:
+    """
+    Slice a date-sorted frame to [start, end] with binary search instead of a row scan.
+
+    Dates come from date_column when given, otherwise from the frame's index. Rows
+    keep their original index labels.
+    """
+    days = to_days(frame[date_column] if date_column else frame.index)
+    if len(days) > 1 and not (days[1:] >= days[:-1]).all():
+        order = np.argsort(days, kind="stable")
+        frame, days = frame.iloc[order], days[order]
+    lo, hi = window_bounds(days, start, end, inclusive_end)
+    return frame.iloc[lo:hi]
@@ -0,0 +1,141 @@
+import os
+import json
+import sqlite3
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .config import get_config
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+
+def _file_version(path: str) -> str:
+    # Raises FileNotFoundError for a missing data file, like open() did
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class FinnhubIndex:
+    """
+    Date-sorted view of one {ticker}_data_formatted.json file.
+
+    Dates are kept in a sorted list for binary search; entries stay as JSON text
+    and are only decoded for the dates a query returns, so a range lookup costs
+    O(log n + k).
+    """
+
+    def __init__(self, version: str, rows: list):
+        # rows are (date, position in the source file, payload) sorted by date
+        self.version = version
+        self.dates = [row[0] for row in rows]
+        self.positions = [row[1] for row in rows]
+        self.payloads = [row[2] for row in rows]
+
+    def range(self, start_date: str, end_date: str) -> dict:
+        """Return {date: entries} for start_date <= date <= end_date, in source file order."""
+        lo = bisect_left(self.dates, start_date)
+        hi = bisect_right(self.dates, end_date)
+        matches = sorted(range(lo, hi), key=self.positions.__getitem__)
+        return {self.dates[i]: json.loads(self.payloads[i]) for i in matches}
+
+
+class FinnhubStore:
+    """
+    SQLite copy of the processed Finnhub JSON files of one data type.
+
+    Each {ticker}_data_formatted.json is converted once into rows of
+    (source, date, position, payload), indexed by (source, date), and re-converted
+    when the file's mtime or size changes. Loaded tickers are kept in a bounded
+    LRU of FinnhubIndex objects (finnhub.max_cached_tickers), so repeat lookups
+    neither re-parse the JSON file nor touch the database.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._indexes = OrderedDict()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS sources (source TEXT PRIMARY KEY, version TEXT)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(source TEXT, date TEXT, position INTEGER, payload TEXT, PRIMARY KEY (source, date))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _convert(self, conn: sqlite3.Connection, data_path: str, version: str) -> None:
+        logger.info("Finnhub store: indexing %s", data_path)
+        with open(data_path, "r") as f:
+            data = json.load(f)
+
+        # Dates without entries never match a query, so they are not stored
+        rows = [
+            (data_path, key, position, json.dumps(value))
+            for position, (key, value) in enumerate(data.items())
+            if len(value) > 0
+        ]
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DELETE FROM entries WHERE source = ?", (data_path,))
+            conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?)", rows)
+            conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?)", (data_path, version))
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def index(self, data_path: str) -> FinnhubIndex:
+        """Return the date index of one data file, converting or loading it as needed."""
+        version = _file_version(data_path)
+        with self._lock:
+            index = self._indexes.get(data_path)
+            if index is not None and index.version == version:
+                self._indexes.move_to_end(data_path)
+                return index
+
+            conn = self._connection()
+            stored = conn.execute("SELECT version FROM sources WHERE source = ?", (data_path,)).fetchone()
+            if stored is None or stored[0] != version:
+                self._convert(conn, data_path, version)
+            rows = conn.execute(
+                "SELECT date, position, payload FROM entries WHERE source = ? ORDER BY date",
+                (data_path,),
+            ).fetchall()
+
+            index = FinnhubIndex(version, rows)
+            self._indexes[data_path] = index
+            max_tickers = get_config().get("finnhub", {}).get("max_cached_tickers", 64)
+            while len(self._indexes) > max_tickers:
+                self._indexes.popitem(last=False)
+            return index
+
+    def close(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_stores: Dict[str, FinnhubStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_finnhub_store(data_type: str) -> FinnhubStore:
+    """Return the process-wide store for a Finnhub data type under data_cache_dir/finnhub."""
+    db_path = os.path.join(get_config()["data_cache_dir"], "finnhub", f"{data_type}.sqlite")
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            store = FinnhubStore(db_path)
+            _stores[db_path] = store
+        return store
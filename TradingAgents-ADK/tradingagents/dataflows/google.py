@@ -1,7 +1,7 @@
 from typing import Annotated
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from .googlenews_utils import getNewsData
+from .googlenews_utils import getNewsData, getNewsDataAsync
 
 
 def get_google_news(
@@ -9,14 +9,36 @@ def get_google_news(
     curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
+    query, before = _prepare_query(query, curr_date, look_back_days)
+
+    news_results = getNewsData(query, before, curr_date)
+
+    return _format_google_news(query, before, curr_date, news_results)
+
+
+async def get_google_news_async(
+    query: Annotated[str, "Query to search with"],
+    curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    """Async counterpart of get_google_news."""
+    query, before = _prepare_query(query, curr_date, look_back_days)
+
+    news_results = await getNewsDataAsync(query, before, curr_date)
+
+    return _format_google_news(query, before, curr_date, news_results)
+
+
+def _prepare_query(query, curr_date, look_back_days):
     query = query.replace(" ", "+")
 
     start_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
+    return query, before
 
-    news_results = getNewsData(query, before, curr_date)
 
+def _format_google_news(query, before, curr_date, news_results) -> str:
     news_str = ""
 
     for news in news_results:
@@ -27,4 +49,4 @@ def get_google_news(
     if len(news_results) == 0:
         return ""
 
-    return f"## {query} Google News, from {before} to {curr_date}:\n\n{news_str}"
\ No newline at end of file
+    return f"## {query} Google News, from {before} to {curr_date}:\n\n{news_str}"
@@ -4,6 +4,7 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 import time
 import random
+import asyncio
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -31,72 +32,112 @@ def make_request(url, headers):
     return response
 
 
-def getNewsData(query, start_date, end_date):
-    """
-    Scrape Google News search results for a given query and date range.
-    query: str - search query
-    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
-    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
-    """
+@retry(
+    retry=(retry_if_result(is_rate_limited)),
+    wait=wait_exponential(multiplier=1, min=4, max=60),
+    stop=stop_after_attempt(5),
+)
+async def make_request_async(session, url, headers):
+    """Async counterpart of make_request; returns an object with status_code and content"""
+    # Random delay before each request to avoid detection
+    await asyncio.sleep(random.uniform(2, 6))
+    async with session.get(url, headers=headers) as response:
+        content = await response.read()
+        return _FetchedPage(response.status, content)
+
+
+class _FetchedPage:
+    """Minimal response holder so async pages go through the same rate-limit check"""
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
+
+
+def _normalize_dates(start_date, end_date):
+    """Convert yyyy-mm-dd dates to the mm/dd/yyyy format Google expects"""
     if "-" in start_date:
         start_date = datetime.strptime(start_date, "%Y-%m-%d")
         start_date = start_date.strftime("%m/%d/%Y")
     if "-" in end_date:
         end_date = datetime.strptime(end_date, "%Y-%m-%d")
         end_date = end_date.strftime("%m/%d/%Y")
+    return start_date, end_date
+
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/101.0.4951.54 Safari/537.36"
-        )
-    }
+def _search_url(query, start_date, end_date, page):
+    offset = page * 10
+    return (
+        f"https://www.google.com/search?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+
+
+def _parse_results_page(content):
+    """
+    Parse one page of Google News results.
+
+    Returns:
+        (news_results, has_next): results found on the page, and whether a next page exists.
+        news_results is empty when the page has no more results.
+    """
+    soup = BeautifulSoup(content, "html.parser")
+    results_on_page = soup.select("div.SoaBEf")
+
+    news_results = []
+    for el in results_on_page:
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            news_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    # Check for the "Next" link (pagination)
+    has_next = bool(results_on_page) and soup.find("a", id="pnnext") is not None
+    return news_results, has_next
+
+
+def getNewsData(query, start_date, end_date):
+    """
+    Scrape Google News search results for a given query and date range.
+    query: str - search query
+    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
+    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    """
+    start_date, end_date = _normalize_dates(start_date, end_date)
 
     news_results = []
     page = 0
     while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
-
         try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
+            response = make_request(_search_url(query, start_date, end_date, page), HEADERS)
+            page_results, has_next = _parse_results_page(response.content)
+            news_results.extend(page_results)
+            if not has_next:
                 break
 
             page += 1
@@ -106,3 +147,32 @@ def getNewsData(query, start_date, end_date):
             break
 
     return news_results
+
+
+async def getNewsDataAsync(query, start_date, end_date):
+    """
+    Async counterpart of getNewsData.
+    query: str - search query
+    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
+    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    """
+    import aiohttp
+
+    start_date, end_date = _normalize_dates(start_date, end_date)
+
+    news_results = []
+    page = 0
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                response = await make_request_async(session, _search_url(query, start_date, end_date, page), HEADERS)
+                page_results, has_next = _parse_results_page(response.content)
+                news_results.extend(page_results)
+                if not has_next:
+                    break
+                page += 1
+            except Exception as e:
+                print(f"Failed after multiple retries: {e}")
+                break
+
+    return news_results
@@ -0,0 +1,77 @@
+import math
+import threading
+from collections import defaultdict, deque
+from typing import Optional
+
+from .config import get_config
+
+
+def percentile(values, pct: float) -> Optional[float]:
+    """Nearest-rank pct-th percentile of values, or None when there are none."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class LatencyTracker:
+    """
+    Rolling window of successful call latencies per (vendor, method).
+    """
+
+    def __init__(self, window: int = 100):
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._lock = threading.Lock()
+
+    def record(self, vendor: str, method: str, latency: float) -> None:
+        """Record the latency (seconds) of a successful call."""
+        with self._lock:
+            self._samples[(vendor, method)].append(latency)
+
+    def percentile(self, vendor: str, method: str, pct: float) -> Optional[float]:
+        """Return the pct-th percentile latency, or None when no samples exist."""
+        with self._lock:
+            samples = list(self._samples.get((vendor, method), ()))
+        return percentile(samples, pct)
+
+    def sample_count(self, vendor: str, method: str) -> int:
+        """Return how many samples are held for (vendor, method)."""
+        with self._lock:
+            return len(self._samples.get((vendor, method), ()))
+
+
+_latency_tracker = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Return the process-wide latency tracker."""
+    return _latency_tracker
+
+
+def should_hedge(method: str) -> bool:
+    """Return True when hedged requests are enabled for method."""
+    hedging_config = get_config().get("hedging", {})
+    if not hedging_config.get("enabled", False):
+        return False
+    methods = hedging_config.get("methods")
+    return methods is None or method in methods
+
+
+def hedge_delay(vendor: str, method: str) -> float:
+    """
+    Return how long to wait on the primary vendor before starting a hedge.
+
+    Uses the configured latency percentile of past successful calls once enough
+    samples exist, otherwise the configured default delay.
+    """
+    hedging_config = get_config().get("hedging", {})
+    delay = hedging_config.get("default_delay_seconds", 3.0)
+
+    tracker = get_latency_tracker()
+    if tracker.sample_count(vendor, method) >= hedging_config.get("min_samples", 10):
+        observed = tracker.percentile(vendor, method, hedging_config.get("percentile", 95))
+        if observed is not None:
+            delay = observed
+
+    return max(delay, hedging_config.get("min_delay_seconds", 0.5))
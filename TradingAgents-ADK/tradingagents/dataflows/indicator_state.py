@@ -0,0 +1,323 @@
+import os
+import copy
+import math
+import pickle
+import logging
+import tempfile
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .price_store import get_price_store
+from .indicators import (
+    MACD_WINDOWS,
+    RSI_WINDOW,
+    BOLL_WINDOW,
+    BOLL_STD_TIMES,
+    ATR_WINDOW,
+    VWMA_WINDOW,
+    MFI_WINDOW,
+)
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+
+class AdjustedEWM:
+    """Running adjusted exponentially weighted mean (pandas ewm(adjust=True)), O(1) per value."""
+
+    def __init__(self, alpha: float):
+        self.decay = 1.0 - alpha
+        self.num = 0.0
+        self.den = 0.0
+
+    @classmethod
+    def from_span(cls, span: int) -> "AdjustedEWM":
+        return cls(2.0 / (span + 1.0))
+
+    @classmethod
+    def wilder(cls, window: int) -> "AdjustedEWM":
+        return cls(1.0 / window)
+
+    def update(self, value: float) -> float:
+        self.num = value + self.decay * self.num
+        self.den = 1.0 + self.decay * self.den
+        return self.num / self.den
+
+
+class RollingWindow:
+    """
+    Trailing window with O(1) running sum, mean and sample standard deviation.
+
+    Mean and variance are maintained with Welford's add/remove updates, which stay
+    numerically stable as values enter and leave the window.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, value: float) -> None:
+        self.values.append(value)
+        self.total += value
+        n = len(self.values)
+        delta = value - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (value - self.mean)
+
+        if n > self.window:
+            removed = self.values.popleft()
+            self.total -= removed
+            n -= 1
+            delta = removed - self.mean
+            self.mean -= delta / n
+            self.m2 -= delta * (removed - self.mean)
+
+    def std(self) -> float:
+        n = len(self.values)
+        if n < 2:
+            return math.nan
+        return math.sqrt(max(self.m2, 0.0) / (n - 1))
+
+
+class RollingSum:
+    """Trailing sum over up to window values, O(1) per value."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+
+    def update(self, value: float) -> float:
+        self.values.append(value)
+        self.total += value
+        if len(self.values) > self.window:
+            self.total -= self.values.popleft()
+        return self.total
+
+
+class RSIState:
+    """Wilder RSI, matching indicators.rsi bar for bar."""
+
+    def __init__(self, window: int = RSI_WINDOW):
+        self.up = AdjustedEWM.wilder(window)
+        self.down = AdjustedEWM.wilder(window)
+        self.prev_close = None
+
+    def update(self, close: float) -> float:
+        diff = 0.0 if self.prev_close is None else close - self.prev_close
+        first = self.prev_close is None
+        self.prev_close = close
+        up = self.up.update(diff if diff > 0 else 0.0)
+        down = self.down.update(-diff if diff < 0 else 0.0)
+        total = up + down
+        if first or total == 0:
+            return 50.0
+        return 100 * (up / total)
+
+
+class ATRState:
+    """Average true range (Wilder smoothing of the true range)."""
+
+    def __init__(self, window: int = ATR_WINDOW):
+        self.smma = AdjustedEWM.wilder(window)
+        self.prev_close = None
+
+    def update(self, high: float, low: float, close: float) -> float:
+        prev_close = close if self.prev_close is None else self.prev_close
+        self.prev_close = close
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        return self.smma.update(0.0 if math.isnan(tr) else tr)
+
+
+class MACDState:
+    """MACD line, signal and histogram."""
+
+    def __init__(self, windows: tuple = MACD_WINDOWS):
+        short_w, long_w, signal_w = windows
+        self.short = AdjustedEWM.from_span(short_w)
+        self.long = AdjustedEWM.from_span(long_w)
+        self.signal = AdjustedEWM.from_span(signal_w)
+
+    def update(self, close: float):
+        line = self.short.update(close) - self.long.update(close)
+        signal = self.signal.update(line)
+        return line, signal, line - signal
+
+
+class MFIState:
+    """Money flow index over the typical price."""
+
+    def __init__(self, window: int = MFI_WINDOW):
+        self.window = window
+        self.pos = RollingSum(window)
+        self.neg = RollingSum(window)
+        self.prev_tp = None
+        self.count = 0
+
+    def update(self, tp: float, volume: float) -> float:
+        diff = 0.0 if self.prev_tp is None else tp - self.prev_tp
+        self.prev_tp = tp
+        flow = tp * volume
+        pos = self.pos.update(flow if diff > 0 else 0.0)
+        neg = self.neg.update(flow if diff < 0 else 0.0)
+        self.count += 1
+        total = pos + neg
+        if self.count <= self.window or not total > 0:
+            return 0.5
+        return pos / total
+
+
+class IndicatorState:
+    """
+    Incremental state for every SUPPORTED_INDICATORS key of one symbol.
+
+    advance() consumes bars after last_date one at a time, so keeping a universe
+    current costs O(new bars) rather than a recomputation over the full history.
+    Values match indicators.IndicatorFrame for the same bars.
+    """
+
+    def __init__(self):
+        self.sma_50 = RollingWindow(50)
+        self.sma_200 = RollingWindow(200)
+        self.ema_10 = AdjustedEWM.from_span(10)
+        self.macd = MACDState()
+        self.rsi = RSIState()
+        self.boll = RollingWindow(BOLL_WINDOW)
+        self.atr = ATRState()
+        self.vwma_tpv = RollingSum(VWMA_WINDOW)
+        self.vwma_vol = RollingSum(VWMA_WINDOW)
+        self.mfi = MFIState()
+        self.last_date: Optional[np.datetime64] = None
+        self.last_close: Optional[float] = None
+        self.values: Dict[str, float] = {}
+
+    def update(self, date, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """Advance by one bar and return the indicator values for that bar."""
+        values = {}
+        self.sma_50.update(close)
+        values["close_50_sma"] = self.sma_50.mean
+        self.sma_200.update(close)
+        values["close_200_sma"] = self.sma_200.mean
+        values["close_10_ema"] = self.ema_10.update(close)
+        values["macd"], values["macds"], values["macdh"] = self.macd.update(close)
+        values["rsi"] = self.rsi.update(close)
+
+        self.boll.update(close)
+        width = BOLL_STD_TIMES * self.boll.std()
+        values["boll"] = self.boll.mean
+        values["boll_ub"] = self.boll.mean + width
+        values["boll_lb"] = self.boll.mean - width
+
+        values["atr"] = self.atr.update(high, low, close)
+
+        tp = (close + high + low) / 3.0
+        rolling_tpv = self.vwma_tpv.update(volume * tp)
+        rolling_vol = self.vwma_vol.update(volume)
+        values["vwma"] = rolling_tpv / rolling_vol if rolling_vol != 0 else 0.0
+        values["mfi"] = self.mfi.update(tp, volume)
+
+        self.last_date = np.datetime64(date, "D")
+        self.last_close = close
+        self.values = values
+        return values
+
+    def advance(self, records: np.ndarray) -> Dict[str, float]:
+        """Consume every bar in a date-sorted price array that is newer than last_date."""
+        if self.last_date is not None:
+            records = records[records["date"] > self.last_date]
+        for bar in records:
+            self.update(bar["date"], float(bar["high"]), float(bar["low"]), float(bar["close"]), float(bar["volume"]))
+        return self.values
+
+
+def _state_path(symbol: str) -> str:
+    return os.path.join(get_config()["data_cache_dir"], "prices", f"{symbol.upper()}.state.pkl")
+
+
+def _load_state(symbol: str) -> Optional[IndicatorState]:
+    try:
+        with open(_state_path(symbol), "rb") as f:
+            state = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    return state if isinstance(state, IndicatorState) else None
+
+
+def _save_state(symbol: str, state: IndicatorState) -> None:
+    path = _state_path(symbol)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def update_indicator_state(symbol: str, records: np.ndarray) -> Dict[str, float]:
+    """
+    Advance the persisted indicator state of symbol to the last bar in records.
+
+    The state is checkpointed price_store.overlap_days bars behind the newest bar,
+    because the price store may still revise those bars on its next top-up. On load
+    the checkpoint's last close is compared with the stored bar for that date; if the
+    history was re-adjusted since, the state is rebuilt from the full history.
+
+    Args:
+        symbol: Ticker symbol
+        records: Date-sorted price array for symbol (see price_store)
+
+    Returns:
+        Dict mapping each SUPPORTED_INDICATORS key to its value on the last bar
+    """
+    state = _load_state(symbol)
+    if state is not None and state.last_date is not None:
+        pos = int(np.searchsorted(records["date"], state.last_date))
+        if pos >= len(records) or records["date"][pos] != state.last_date or not math.isclose(
+            float(records["close"][pos]), state.last_close, rel_tol=1e-9
+        ):
+            logger.info("Indicator state for %s no longer matches stored prices, rebuilding", symbol)
+            state = None
+    if state is None:
+        state = IndicatorState()
+
+    overlap_days = get_config().get("price_store", {}).get("overlap_days", 5)
+    settled = records[: max(0, len(records) - overlap_days)]
+    state.advance(settled)
+    _save_state(symbol, state)
+
+    current = copy.deepcopy(state)
+    current.advance(records)
+    return dict(current.values)
+
+
+def refresh_latest_indicators(symbols: list) -> Dict[str, Dict[str, float]]:
+    """
+    Top up the price store and advance the indicator state of every symbol.
+
+    Returns:
+        Dict mapping each upper-cased symbol with price data to its latest indicator values
+    """
+    today_date = pd.Timestamp.today()
+    start_date = (today_date - pd.DateOffset(years=15)).strftime("%Y-%m-%d")
+    end_date = today_date.strftime("%Y-%m-%d")
+    store = get_price_store()
+
+    latest = {}
+    for symbol in dict.fromkeys(s.upper() for s in symbols):
+        records = store.history(symbol, start_date, end_date)
+        if len(records):
+            latest[symbol] = update_indicator_state(symbol, records)
+    return latest
+
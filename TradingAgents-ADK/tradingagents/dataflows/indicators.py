@@ -0,0 +1,305 @@
+import math
+
+import numpy as np
+
+# Indicator keys supported by the vectorized engine, matching stockstats column names
+SUPPORTED_INDICATORS = (
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+)
+
+# Default windows stockstats uses for the un-suffixed indicators
+MACD_WINDOWS = (12, 26, 9)
+RSI_WINDOW = 14
+BOLL_WINDOW = 20
+BOLL_STD_TIMES = 2
+ATR_WINDOW = 14
+VWMA_WINDOW = 14
+MFI_WINDOW = 14
+
+
+def _decay_scan(values: np.ndarray, decay: float) -> np.ndarray:
+    """
+    Evaluate s[t] = decay * s[t-1] + values[t] (s[-1] = 0) without a Python loop per row.
+
+    Within a block, s[t] = decay**t * cumsum(values / decay**t); blocks are kept short
+    enough that decay**-t stays well inside float range, carrying s across blocks.
+    """
+    n = len(values)
+    out = np.empty(n, dtype=float)
+    if n == 0:
+        return out
+    block = n if decay >= 1.0 else max(1, int(30.0 / -math.log(decay)))
+    carry = 0.0
+    for start in range(0, n, block):
+        segment = values[start:start + block]
+        powers = decay ** np.arange(len(segment))
+        out[start:start + block] = powers * (carry * decay + np.cumsum(segment / powers))
+        carry = out[start + len(segment) - 1]
+    return out
+
+
+def ewm_mean(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Adjusted exponentially weighted mean, as pandas ewm(alpha=..., adjust=True).mean().
+
+    Like pandas with ignore_na=False, NaN values get no weight but still age the
+    earlier ones, and the mean is NaN until the first valid value.
+    """
+    decay = 1.0 - alpha
+    valid = ~np.isnan(values)
+    weighted = _decay_scan(np.where(valid, values, 0.0), decay)
+    weights = _decay_scan(valid.astype(float), decay)
+    with np.errstate(invalid="ignore"):
+        return np.where(weights > 0, weighted / weights, np.nan)
+
+
+def ema(values: np.ndarray, window: int) -> np.ndarray:
+    """stockstats ema: span-based adjusted EWM with min_periods=1."""
+    return ewm_mean(values, 2.0 / (window + 1.0))
+
+
+def smma(values: np.ndarray, window: int) -> np.ndarray:
+    """stockstats smma (Wilder smoothing): adjusted EWM with alpha = 1 / window."""
+    return ewm_mean(values, 1.0 / window)
+
+
+def _trailing(cumsum: np.ndarray, window: int) -> np.ndarray:
+    out = cumsum.copy()
+    out[window:] = cumsum[window:] - cumsum[:-window]
+    return out
+
+
+def _valid_counts(values: np.ndarray, window: int) -> np.ndarray:
+    """Number of non-NaN values in each trailing window."""
+    return _trailing(np.cumsum(~np.isnan(values), dtype=float), window)
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sum of the non-NaN values among up to window (min_periods=1: NaN if none)."""
+    out = _trailing(np.nancumsum(values), window)
+    out[_valid_counts(values, window) == 0] = np.nan
+    return out
+
+
+def sma(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean of the non-NaN values among up to window (min_periods=1)."""
+    counts = _valid_counts(values, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return rolling_sum(values, window) / counts
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sample standard deviation (ddof=1, min_periods=1; NaN for one value)."""
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+    if np.isnan(values).any():
+        return _rolling_nanstd(values, window)
+    # Two-pass over full windows is exact enough to match pandas' online algorithm
+    if n >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        out[window - 1:] = windows.std(axis=1, ddof=1)
+    for i in range(1, min(window - 1, n)):
+        out[i] = values[:i + 1].std(ddof=1)
+    return out
+
+
+def _rolling_nanstd(values: np.ndarray, window: int) -> np.ndarray:
+    """rolling_std over the non-NaN values of each window; NaN where fewer than two."""
+    padded = np.concatenate([np.full(window - 1, np.nan), values])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window)
+    counts = (~np.isnan(windows)).sum(axis=1)
+    out = np.full(len(values), np.nan)
+    enough = counts >= 2
+    out[enough] = np.nanstd(windows[enough], axis=1, ddof=1)
+    return out
+
+
+def _diff(values: np.ndarray) -> np.ndarray:
+    out = np.zeros_like(values)
+    out[1:] = np.diff(values)
+    return out
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    prev_close = np.empty_like(close)
+    if len(close):
+        prev_close[0] = close[0]
+        prev_close[1:] = close[:-1]
+    tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return np.nan_to_num(tr)
+
+
+def typical_price(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    # stockstats fills a missing typical price with 0, which vwma and mfi then use
+    return np.nan_to_num((close + high + low) / 3.0)
+
+
+def rsi(close: np.ndarray, window: int = RSI_WINDOW) -> np.ndarray:
+    diff = _diff(close)
+    up = smma(np.where(diff > 0, diff, 0.0), window)
+    down = smma(np.where(diff < 0, -diff, 0.0), window)
+    total = up + down
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(total != 0, 100 * (up / total), 50.0)
+    if len(out):
+        out[0] = 50.0
+    return np.nan_to_num(out)
+
+
+def macd(close: np.ndarray, windows: tuple = MACD_WINDOWS):
+    """Return (macd, macds, macdh)."""
+    short_w, long_w, signal_w = windows
+    line = ema(close, short_w) - ema(close, long_w)
+    signal = ema(line, signal_w)
+    return line, signal, line - signal
+
+
+def bollinger(close: np.ndarray, window: int = BOLL_WINDOW):
+    """Return (boll, boll_ub, boll_lb)."""
+    middle = sma(close, window)
+    width = BOLL_STD_TIMES * rolling_std(close, window)
+    return middle, middle + width, middle - width
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int = ATR_WINDOW) -> np.ndarray:
+    return np.nan_to_num(smma(true_range(high, low, close), window))
+
+
+def vwma(high, low, close, volume, window: int = VWMA_WINDOW) -> np.ndarray:
+    return _vwma_from_tp(typical_price(high, low, close), volume, window)
+
+
+def _vwma_from_tp(tp: np.ndarray, volume: np.ndarray, window: int) -> np.ndarray:
+    rolling_tpv = rolling_sum(volume * tp, window)
+    rolling_vol = rolling_sum(volume, window)
+    return np.divide(
+        rolling_tpv,
+        rolling_vol,
+        out=np.zeros_like(rolling_tpv, dtype=float),
+        where=rolling_vol != 0,
+    )
+
+
+def mfi(high, low, close, volume, window: int = MFI_WINDOW) -> np.ndarray:
+    return _mfi_from_tp(typical_price(high, low, close), volume, window)
+
+
+def _mfi_from_tp(tp: np.ndarray, volume: np.ndarray, window: int) -> np.ndarray:
+    raw_money_flow = tp * volume
+    tp_diff = _diff(tp)
+    pos_sum = rolling_sum(np.where(tp_diff > 0, raw_money_flow, 0.0), window)
+    neg_sum = rolling_sum(np.where(tp_diff < 0, raw_money_flow, 0.0), window)
+    total = pos_sum + neg_sum
+    out = np.divide(pos_sum, total, out=np.full_like(pos_sum, 0.5), where=total > 0)
+    out[:window] = 0.5
+    return np.nan_to_num(out)
+
+
+class IndicatorFrame:
+    """
+    Lazily computed indicator columns over one date-sorted price array.
+
+    Columns are memoized, and indicators computed together share their intermediates:
+    macd/macds/macdh reuse the 12/26-day EMAs, boll/boll_ub/boll_lb share the 20-day
+    SMA and standard deviation, and vwma/mfi share the typical price.
+    """
+
+    def __init__(self, records: np.ndarray):
+        self.records = records
+        self.dates = np.asarray(records["date"])
+        self._columns = {}
+
+    def _field(self, name: str) -> np.ndarray:
+        key = f"_{name}"
+        if key not in self._columns:
+            self._columns[key] = np.asarray(self.records[name], dtype=float)
+        return self._columns[key]
+
+    def _memo(self, key: str, compute) -> np.ndarray:
+        if key not in self._columns:
+            self._columns[key] = compute()
+        return self._columns[key]
+
+    def _close_ema(self, window: int) -> np.ndarray:
+        return self._memo(f"close_{window}_ema", lambda: ema(self._field("close"), window))
+
+    def _close_sma(self, window: int) -> np.ndarray:
+        return self._memo(f"close_{window}_sma", lambda: sma(self._field("close"), window))
+
+    def _typical_price(self) -> np.ndarray:
+        return self._memo(
+            "tp",
+            lambda: typical_price(self._field("high"), self._field("low"), self._field("close")),
+        )
+
+    def _compute_macd(self) -> None:
+        short_w, long_w, signal_w = MACD_WINDOWS
+        line = self._close_ema(short_w) - self._close_ema(long_w)
+        signal = ema(line, signal_w)
+        self._columns.update(macd=line, macds=signal, macdh=line - signal)
+
+    def _compute_boll(self) -> None:
+        middle = self._close_sma(BOLL_WINDOW)
+        std = self._memo(
+            f"close_{BOLL_WINDOW}_mstd",
+            lambda: rolling_std(self._field("close"), BOLL_WINDOW),
+        )
+        width = BOLL_STD_TIMES * std
+        self._columns.update(boll=middle, boll_ub=middle + width, boll_lb=middle - width)
+
+    def get(self, indicator: str) -> np.ndarray:
+        """Return the indicator column aligned with the price array."""
+        if indicator in self._columns:
+            return self._columns[indicator]
+
+        if indicator == "close_50_sma":
+            return self._close_sma(50)
+        if indicator == "close_200_sma":
+            return self._close_sma(200)
+        if indicator == "close_10_ema":
+            return self._close_ema(10)
+        if indicator in ("macd", "macds", "macdh"):
+            self._compute_macd()
+        elif indicator in ("boll", "boll_ub", "boll_lb"):
+            self._compute_boll()
+        elif indicator == "rsi":
+            self._columns["rsi"] = rsi(self._field("close"))
+        elif indicator == "atr":
+            self._columns["atr"] = atr(self._field("high"), self._field("low"), self._field("close"))
+        elif indicator == "vwma":
+            self._columns["vwma"] = _vwma_from_tp(self._typical_price(), self._field("volume"), VWMA_WINDOW)
+        elif indicator == "mfi":
+            self._columns["mfi"] = _mfi_from_tp(self._typical_price(), self._field("volume"), MFI_WINDOW)
+        else:
+            raise ValueError(
+                f"Indicator {indicator} is not supported. Please choose from: {list(SUPPORTED_INDICATORS)}"
+            )
+        return self._columns[indicator]
+
+
+def compute_indicator(records: np.ndarray, indicator: str) -> np.ndarray:
+    """
+    Compute one indicator over a date-sorted price array.
+
+    Args:
+        records: Structured array with close/high/low/volume fields (see price_store)
+        indicator: One of SUPPORTED_INDICATORS
+
+    Returns:
+        Float array aligned with records; NaN where stockstats yields no value
+    """
+    return IndicatorFrame(records).get(indicator)
@@ -0,0 +1,179 @@
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, List, Optional
+
+from .hedging import percentile
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+# Span outcomes
+SUCCESS = "success"
+ERROR = "error"
+RATE_LIMITED = "rate_limited"
+CACHE_HIT = "cache_hit"
+
+# Sinks receive one dict per span; with no sinks registered instrumentation is off
+_sinks: List[Callable[[dict], None]] = []
+_sinks_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    """Return True when at least one span sink is registered."""
+    return bool(_sinks)
+
+
+def add_sink(sink: Callable[[dict], None]) -> None:
+    """Register a callable that receives every span record."""
+    with _sinks_lock:
+        _sinks.append(sink)
+
+
+def remove_sink(sink: Callable[[dict], None]) -> None:
+    with _sinks_lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+
+
+def args_hash(args: tuple, kwargs: dict) -> str:
+    """Short, stable hash of call arguments for correlating spans."""
+    encoded = repr((args, sorted(kwargs.items()))).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:12]
+
+
+def result_size(result) -> Optional[int]:
+    """Approximate size in bytes of a vendor result."""
+    if result is None:
+        return None
+    if isinstance(result, (bytes, bytearray)):
+        return len(result)
+    if isinstance(result, str):
+        return len(result.encode("utf-8"))
+    if hasattr(result, "memory_usage"):
+        return int(result.memory_usage(deep=True).sum())
+    return len(str(result).encode("utf-8"))
+
+
+def emit_span(
+    method: str,
+    vendor: str,
+    impl: str,
+    args: tuple,
+    kwargs: dict,
+    latency: float,
+    outcome: str,
+    result=None,
+    error: Optional[BaseException] = None,
+) -> None:
+    """
+    Build a span record for one vendor attempt and hand it to every sink.
+
+    Callers should check is_enabled() first so the disabled path stays free of
+    hashing and size computation.
+    """
+    span = {
+        "method": method,
+        "vendor": vendor,
+        "impl": impl,
+        "args_hash": args_hash(args, kwargs),
+        "latency": latency,
+        "bytes": result_size(result) if outcome == SUCCESS else None,
+        "outcome": outcome,
+        "error": repr(error) if error is not None else None,
+    }
+    for sink in list(_sinks):
+        try:
+            sink(span)
+        except Exception:
+            logger.exception("Instrumentation sink %r failed", sink)
+
+
+def logging_sink(span: dict) -> None:
+    """Sink that writes each span to the dataflows logger at DEBUG level."""
+    logger.debug("span %s", span)
+
+
+class SpanSummary:
+    """
+    Sink that aggregates span latencies, bytes and outcomes per (vendor, method).
+    """
+
+    def __init__(self):
+        self._latencies = defaultdict(list)
+        self._outcomes = defaultdict(lambda: defaultdict(int))
+        self._bytes = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def __call__(self, span: dict) -> None:
+        key = (span["vendor"], span["method"])
+        with self._lock:
+            self._outcomes[key][span["outcome"]] += 1
+            if span["outcome"] == SUCCESS:
+                self._latencies[key].append(span["latency"])
+                self._bytes[key] += span["bytes"] or 0
+
+    def summary(self) -> dict:
+        """Return call counts, outcomes, bytes and p50/p95 latency per vendor:method."""
+        with self._lock:
+            keys = sorted(self._outcomes)
+            return {
+                f"{vendor}:{method}": {
+                    "calls": sum(self._outcomes[(vendor, method)].values()),
+                    "outcomes": dict(self._outcomes[(vendor, method)]),
+                    "bytes": self._bytes[(vendor, method)],
+                    "p50": percentile(self._latencies[(vendor, method)], 50),
+                    "p95": percentile(self._latencies[(vendor, method)], 95),
+                }
+                for vendor, method in keys
+            }
+
+    def format(self) -> str:
+        """Render the summary as a fixed-width table."""
+        lines = [f"{'vendor:method':<45} {'calls':>6} {'ok':>5} {'p50 s':>8} {'p95 s':>8} {'bytes':>12}"]
+        for name, stats in self.summary().items():
+            p50 = f"{stats['p50']:.3f}" if stats["p50"] is not None else "-"
+            p95 = f"{stats['p95']:.3f}" if stats["p95"] is not None else "-"
+            lines.append(
+                f"{name:<45} {stats['calls']:>6} {stats['outcomes'].get(SUCCESS, 0):>5} "
+                f"{p50:>8} {p95:>8} {stats['bytes']:>12}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latencies.clear()
+            self._outcomes.clear()
+            self._bytes.clear()
+
+
+_summary: Optional[SpanSummary] = None
+
+
+def enable_instrumentation(log_spans: bool = False) -> SpanSummary:
+    """
+    Start collecting spans into the run summary, optionally also logging each span.
+
+    Returns:
+        The SpanSummary sink collecting this run's spans
+    """
+    global _summary
+    if _summary is None:
+        _summary = SpanSummary()
+        add_sink(_summary)
+    if log_spans and logging_sink not in _sinks:
+        add_sink(logging_sink)
+    return _summary
+
+
+def disable_instrumentation() -> None:
+    """Remove every sink, returning instrumentation to its zero-cost state."""
+    global _summary
+    with _sinks_lock:
+        _sinks.clear()
+    _summary = None
+
+
+def get_summary() -> Optional[SpanSummary]:
+    """Return the run summary sink, or None when instrumentation is disabled."""
+    return _summary
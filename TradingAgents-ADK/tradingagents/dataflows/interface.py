@@ -1,24 +1,40 @@
-from typing import Annotated
+import json
+import time
+import logging
+import importlib
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Annotated, Optional
 
 # Import from vendor-specific modules
-from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
-from .y_finance import get_YFin_data_online, get_stock_stats_indicators_window, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_insider_transactions as get_yfinance_insider_transactions
+from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_simfin_financial_statements_asof, get_reddit_global_news, get_reddit_company_news
+from .y_finance import get_YFin_data_online, get_YFin_data_online_batch, get_stock_stats_indicators_window, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_financial_statements as get_yfinance_financial_statements, get_insider_transactions as get_yfinance_insider_transactions
 from .google import get_google_news
 from .openai import get_stock_news_openai, get_global_news_openai, get_fundamentals_openai
 from .alpha_vantage import (
     get_stock as get_alpha_vantage_stock,
+    get_stock_batch as get_alpha_vantage_stock_batch,
     get_indicator as get_alpha_vantage_indicator,
     get_fundamentals as get_alpha_vantage_fundamentals,
     get_balance_sheet as get_alpha_vantage_balance_sheet,
     get_cashflow as get_alpha_vantage_cashflow,
     get_income_statement as get_alpha_vantage_income_statement,
+    get_financial_statements as get_alpha_vantage_financial_statements,
     get_insider_transactions as get_alpha_vantage_insider_transactions,
     get_news as get_alpha_vantage_news
 )
 from .alpha_vantage_common import AlphaVantageRateLimitError
+import requests
 
 # Configuration and routing logic
 from .config import get_config
+from .result_cache import MISS, get_result_cache, make_cache_key, get_ttl, is_cacheable, is_error_result
+from .hedging import get_latency_tracker, hedge_delay, should_hedge
+from .vendor_health import get_vendor_health
+from .singleflight import get_single_flight
+from . import instrumentation
+
+logger = logging.getLogger("tradingagents.dataflows")
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
@@ -40,7 +56,8 @@ TOOLS_CATEGORIES = {
             "get_fundamentals",
             "get_balance_sheet",
             "get_cashflow",
-            "get_income_statement"
+            "get_income_statement",
+            "get_financial_statements_asof",
         ]
     },
     "news_data": {
@@ -95,6 +112,11 @@ VENDOR_METHODS = {
         "yfinance": get_yfinance_income_statement,
         "local": get_simfin_income_statements,
     },
+    "get_financial_statements_asof": {
+        "alpha_vantage": get_alpha_vantage_financial_statements,
+        "yfinance": get_yfinance_financial_statements,
+        "local": get_simfin_financial_statements_asof,
+    },
     # news_data
     "get_news": {
         "alpha_vantage": get_alpha_vantage_news,
@@ -116,6 +138,14 @@ VENDOR_METHODS = {
     },
 }
 
+# Multi-symbol implementations used by get_stock_data_batch
+VENDOR_BATCH_METHODS = {
+    "get_stock_data": {
+        "yfinance": get_YFin_data_online_batch,
+        "alpha_vantage": get_alpha_vantage_stock_batch,
+    },
+}
+
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
     for category, info in TOOLS_CATEGORIES.items():
@@ -138,17 +168,196 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
-def route_to_vendor(method: str, *args, **kwargs):
-    """Route method calls to appropriate vendor implementation with fallback support."""
-    category = get_category_for_method(method)
-    vendor_config = get_vendor(category, method)
+def _as_impl_list(vendor_impl) -> list:
+    """Normalize a VENDOR_METHODS entry to a list of implementations."""
+    if isinstance(vendor_impl, list):
+        return vendor_impl
+    return [vendor_impl]
 
-    # Handle comma-separated vendors
-    primary_vendors = [v.strip() for v in vendor_config.split(',')]
+def _optional_error_types() -> tuple:
+    """Vendor SDK error types, for the SDKs that are installed."""
+    error_types = []
+    for module_name, name in (("aiohttp", "ClientError"), ("openai", "APIError"), ("yfinance.exceptions", "YFException")):
+        try:
+            error_types.append(getattr(importlib.import_module(module_name), name))
+        except (ImportError, AttributeError):
+            pass
+    return tuple(error_types)
 
-    if method not in VENDOR_METHODS:
-        raise ValueError(f"Method '{method}' not supported")
+# Errors that say something about the vendor (transport, rate limits, malformed or
+# failed responses) rather than about the arguments it was called with
+VENDOR_FAULTS = (
+    AlphaVantageRateLimitError,
+    requests.RequestException,
+    OSError,  # includes ConnectionError and TimeoutError
+    json.JSONDecodeError,
+) + _optional_error_types()
+
+def is_vendor_fault(error: Exception) -> bool:
+    """Whether a failed call should count against the vendor's circuit breaker."""
+    return isinstance(error, VENDOR_FAULTS)
+
+def _record_success(method: str, impl_name: str, vendor: str, args: tuple, kwargs: dict, latency: float, result):
+    """Feed a successful vendor call into latency tracking, health scoring and spans."""
+    get_latency_tracker().record(vendor, method, latency)
+    if is_error_result(result):
+        # The vendor reported its failure as text instead of raising
+        get_vendor_health().record_failure(vendor, method)
+    else:
+        get_vendor_health().record_success(vendor, method)
+    if instrumentation.is_enabled():
+        instrumentation.emit_span(method, vendor, impl_name, args, kwargs,
+                                  latency, instrumentation.SUCCESS, result=result)
+    logger.debug("%s from vendor '%s' completed in %.3fs", impl_name, vendor, latency)
+
+def _record_failure(method: str, impl_name: str, vendor: str, args: tuple, kwargs: dict, latency: float, error: Exception):
+    """Feed a failed vendor call into health scoring and spans."""
+    rate_limited = isinstance(error, AlphaVantageRateLimitError)
+    if is_vendor_fault(error):
+        get_vendor_health().record_failure(vendor, method, rate_limited=rate_limited)
+    else:
+        # e.g. a ValueError for an unsupported indicator says nothing about the vendor
+        get_vendor_health().release(vendor, method)
+    if instrumentation.is_enabled():
+        outcome = instrumentation.RATE_LIMITED if rate_limited else instrumentation.ERROR
+        instrumentation.emit_span(method, vendor, impl_name, args, kwargs, latency, outcome, error=error)
+    if rate_limited:
+        logger.warning("Rate limit hit by %s from vendor '%s', falling back to next available vendor: %s",
+                       impl_name, vendor, error)
+    else:
+        # Log error but continue with other implementations
+        logger.warning("%s from vendor '%s' failed: %s", impl_name, vendor, error)
+
+def _admit(method: str, vendor: str) -> bool:
+    """Take the vendor's circuit breaker admission; only one probe runs while half-open."""
+    if get_vendor_health().acquire(vendor, method):
+        return True
+    logger.info("Skipping vendor '%s' for %s while its circuit breaker is open or probing", vendor, method)
+    return False
+
+def _call_vendor_impl(method: str, impl_func, vendor: str, args: tuple, kwargs: dict):
+    """Call a single vendor implementation, returning (succeeded, result)."""
+    if not _admit(method, vendor):
+        return False, None
+    logger.debug("Calling %s from vendor '%s'", impl_func.__name__, vendor)
+    started = time.perf_counter()
+    try:
+        result = impl_func(*args, **kwargs)
+    except Exception as e:
+        _record_failure(method, impl_func.__name__, vendor, args, kwargs, time.perf_counter() - started, e)
+        return False, None
+    except BaseException:
+        get_vendor_health().release(vendor, method)
+        raise
+
+    _record_success(method, impl_func.__name__, vendor, args, kwargs, time.perf_counter() - started, result)
+    return True, result
 
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool used for concurrent vendor calls."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            max_workers = get_config().get("vendor_execution", {}).get("max_workers", 8)
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vendor")
+        return _executor
+
+def _run_concurrently(method: str, calls: list, args: tuple, kwargs: dict, deadline: Optional[float]) -> dict:
+    """
+    Run (vendor, impl_func) pairs concurrently and gather their results.
+
+    Results are grouped per vendor in the order the calls were given, regardless of
+    completion order. Calls still running when the deadline expires count as failures;
+    their threads are left to finish in the background and their results are discarded.
+
+    Returns:
+        Dict mapping each vendor to the list of results from its successful calls
+    """
+    logger.debug("%s - Running %d primary implementation(s) concurrently", method, len(calls))
+    executor = _get_executor()
+    futures = [
+        executor.submit(_call_vendor_impl, method, impl_func, vendor, args, kwargs)
+        for vendor, impl_func in calls
+    ]
+    wait(futures, timeout=deadline)
+
+    results_by_vendor = {vendor: [] for vendor, _ in calls}
+    for (vendor, impl_func), future in zip(calls, futures):
+        if not future.done():
+            future.cancel()
+            logger.warning("%s from vendor '%s' exceeded the %ss deadline", impl_func.__name__, vendor, deadline)
+            continue
+        succeeded, result = future.result()
+        if succeeded:
+            results_by_vendor[vendor].append(result)
+    return results_by_vendor
+
+def _run_hedged(method: str, primary: tuple, hedge: tuple, args: tuple, kwargs: dict) -> dict:
+    """
+    Run the primary (vendor, impl_func) and, if it is slow, a hedge against the next vendor.
+
+    The hedge starts once the primary has been running longer than its observed latency
+    percentile. Whichever call succeeds first wins; the other is cancelled if it has not
+    started, otherwise left to finish with its result discarded.
+
+    Returns:
+        Dict mapping each vendor that ran to the list of its (at most one) accepted result
+    """
+    primary_vendor, primary_impl = primary
+    hedge_vendor, hedge_impl = hedge
+    executor = _get_executor()
+
+    primary_future = executor.submit(_call_vendor_impl, method, primary_impl, primary_vendor, args, kwargs)
+    delay = hedge_delay(primary_vendor, method)
+    done, _ = wait([primary_future], timeout=delay)
+    if done:
+        succeeded, result = primary_future.result()
+        return {primary_vendor: [result] if succeeded else []}
+
+    logger.info("%s - '%s' slower than %.2fs, hedging with '%s'", method, primary_vendor, delay, hedge_vendor)
+    hedge_future = executor.submit(_call_vendor_impl, method, hedge_impl, hedge_vendor, args, kwargs)
+    vendors_by_future = {primary_future: primary_vendor, hedge_future: hedge_vendor}
+    results_by_vendor = {primary_vendor: [], hedge_vendor: []}
+
+    pending = set(vendors_by_future)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            succeeded, result = future.result()
+            if succeeded:
+                winner = vendors_by_future[future]
+                logger.info("%s - hedge won by '%s'", method, winner)
+                results_by_vendor[winner] = [result]
+                for loser in pending:
+                    loser.cancel()
+                return results_by_vendor
+    return results_by_vendor
+
+def _lookup_cached(method: str, vendor_config: str, args: tuple, kwargs: dict):
+    """
+    Look a routed call up in the result cache.
+
+    Returns:
+        (cache, cache_key, cached) where cache is None when caching is disabled and
+        cached is MISS unless the call was answered from the cache
+    """
+    cache = get_result_cache()
+    if cache is None:
+        return None, None, MISS
+    cache_key = make_cache_key(method, vendor_config, args, kwargs)
+    cached = cache.get(cache_key)
+    if cached is not MISS:
+        logger.debug("%s - served from result cache", method)
+        if instrumentation.is_enabled():
+            instrumentation.emit_span(method, "cache", "result_cache", args, kwargs, 0.0,
+                                      instrumentation.CACHE_HIT)
+    return cache, cache_key, cached
+
+def _build_fallback_chain(method: str, primary_vendors: list) -> list:
+    """Primary vendors first, then the remaining vendors ordered by health, minus open circuits."""
     # Get all available vendors for this method for fallback
     all_available_vendors = list(VENDOR_METHODS[method].keys())
     
@@ -158,87 +367,205 @@ def route_to_vendor(method: str, *args, **kwargs):
         if vendor not in fallback_vendors:
             fallback_vendors.append(vendor)
 
-    # Debug: Print fallback ordering
-    primary_str = " → ".join(primary_vendors)
-    fallback_str = " → ".join(fallback_vendors)
-    print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
+    # Skip vendors whose circuit breaker is open, then order the fallbacks by observed health
+    health = get_vendor_health()
+    for vendor in [v for v in fallback_vendors if not health.allow_request(v, method)]:
+        logger.info("Skipping vendor '%s' for %s while its circuit breaker cools down", vendor, method)
+        fallback_vendors.remove(vendor)
+    fallback_vendors = [v for v in fallback_vendors if v in primary_vendors] + health.order_by_health(
+        [v for v in fallback_vendors if v not in primary_vendors], method
+    )
+
+    logger.debug("%s - Primary: %s | Full fallback order: %s", method, primary_vendors, fallback_vendors)
+    return fallback_vendors
+
+def _hedge_pair(method: str, primary_vendors: list, fallback_vendors: list):
+    """Return the (vendor, impl) pairs to hedge between, or None when hedging does not apply."""
+    if len(primary_vendors) != 1 or not should_hedge(method):
+        return None
+    chain = [
+        (vendor, VENDOR_METHODS[method][vendor])
+        for vendor in fallback_vendors
+        if vendor in VENDOR_METHODS[method]
+    ]
+    if len(chain) < 2 or chain[0][0] != primary_vendors[0]:
+        return None
+    if any(isinstance(impl, list) for _, impl in chain[:2]):
+        return None
+    return chain[0], chain[1]
+
+def _combine_results(results: list):
+    """Return a single result as-is, otherwise concatenate all results as a string."""
+    if len(results) == 1:
+        return results[0]
+    # Convert all results to strings and concatenate
+    return '\n'.join(str(result) for result in results)
+
+def route_to_vendor(method: str, *args, **kwargs):
+    """Route method calls to appropriate vendor implementation with fallback support."""
+    category = get_category_for_method(method)
+    vendor_config = get_vendor(category, method)
+
+    # Handle comma-separated vendors
+    primary_vendors = [v.strip() for v in vendor_config.split(',')]
+
+    if method not in VENDOR_METHODS:
+        raise ValueError(f"Method '{method}' not supported")
+
+    # Serve repeated (method, args, vendor) calls from the result cache
+    cache, cache_key, cached = _lookup_cached(method, vendor_config, args, kwargs)
+    if cached is not MISS:
+        return cached
+
+    def fetch():
+        final_result = _route_uncached(method, primary_vendors, args, kwargs)
+        if cache is not None and is_cacheable(final_result):
+            cache.set(cache_key, final_result, get_ttl(category))
+        return final_result
+
+    # Identical calls already in flight share one vendor fetch
+    if not _single_flight_enabled():
+        return fetch()
+    flight_key = cache_key or make_cache_key(method, vendor_config, args, kwargs)
+    return get_single_flight().do(flight_key, fetch)
+
+def _single_flight_enabled() -> bool:
+    return get_config().get("single_flight", {}).get("enabled", False)
+
+def _route_plan(method: str, primary_vendors: list):
+    """
+    Fallback chain of a call that was not answered from the cache, as a generator of steps.
+
+    All chain, fan-out, hedging and stopping decisions live here, so the sync and async
+    routers only differ in how they run a step. Each yielded step is answered with
+    send():
+        ("fan_out", calls, deadline) -> dict of vendor -> results
+        ("hedge", primary, hedge)    -> dict of vendor -> results
+        ("call", vendor, impl_func)  -> (succeeded, result)
+    The generator returns the combined result, or raises RuntimeError if every vendor failed.
+    """
+    fallback_vendors = _build_fallback_chain(method, primary_vendors)
+
+    # Fire every primary implementation at once when concurrent execution is configured,
+    # so the wall time is the slowest source rather than the sum of all of them
+    prefetched_results = {}
+    execution_config = get_config().get("vendor_execution", {})
+    if execution_config.get("mode", "sequential") == "concurrent":
+        primary_calls = [
+            (vendor, impl_func)
+            for vendor in primary_vendors
+            if vendor in VENDOR_METHODS[method] and vendor in fallback_vendors
+            for impl_func in _as_impl_list(VENDOR_METHODS[method][vendor])
+        ]
+        if len(primary_calls) > 1:
+            prefetched_results = yield ("fan_out", primary_calls, execution_config.get("deadline_seconds"))
+
+    # Hedge a single primary vendor against the next fallback vendor to cut tail latency
+    hedge_pair = None if prefetched_results else _hedge_pair(method, primary_vendors, fallback_vendors)
+    if hedge_pair is not None:
+        prefetched_results = yield ("hedge", hedge_pair[0], hedge_pair[1])
 
     # Track results and execution state
     results = []
     vendor_attempt_count = 0
-    any_primary_vendor_attempted = False
-    successful_vendor = None
 
     for vendor in fallback_vendors:
         if vendor not in VENDOR_METHODS[method]:
             if vendor in primary_vendors:
-                print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
+                logger.info("Vendor '%s' not supported for method '%s', falling back to next vendor", vendor, method)
             continue
 
-        vendor_impl = VENDOR_METHODS[method][vendor]
         is_primary_vendor = vendor in primary_vendors
         vendor_attempt_count += 1
-
-        # Track if we attempted any primary vendor
-        if is_primary_vendor:
-            any_primary_vendor_attempted = True
-
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
+        logger.debug("Attempting %s vendor '%s' for %s (attempt #%d)",
+                     "primary" if is_primary_vendor else "fallback", vendor, method, vendor_attempt_count)
 
         # Handle list of methods for a vendor
-        if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
+        vendor_methods = _as_impl_list(VENDOR_METHODS[method][vendor])
+        if len(vendor_methods) > 1:
+            logger.debug("Vendor '%s' has %d implementations", vendor, len(vendor_methods))
+
+        # Run methods for this vendor (primary vendors may already have run concurrently)
+        if vendor in prefetched_results:
+            vendor_results = prefetched_results[vendor]
         else:
-            vendor_methods = [(vendor_impl, vendor)]
-
-        # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
-            try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
-                continue
+            vendor_results = []
+            for impl_func in vendor_methods:
+                succeeded, result = yield ("call", vendor, impl_func)
+                if succeeded:
+                    vendor_results.append(result)
 
         # Add this vendor's results
         if vendor_results:
             results.extend(vendor_results)
-            successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
-            
+            logger.debug("Vendor '%s' succeeded with %d result(s)", vendor, len(vendor_results))
+
             # Stopping logic: Stop after first successful vendor for single-vendor configs
             # Multiple vendor configs (comma-separated) may want to collect from multiple sources
             if len(primary_vendors) == 1:
-                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
                 break
         else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
+            logger.debug("Vendor '%s' produced no results", vendor)
 
     # Final result summary
     if not results:
-        print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
+        logger.error("All %d vendor attempts failed for method '%s'", vendor_attempt_count, method)
         raise RuntimeError(f"All vendor implementations failed for method '{method}'")
-    else:
-        print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
+    logger.debug("%s completed with %d result(s) from %d vendor attempt(s)",
+                 method, len(results), vendor_attempt_count)
 
     # Return single result if only one, otherwise concatenate as string
-    if len(results) == 1:
-        return results[0]
-    else:
-        # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+    return _combine_results(results)
+
+def _route_uncached(method: str, primary_vendors: list, args: tuple, kwargs: dict):
+    """Run the vendor fallback chain for a call that was not answered from the cache."""
+    plan = _route_plan(method, primary_vendors)
+    outcome = None
+    while True:
+        try:
+            step = plan.send(outcome)
+        except StopIteration as finished:
+            return finished.value
+        kind = step[0]
+        if kind == "fan_out":
+            outcome = _run_concurrently(method, step[1], args, kwargs, step[2])
+        elif kind == "hedge":
+            outcome = _run_hedged(method, step[1], step[2], args, kwargs)
+        else:
+            outcome = _call_vendor_impl(method, step[2], step[1], args, kwargs)
+
+def get_stock_data_batch(symbols: list, start_date: str, end_date: str) -> dict:
+    """
+    Fetch OHLCV frames for many symbols with one bulk request per vendor.
+
+    Symbols are requested from the configured core_stock_apis vendor first; any symbol
+    it could not serve is retried against the remaining batch-capable vendors.
+
+    Returns:
+        Dict mapping each upper-cased symbol that returned data to its DataFrame
+    """
+    method = "get_stock_data"
+    vendor_config = get_vendor(get_category_for_method(method), method)
+    primary_vendors = [v.strip() for v in vendor_config.split(',')]
+    vendor_order = primary_vendors + [v for v in VENDOR_BATCH_METHODS[method] if v not in primary_vendors]
+
+    remaining = list(dict.fromkeys(s.upper() for s in symbols))
+    frames = {}
+    for vendor in vendor_order:
+        if vendor not in VENDOR_BATCH_METHODS[method] or not remaining:
+            continue
+        batch_impl = VENDOR_BATCH_METHODS[method][vendor]
+        started = time.perf_counter()
+        try:
+            fetched = batch_impl(remaining, start_date, end_date)
+        except Exception as e:
+            logger.warning("Batch %s from vendor '%s' failed for %d symbols: %s", method, vendor, len(remaining), e)
+            continue
+        logger.debug("Batch %s from vendor '%s' returned %d of %d symbols in %.3fs",
+                     method, vendor, len(fetched), len(remaining), time.perf_counter() - started)
+        frames.update(fetched)
+        remaining = [s for s in remaining if s not in frames]
+
+    if remaining:
+        logger.warning("No %s data for %d symbol(s): %s", method, len(remaining), remaining)
+    return frames
@@ -1,20 +1,18 @@
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from .config import get_config
 
 
-def get_stock_news_openai(query, start_date, end_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
-
-    response = client.responses.create(
-        model=config["quick_think_llm"],
+def _web_search_request(model, prompt):
+    """Build the responses.create arguments for a web-search backed prompt."""
+    return dict(
+        model=model,
         input=[
             {
                 "role": "system",
                 "content": [
                     {
                         "type": "input_text",
-                        "text": f"Can you search Social Media for {query} from {start_date} to {end_date}? Make sure you only get the data posted during that period.",
+                        "text": prompt,
                     }
                 ],
             }
@@ -34,74 +32,56 @@ def get_stock_news_openai(query, start_date, end_date):
         store=True,
     )
 
-    return response.output[1].content[0].text
 
+def _stock_news_prompt(query, start_date, end_date):
+    return f"Can you search Social Media for {query} from {start_date} to {end_date}? Make sure you only get the data posted during that period."
 
-def get_global_news_openai(curr_date, look_back_days=7, limit=5):
+
+def _global_news_prompt(curr_date, look_back_days, limit):
+    return f"Can you search global or macroeconomics news from {look_back_days} days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period. Limit the results to {limit} articles."
+
+
+def _fundamentals_prompt(ticker, curr_date):
+    return f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc"
+
+
+def _search(prompt):
     config = get_config()
     client = OpenAI(base_url=config["backend_url"])
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search global or macroeconomics news from {look_back_days} days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period. Limit the results to {limit} articles.",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
-    )
+    response = client.responses.create(**_web_search_request(config["quick_think_llm"], prompt))
 
     return response.output[1].content[0].text
 
 
-def get_fundamentals_openai(ticker, curr_date):
+async def _search_async(prompt):
     config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    client = AsyncOpenAI(base_url=config["backend_url"])
+
+    response = await client.responses.create(**_web_search_request(config["quick_think_llm"], prompt))
+
+    return response.output[1].content[0].text
+
+
+def get_stock_news_openai(query, start_date, end_date):
+    return _search(_stock_news_prompt(query, start_date, end_date))
+
+
+def get_global_news_openai(curr_date, look_back_days=7, limit=5):
+    return _search(_global_news_prompt(curr_date, look_back_days, limit))
+
+
+def get_fundamentals_openai(ticker, curr_date):
+    return _search(_fundamentals_prompt(ticker, curr_date))
+
+
+async def get_stock_news_openai_async(query, start_date, end_date):
+    return await _search_async(_stock_news_prompt(query, start_date, end_date))
+
+
+async def get_global_news_openai_async(curr_date, look_back_days=7, limit=5):
+    return await _search_async(_global_news_prompt(curr_date, look_back_days, limit))
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
-    )
 
-    return response.output[1].content[0].text
\ No newline at end of file
+async def get_fundamentals_openai_async(ticker, curr_date):
+    return await _search_async(_fundamentals_prompt(ticker, curr_date))
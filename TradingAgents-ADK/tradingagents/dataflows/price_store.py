@@ -0,0 +1,263 @@
+import os
+import json
+import logging
+import tempfile
+from datetime import date, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .singleflight import get_single_flight
+from .date_index import to_days, window_bounds
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+# Frame column name -> structured array field
+PRICE_COLUMNS = {
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Volume": "volume",
+    "Dividends": "dividends",
+    "Stock Splits": "stock_splits",
+}
+
+PRICE_DTYPE = np.dtype(
+    [("date", "datetime64[D]")] + [(field, "f8") for field in PRICE_COLUMNS.values()]
+)
+
+
+def records_from_frame(data: pd.DataFrame) -> np.ndarray:
+    """Convert a date-indexed yfinance frame into a sorted PRICE_DTYPE array."""
+    data = data.dropna(how="all")
+    records = np.zeros(len(data), dtype=PRICE_DTYPE)
+    if data.empty:
+        return records
+
+    records["date"] = to_days(pd.DatetimeIndex(data.index))
+    for column, field in PRICE_COLUMNS.items():
+        if column in data.columns:
+            records[field] = data[column].to_numpy(dtype="f8", na_value=np.nan)
+    records.sort(order="date")
+    return records
+
+
+def frame_from_records(records: np.ndarray) -> pd.DataFrame:
+    """Convert a PRICE_DTYPE array into the Date/Open/High/... frame stockstats expects."""
+    data = {"Date": pd.to_datetime(records["date"])}
+    for column, field in PRICE_COLUMNS.items():
+        data[column] = np.asarray(records[field])
+    return pd.DataFrame(data)
+
+
+def _download(symbol: str, start: np.datetime64, end: np.datetime64) -> np.ndarray:
+    """Download daily bars in [start, end) with yfinance."""
+    data = yf.download(
+        symbol,
+        start=str(start),
+        end=str(end),
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+        actions=True,
+    )
+    # actions=True can add rows for dividend/split dates that have no bar; drop them
+    # rather than storing bars with NaN prices
+    ohlc = [column for column in ("Open", "High", "Low", "Close") if column in data.columns]
+    return records_from_frame(data.dropna(subset=ohlc))
+
+
+class PriceStore:
+    """
+    Persistent per-symbol daily OHLCV store.
+
+    Each symbol is one NumPy structured array ({SYMBOL}.npy, sorted by date) that is
+    memory-mapped on read, plus a small {SYMBOL}.json recording the range already
+    fetched. Updates only download the trailing days after the last stored bars,
+    re-fetching a small overlap (price_store.overlap_days) that is merged in to
+    repair revised bars; if the overlap disagrees with what is stored, the history
+    was re-adjusted for a split or dividend and is downloaded again in full. Both
+    files are replaced atomically so readers never see a partial write.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+
+    def _paths(self, symbol: str):
+        base = os.path.join(self.root_dir, symbol.upper())
+        return f"{base}.npy", f"{base}.json"
+
+    def read(self, symbol: str):
+        """Return (records, meta) for symbol, or (None, None) if it is not stored."""
+        data_path, meta_path = self._paths(symbol)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            records = np.load(data_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None, None
+        if len(records) == 0:
+            # Zero-length arrays cannot be memory-mapped; np.load returns them in memory
+            records = np.zeros(0, dtype=PRICE_DTYPE)
+        return records, meta
+
+    def write(self, symbol: str, records: np.ndarray, meta: dict) -> None:
+        """Atomically replace the stored array and metadata for symbol."""
+        os.makedirs(self.root_dir, exist_ok=True)
+        data_path, meta_path = self._paths(symbol)
+        self._replace(data_path, lambda f: np.save(f, np.ascontiguousarray(records, dtype=PRICE_DTYPE)))
+        # Metadata goes last: a crash in between only makes the next read refetch
+        self._replace(meta_path, lambda f: f.write(json.dumps(meta).encode("utf-8")))
+
+    def _replace(self, path: str, write) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def covers(self, symbol: str, start_date: str, end_date: str) -> bool:
+        """Whether [start_date, end_date) was already fetched for symbol."""
+        _, meta = self.read(symbol)
+        if meta is None:
+            return False
+        return meta["start"] <= start_date and _clamp_end(end_date) <= meta["end"]
+
+    def update(self, symbol: str, start_date: str, end_date: str) -> None:
+        """Fetch whatever part of [start_date, end_date) is not stored yet."""
+        end_date = _clamp_end(end_date)
+        records, meta = self.read(symbol)
+
+        if records is None or start_date < meta["start"]:
+            logger.info("Price store: downloading %s from %s to %s", symbol, start_date, end_date)
+            self._refetch(symbol, start_date, end_date)
+            return
+
+        if end_date <= meta["end"]:
+            return
+
+        if len(records) == 0:
+            self._refetch(symbol, meta["start"], end_date)
+            return
+
+        # Re-download a few bars we already have so revised bars are repaired and
+        # a split/dividend re-adjustment of the history can be detected
+        overlap_days = get_config().get("price_store", {}).get("overlap_days", 5)
+        overlap_start = max(0, len(records) - overlap_days)
+        fetch_from = records["date"][overlap_start]
+        logger.info("Price store: topping up %s from %s to %s", symbol, fetch_from, end_date)
+        new_records = _download(symbol, fetch_from, to_days(end_date))
+        if len(new_records) == 0:
+            # Keep what we have rather than treating an empty response as a revision
+            logger.warning("Price store: empty top-up for %s, keeping stored history", symbol)
+            return
+
+        if not _overlap_matches(records[overlap_start:], new_records):
+            logger.info("Price store: %s history was re-adjusted, refetching", symbol)
+            self._refetch(symbol, meta["start"], end_date)
+            return
+
+        merged = np.concatenate([np.asarray(records[:overlap_start]), new_records])
+        self.write(symbol, merged, {"start": meta["start"], "end": end_date})
+
+    def _refetch(self, symbol: str, start_date: str, end_date: str) -> None:
+        records = _download(symbol, to_days(start_date), to_days(end_date))
+        self.write(symbol, records, {"start": start_date, "end": end_date})
+
+    def ensure(self, symbol: str, start_date: str, end_date: str) -> None:
+        """
+        Make sure [start_date, end_date) is stored for symbol.
+
+        Concurrent callers updating the same symbol share one download. The shared
+        call may have been started for a different range, so a caller that only
+        waited on it checks coverage again and, if its range is still missing,
+        runs (or joins) another update.
+        """
+        symbol = symbol.upper()
+        ran_own_update = False
+
+        def run_update():
+            nonlocal ran_own_update
+            ran_own_update = True
+            self.update(symbol, start_date, end_date)
+
+        # Stop once our own update has run: an empty top-up can leave the range
+        # uncovered, and retrying it here would only download the same bars again
+        while not ran_own_update and not self.covers(symbol, start_date, end_date):
+            get_single_flight().do(f"price_store:{self.root_dir}:{symbol}", run_update)
+
+    def mtime(self, symbol: str) -> Optional[int]:
+        """Modification time (ns) of the stored array, or None if it is not stored."""
+        try:
+            return os.stat(self._paths(symbol)[0]).st_mtime_ns
+        except OSError:
+            return None
+
+    def history(self, symbol: str, start_date: str, end_date: str) -> np.ndarray:
+        """Return stored bars in [start_date, end_date), fetching missing days first."""
+        symbol = symbol.upper()
+        self.ensure(symbol, start_date, end_date)
+        records, _ = self.read(symbol)
+        if records is None:
+            return np.zeros(0, dtype=PRICE_DTYPE)
+        return slice_records(records, start_date, end_date)
+
+
+def _overlap_matches(stored: np.ndarray, fetched: np.ndarray) -> bool:
+    """
+    Whether re-downloaded bars agree with the stored ones on every date they share,
+    ignoring the most recent stored bar, which may have been a partial session.
+
+    Adjusted prices are rescaled across the whole history after a split or dividend,
+    so a mismatch in older overlapping bars means the stored history is stale.
+    """
+    stored = stored[:-1]
+    if len(stored) == 0:
+        return True
+    shared = np.isin(stored["date"], fetched["date"])
+    if not shared.all():
+        return False
+    fetched = fetched[np.isin(fetched["date"], stored["date"])]
+    for field in ("open", "high", "low", "close"):
+        if not np.allclose(stored[field], fetched[field], rtol=1e-6, equal_nan=True):
+            return False
+    return True
+
+
+def _clamp_end(end_date: str) -> str:
+    # Bars after today do not exist yet, so never mark them as fetched
+    tomorrow = (date.today() + timedelta(days=1)).strftime("%Y-%m-%d")
+    return min(end_date, tomorrow)
+
+
+def slice_records(records: np.ndarray, start_date: str, end_date: str) -> np.ndarray:
+    """Slice a date-sorted array to [start_date, end_date) with binary search."""
+    lo, hi = window_bounds(records["date"], start_date, end_date, inclusive_end=False)
+    return records[lo:hi]
+
+
+_price_store: Optional[PriceStore] = None
+
+
+def get_price_store() -> PriceStore:
+    """Return the price store under data_cache_dir/prices."""
+    global _price_store
+    root_dir = os.path.join(get_config()["data_cache_dir"], "prices")
+    if _price_store is None or _price_store.root_dir != root_dir:
+        _price_store = PriceStore(root_dir)
+    return _price_store
+
+
+def load_price_history(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Return daily bars for symbol in [start_date, end_date) as a Date/OHLCV frame."""
+    return frame_from_records(get_price_store().history(symbol, start_date, end_date))
@@ -0,0 +1,187 @@
+import os
+import json
+import time
+import uuid
+import hashlib
+import logging
+import threading
+import contextlib
+import contextvars
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: limit within the process only
+    fcntl = None
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+
+# Priority of the calls made from the current context; prefetch code switches to BACKGROUND
+_priority = contextvars.ContextVar("rate_limit_priority", default=INTERACTIVE)
+
+# How long an interactive waiter's claim on the next token stays valid without renewal
+_WAITER_TTL_SECONDS = 5.0
+_MAX_SLEEP_SECONDS = 1.0
+
+
+@contextlib.contextmanager
+def background_priority():
+    """Run the enclosed calls in the background lane, behind any interactive caller."""
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a token could not be acquired within the allowed wait."""
+
+
+class TokenBucketLimiter:
+    """
+    Token-bucket rate limiter shared by every thread and process using the same state file.
+
+    Each configured rate (for example per minute and per day) is a bucket that refills
+    continuously up to its capacity; a call takes one token from every bucket. State
+    lives in a small JSON file guarded by an exclusive flock, so separate processes
+    using the same API key draw from the same budget.
+
+    Interactive callers register as waiting while they queue; background callers only
+    take a token when no interactive caller is waiting, so analyst calls go first.
+    """
+
+    def __init__(self, state_file: str, rates: Dict[str, tuple]):
+        """
+        Args:
+            state_file: Path of the shared state file
+            rates: Bucket name -> (capacity, period_seconds), e.g. {"minute": (75, 60)}
+        """
+        self.state_file = state_file
+        self.rates = {name: rate for name, rate in rates.items() if rate[0]}
+        self._thread_lock = threading.Lock()
+        os.makedirs(os.path.dirname(state_file), exist_ok=True)
+
+    @contextlib.contextmanager
+    def _locked_state(self):
+        with self._thread_lock, open(self.state_file, "a+") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or "{}")
+                except ValueError:
+                    state = {}
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _refill(self, state: dict, now: float) -> dict:
+        buckets = state.setdefault("buckets", {})
+        for name, (capacity, period) in self.rates.items():
+            bucket = buckets.setdefault(name, {"tokens": float(capacity), "updated": now})
+            elapsed = max(0.0, now - bucket["updated"])
+            bucket["tokens"] = min(float(capacity), bucket["tokens"] + elapsed * capacity / period)
+            bucket["updated"] = now
+        return buckets
+
+    def _wait_time(self, buckets: dict) -> float:
+        wait = 0.0
+        for name, (capacity, period) in self.rates.items():
+            missing = 1.0 - buckets[name]["tokens"]
+            if missing > 0:
+                wait = max(wait, missing * period / capacity)
+        return wait
+
+    def try_acquire(self, priority: str = INTERACTIVE, waiter_id: Optional[str] = None) -> float:
+        """
+        Take a token if one is available to this priority.
+
+        Returns:
+            0.0 when a token was taken, otherwise the suggested wait in seconds
+        """
+        now = time.time()
+        with self._locked_state() as state:
+            buckets = self._refill(state, now)
+            waiters = {
+                key: expiry for key, expiry in state.get("waiters", {}).items() if expiry > now
+            }
+            if waiter_id is not None:
+                waiters.pop(waiter_id, None)
+
+            wait = self._wait_time(buckets)
+            blocked = priority == BACKGROUND and waiters
+            if wait == 0.0 and not blocked:
+                for bucket in buckets.values():
+                    bucket["tokens"] -= 1.0
+                state["waiters"] = waiters
+                return 0.0
+
+            if priority == INTERACTIVE and waiter_id is not None:
+                waiters[waiter_id] = now + _WAITER_TTL_SECONDS
+            state["waiters"] = waiters
+            return max(wait, 0.05)
+
+    def acquire(self, priority: Optional[str] = None, max_wait: Optional[float] = None) -> None:
+        """
+        Block until a token is available, pacing the caller.
+
+        Raises:
+            RateLimitTimeout: If no token became available within max_wait seconds
+        """
+        priority = priority or current_priority()
+        waiter_id = uuid.uuid4().hex if priority == INTERACTIVE else None
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        queued = False
+
+        while True:
+            wait = self.try_acquire(priority, waiter_id)
+            if wait == 0.0:
+                return
+            if not queued:
+                logger.debug("Rate limiter: queued %s call for %.2fs", priority, wait)
+                queued = True
+            if deadline is not None and time.monotonic() + min(wait, _MAX_SLEEP_SECONDS) > deadline:
+                self._drop_waiter(waiter_id)
+                raise RateLimitTimeout(f"No rate-limit token within {max_wait}s")
+            time.sleep(min(wait, _MAX_SLEEP_SECONDS))
+
+    def _drop_waiter(self, waiter_id: Optional[str]) -> None:
+        if waiter_id is None:
+            return
+        with self._locked_state() as state:
+            state.get("waiters", {}).pop(waiter_id, None)
+
+
+_limiters: Dict[tuple, TokenBucketLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(namespace: str, key: str, state_dir: str, rates: Dict[str, tuple]) -> TokenBucketLimiter:
+    """
+    Return the limiter for (namespace, key), e.g. ("alpha_vantage", api_key).
+
+    The key is hashed into the state file name so API keys never land on disk.
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    state_file = os.path.join(state_dir, f"{namespace}-{digest}.json")
+    cache_key = (state_file, tuple(sorted(rates.items())))
+    with _limiters_lock:
+        limiter = _limiters.get(cache_key)
+        if limiter is None:
+            limiter = TokenBucketLimiter(state_file, rates)
+            _limiters[cache_key] = limiter
+        return limiter
@@ -0,0 +1,236 @@
+import os
+import re
+import json
+import time
+import pickle
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .config import get_config
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+# Sentinel returned by ResultCache.get when a key is absent or expired
+MISS = object()
+
+# Results that are a vendor's error report rather than data: a leading "Error ..."
+# message or an Alpha Vantage JSON error payload
+_VENDOR_ERROR = re.compile(r'\A\s*(Error\b|\{\s*"(Error Message|Note|Information)")')
+
+# Results not worth caching: vendor errors plus empty answers such as "No cash flow data
+# found for symbol 'X'". Only the start of the result is checked, so a report whose
+# text merely contains a line beginning with "Error" is still cached.
+_UNCACHEABLE_RESULT = re.compile(
+    r'\A\s*(Error\b|No .* found for symbol|\{\s*"(Error Message|Note|Information)")'
+)
+
+
+def is_error_result(result: Any) -> bool:
+    """Whether a vendor returned an error message instead of raising."""
+    return isinstance(result, str) and _VENDOR_ERROR.match(result) is not None
+
+
+def is_cacheable(result: Any) -> bool:
+    """
+    Whether a routed result is worth caching.
+
+    Empty results and vendor error messages are not cached, so a transient failure
+    is retried (and can fall back to another vendor) on the next call instead of
+    being served until its TTL expires.
+    """
+    if result is None:
+        return False
+    if isinstance(result, str):
+        return bool(result.strip()) and _UNCACHEABLE_RESULT.match(result) is None
+    try:
+        return len(result) > 0
+    except TypeError:
+        return True
+
+
+def make_cache_key(method: str, vendor: str, args: tuple, kwargs: dict) -> str:
+    """
+    Build a content-addressed key for a routed vendor call.
+
+    Args:
+        method: Routed method name, e.g. get_stock_data
+        vendor: Vendor configuration resolved for the method (tool-level override first,
+            then category), e.g. "yfinance" or "alpha_vantage,openai"
+        args: Positional arguments passed to route_to_vendor
+        kwargs: Keyword arguments passed to route_to_vendor
+
+    Returns:
+        Hex digest identifying the (method, vendor, args) combination
+    """
+    normalized_vendor = ",".join(v.strip() for v in vendor.split(","))
+    payload = {
+        "method": method,
+        "vendor": normalized_vendor,
+        "args": [_normalize_arg(a) for a in args],
+        "kwargs": {k: _normalize_arg(v) for k, v in sorted(kwargs.items())},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _normalize_arg(value):
+    """Normalize an argument so equivalent calls map to the same key."""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (list, tuple)):
+        return [_normalize_arg(v) for v in value]
+    return value
+
+
+class ResultCache:
+    """
+    Two-tier (in-process LRU + on-disk) cache for vendor results with per-entry TTL.
+    """
+
+    def __init__(self, max_entries: int = 512, disk_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self._memory = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or MISS if absent or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return value
+                del self._memory[key]
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._put_memory(key, expires_at, value)
+                return value
+            self._remove_disk(key)
+
+        with self._lock:
+            self.misses += 1
+        return MISS
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds in both tiers."""
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._put_memory(key, expires_at, value)
+            self.stores += 1
+        self._write_disk(key, expires_at, value)
+
+    def clear(self) -> None:
+        """Drop every entry from the memory tier (disk entries expire on their own)."""
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for the cache."""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+            }
+
+    def _put_memory(self, key, expires_at, value):
+        # Caller must hold self._lock
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.pkl")
+
+    def _read_disk(self, key: str):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _write_disk(self, key: str, expires_at: float, value: Any) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((expires_at, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning("Failed to write result cache entry %s: %s", key, e)
+
+    def _remove_disk(self, key: str) -> None:
+        try:
+            os.remove(self._disk_path(key))
+        except OSError:
+            pass
+
+
+_result_cache: Optional[ResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Return the process-wide result cache, or None when caching is disabled."""
+    global _result_cache
+    cache_config = get_config().get("result_cache", {})
+    if not cache_config.get("enabled", False):
+        return None
+
+    with _result_cache_lock:
+        if _result_cache is None:
+            disk_dir = None
+            if cache_config.get("disk", False):
+                disk_dir = os.path.join(get_config()["data_cache_dir"], "results")
+            _result_cache = ResultCache(
+                max_entries=cache_config.get("max_memory_entries", 512),
+                disk_dir=disk_dir,
+            )
+        return _result_cache
+
+
+def reset_result_cache() -> None:
+    """Discard the process-wide cache so the next call rebuilds it from config."""
+    global _result_cache
+    with _result_cache_lock:
+        _result_cache = None
+
+
+def get_ttl(category: str) -> float:
+    """Return the configured TTL (seconds) for a tool category."""
+    ttls = get_config().get("result_cache", {}).get("ttl_seconds", {})
+    return ttls.get(category, ttls.get("default", 0))
@@ -0,0 +1,218 @@
+import os
+import json
+import sqlite3
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+# Statement -> (directory under simfin_data_all, file name prefix)
+SIMFIN_STATEMENTS = {
+    "balance_sheet": ("balance_sheet", "us-balance"),
+    "cash_flow": ("cash_flow", "us-cashflow"),
+    "income_statements": ("income_statements", "us-income"),
+}
+
+DATE_COLUMNS = ("Report Date", "Publish Date")
+
+
+def simfin_source_path(statement: str, freq: str) -> str:
+    """Path of the US-wide SimFin CSV bulk file for a statement and frequency."""
+    directory, prefix = SIMFIN_STATEMENTS[statement]
+    return os.path.join(
+        get_config()["data_dir"],
+        "fundamental_data",
+        "simfin_data_all",
+        directory,
+        "companies",
+        "us",
+        f"{prefix}-{freq}.csv",
+    )
+
+
+def _file_version(path: str) -> str:
+    # Raises FileNotFoundError for a missing bulk file, like pd.read_csv did
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class SimFinStore:
+    """
+    SQLite index over the SimFin bulk statement files of one reporting frequency.
+
+    Each statement file is ingested once into its own table with an index on
+    (Ticker, Publish Date), so a point-in-time lookup is a single indexed query
+    instead of a scan of the whole US-wide CSV. The source file's mtime and size
+    are recorded with the table, and a changed file is re-ingested on the next
+    lookup. Column dtypes from the CSV are recorded too, so rows come back exactly
+    as the pandas-parsed file would return them.
+    """
+
+    def __init__(self, db_path: str, freq: str):
+        self.db_path = db_path
+        self.freq = freq
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS simfin_meta "
+                "(name TEXT PRIMARY KEY, source_version TEXT, dtypes TEXT)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _ensure_table(self, statement: str) -> Dict[str, str]:
+        """Ingest the statement file if it is missing or changed; return its column dtypes."""
+        source_path = simfin_source_path(statement, self.freq)
+        version = _file_version(source_path)
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT source_version, dtypes FROM simfin_meta WHERE name = ?", (statement,)
+            ).fetchone()
+            if row is not None and row[0] == version:
+                return json.loads(row[1])
+            return self._ingest(conn, statement, source_path, version)
+
+    def _ingest(self, conn: sqlite3.Connection, statement: str, source_path: str, version: str) -> Dict[str, str]:
+        logger.info("SimFin store: indexing %s", source_path)
+        df = pd.read_csv(source_path, sep=";")
+
+        # Convert date strings to datetime objects and remove any time components
+        for column in DATE_COLUMNS:
+            df[column] = pd.to_datetime(df[column], utc=True).dt.normalize()
+        dtypes = {column: str(dtype) for column, dtype in df.dtypes.items()}
+
+        # ISO dates compare correctly as text; _row keeps the original row order
+        for column in DATE_COLUMNS:
+            df[column] = df[column].dt.strftime("%Y-%m-%d")
+        df = df.rename_axis("_row").reset_index()
+
+        # Load into a staging table, then swap it in with one transaction so
+        # readers see either the old table or the complete new one
+        staging = f"{statement}__staging"
+        df.to_sql(staging, conn, if_exists="replace", index=False, chunksize=10000)
+        conn.execute("BEGIN")
+        try:
+            conn.execute(f'DROP TABLE IF EXISTS "{statement}"')
+            conn.execute(f'ALTER TABLE "{staging}" RENAME TO "{statement}"')
+            conn.execute(
+                f'CREATE INDEX "{statement}_ticker_publish" ON "{statement}" ("Ticker", "Publish Date")'
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO simfin_meta VALUES (?, ?, ?)",
+                (statement, version, json.dumps(dtypes)),
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return dtypes
+
+    def latest_as_of(self, statement: str, ticker: str, curr_date: str) -> Optional[pd.Series]:
+        """
+        Return the latest statement of ticker published on or before curr_date.
+
+        Args:
+            statement: One of SIMFIN_STATEMENTS
+            ticker: Ticker symbol as written in the SimFin file
+            curr_date: Point-in-time date, yyyy-mm-dd
+
+        Returns:
+            The statement row (indexed by column name), or None if nothing was
+            published by curr_date
+        """
+        return self.statements_as_of(ticker, curr_date, (statement,))[statement]
+
+    def statements_as_of(
+        self,
+        ticker: str,
+        curr_date: str,
+        statements: Tuple[str, ...] = tuple(SIMFIN_STATEMENTS),
+    ) -> Dict[str, Optional[pd.Series]]:
+        """
+        Return the latest row of each statement published on or before curr_date.
+
+        All lookups run in one read transaction on the shared connection, so the
+        statements come from the same ingested snapshot.
+
+        Returns:
+            Dict mapping each statement to its row, or to None if nothing was
+            published by curr_date
+        """
+        dtypes = {statement: self._ensure_table(statement) for statement in statements}
+        # Convert the current date to datetime and normalize
+        as_of = pd.to_datetime(curr_date, utc=True).normalize().strftime("%Y-%m-%d")
+
+        frames = {}
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                for statement in statements:
+                    # Ties on Publish Date resolve to the first row in the file, like idxmax
+                    frames[statement] = pd.read_sql_query(
+                        f'SELECT * FROM "{statement}" WHERE "Ticker" = ? AND "Publish Date" <= ? '
+                        'ORDER BY "Publish Date" DESC, "_row" ASC LIMIT 1',
+                        conn,
+                        params=(ticker, as_of),
+                    )
+            finally:
+                conn.commit()
+
+        return {
+            statement: None
+            if frame.empty
+            else _restore_dtypes(frame.set_index("_row"), dtypes[statement]).iloc[0]
+            for statement, frame in frames.items()
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _restore_dtypes(frame: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """Cast columns read back from SQLite to the dtypes pandas inferred for the CSV."""
+    for column, dtype in dtypes.items():
+        if column in DATE_COLUMNS:
+            frame[column] = pd.to_datetime(frame[column], utc=True)
+        elif dtype == "object":
+            # SQLite NULLs come back as None where the CSV parse had NaN
+            frame[column] = frame[column].astype(object).where(frame[column].notna(), np.nan)
+        else:
+            frame[column] = frame[column].astype(dtype)
+    return frame
+
+
+_stores: Dict[str, SimFinStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_simfin_store(freq: str) -> SimFinStore:
+    """
+    Return the process-wide store for a reporting frequency (annual / quarterly).
+
+    Stores live under data_cache_dir/simfin and keep their SQLite connection open,
+    so repeat lookups skip both ingestion and connection setup.
+    """
+    db_path = os.path.join(get_config()["data_cache_dir"], "simfin", f"us-{freq}.sqlite")
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            store = SimFinStore(db_path, freq)
+            _stores[db_path] = store
+        return store
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+
+class _InFlightCall:
+    """State shared between the leader executing a call and the callers waiting on it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls so only one executes.
+
+    The first caller for a key (the leader) runs the function; callers arriving with the
+    same key while it is in flight wait and receive the leader's result, or re-raise its
+    exception. Once the call finishes the key is released, so later calls run again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _InFlightCall] = {}
+        self._async_calls: Dict[tuple, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn for key, or wait for the identical call already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async counterpart of do; calls are coalesced per event loop.
+
+        The shared call runs as its own task, and every caller (the leader included)
+        awaits it through asyncio.shield, so a cancelled caller stops waiting without
+        cancelling the call for the others.
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        with self._lock:
+            task = self._async_calls.get(loop_key)
+            if task is not None:
+                self.coalesced += 1
+            else:
+                task = loop.create_task(fn())
+                self._async_calls[loop_key] = task
+                self.executed += 1
+                task.add_done_callback(lambda done: self._finish_async(loop_key, done))
+
+        return await asyncio.shield(task)
+
+    def _finish_async(self, loop_key: tuple, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._async_calls.get(loop_key) is task:
+                del self._async_calls[loop_key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """Return how many calls executed and how many were coalesced onto them."""
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls) + len(self._async_calls),
+            }
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide single-flight group used by route_to_vendor."""
+    return _single_flight
@@ -1,9 +1,75 @@
+import numpy as np
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
 import os
+import threading
+from collections import OrderedDict
 from .config import get_config, DATA_DIR
+from .price_store import get_price_store, load_price_history
+from .date_index import to_days, find_day
+
+# Parsed, stockstats-wrapped price frames keyed by (symbol, source); each entry is
+# (version, frame, days, lock) where days is the frame's sorted datetime64[D] index
+# and version changes whenever the underlying file does
+_wrapped_frames = OrderedDict()
+_wrapped_frames_lock = threading.Lock()
+
+
+def indicator_history_range():
+    """(start, end) dates, YYYY-mm-dd, of the 15-year history indicators are computed over."""
+    today_date = pd.Timestamp.today()
+    start_date = today_date - pd.DateOffset(years=15)
+    return start_date.strftime("%Y-%m-%d"), today_date.strftime("%Y-%m-%d")
+
+
+def _get_wrapped_frame(symbol: str, online: bool):
+    """
+    Return (frame, days, lock) for symbol from the process-wide wrapped-frame LRU.
+
+    Entries are invalidated by the modification time of the backing file (the local
+    CSV, or the price-store array). Columns stockstats adds to a cached frame persist,
+    so the lock must be held while computing or reading indicators.
+    """
+    if not online:
+        data_file = os.path.join(DATA_DIR, f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv")
+        try:
+            version = os.stat(data_file).st_mtime_ns
+        except OSError:
+            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+    else:
+        start_date, end_date = indicator_history_range()
+        store = get_price_store()
+        # Tops up the store first, which changes its mtime when new bars arrive
+        store.ensure(symbol, start_date, end_date)
+        version = (store.mtime(symbol), start_date)
+
+    key = (symbol.upper(), "online" if online else "local")
+    with _wrapped_frames_lock:
+        cached = _wrapped_frames.get(key)
+        if cached is not None and cached[0] == version:
+            _wrapped_frames.move_to_end(key)
+            return cached[1:]
+
+    if not online:
+        data = pd.read_csv(data_file)
+    else:
+        # Served from the persistent price store, which only fetches missing days
+        data = load_price_history(symbol, start_date, end_date)
+    days = to_days(data["Date"])
+    if len(days) > 1 and not (days[1:] >= days[:-1]).all():
+        order = np.argsort(days, kind="stable")
+        data, days = data.iloc[order].reset_index(drop=True), days[order]
+    df = wrap(data)
+
+    entry = (version, df, days, threading.Lock())
+    max_frames = get_config().get("price_store", {}).get("max_cached_frames", 32)
+    with _wrapped_frames_lock:
+        _wrapped_frames[key] = entry
+        _wrapped_frames.move_to_end(key)
+        while len(_wrapped_frames) > max_frames:
+            _wrapped_frames.popitem(last=False)
+    return entry[1:]
 
 
 class StockstatsUtils:
@@ -21,62 +87,15 @@ class StockstatsUtils:
         config = get_config()
         online = config["data_vendors"]["technical_indicators"] != "local"
 
-        df = None
-        data = None
-
-        if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        DATA_DIR,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-        else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
+        # Parsed and wrapped once per (symbol, source); repeat lookups are dictionary hits
+        df, days, lock = _get_wrapped_frame(symbol, online)
+        row = find_day(days, curr_date)
 
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
+        with lock:
+            values = df[indicator]  # trigger stockstats to calculate the indicator
 
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
+            if row is not None:
+                indicator_value = values.to_numpy()[row]
+                return indicator_value
             else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
-
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
-
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
-
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
-            return indicator_value
-        else:
-            return "N/A: Not a trading day (weekend or holiday)"
+                return "N/A: Not a trading day (weekend or holiday)"
@@ -12,6 +12,19 @@ def save_output(data: pd.DataFrame, tag: str, save_path: SavePathType = None) ->
         print(f"{tag} saved to {save_path}")
 
 
+def split_indicator_names(indicator) -> list:
+    """
+    Normalize indicator names to a list.
+
+    Accepts a single name, a comma-separated string or a list whose elements may
+    themselves be comma-separated; names are stripped and de-duplicated in order.
+    """
+    if isinstance(indicator, str):
+        indicator = [indicator]
+    names = (name.strip() for item in indicator for name in str(item).split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
+
 def get_current_date():
     return date.today().strftime("%Y-%m-%d")
 
@@ -0,0 +1,196 @@
+import time
+import threading
+from collections import deque
+from typing import Dict, Tuple
+
+from .config import get_config
+from .hedging import get_latency_tracker
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker and rolling outcome window for one (vendor, method) pair.
+
+    CLOSED lets every call through. After failure_threshold consecutive failures (or a
+    single rate-limit error) the breaker trips to OPEN and rejects calls for a cool-down
+    that doubles on every consecutive trip. Once the cool-down expires the breaker is
+    HALF_OPEN: a single call at a time is admitted as a probe (see acquire), a success
+    closes it again and a failure re-opens it with a longer cool-down.
+
+    Only vendor faults are recorded as failures; a call that failed for another reason
+    (e.g. a bad argument) just releases its admission.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        base_cooldown: float = 30.0,
+        max_cooldown: float = 900.0,
+        window: int = 50,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.outcomes = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.opened_at = None
+        self.probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def cooldown(self) -> float:
+        """Current cool-down in seconds, doubling with each consecutive trip."""
+        if self.trips == 0:
+            return 0.0
+        return min(self.base_cooldown * 2 ** (self.trips - 1), self.max_cooldown)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        # Caller must hold self._lock
+        if self.opened_at is None:
+            return CLOSED
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return OPEN
+        return HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """Return False while the breaker is open and cooling down."""
+        return self.state != OPEN
+
+    def acquire(self) -> bool:
+        """
+        Admit one call. While HALF_OPEN only one probe may be in flight.
+
+        Every admitted call must end in record_success, record_failure or release.
+        """
+        with self._lock:
+            state = self._state()
+            if state == OPEN:
+                return False
+            if state == HALF_OPEN:
+                if self.probe_in_flight:
+                    return False
+                self.probe_in_flight = True
+            return True
+
+    def release(self) -> None:
+        """End an admitted call without recording an outcome."""
+        with self._lock:
+            self.probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.outcomes.append(True)
+            self.consecutive_failures = 0
+            self.trips = 0
+            self.opened_at = None
+            self.probe_in_flight = False
+
+    def record_failure(self, rate_limited: bool = False) -> None:
+        with self._lock:
+            self.probe_in_flight = False
+            self.outcomes.append(False)
+            self.consecutive_failures += 1
+            state = self._state()
+            if state == HALF_OPEN or (
+                state == CLOSED
+                and (rate_limited or self.consecutive_failures >= self.failure_threshold)
+            ):
+                self.trips += 1
+                self.opened_at = time.monotonic()
+
+    def success_rate(self) -> float:
+        """Share of successful calls in the rolling window (1.0 when no calls yet)."""
+        with self._lock:
+            if not self.outcomes:
+                return 1.0
+            return sum(self.outcomes) / len(self.outcomes)
+
+
+class VendorHealthRegistry:
+    """
+    Process-wide registry of circuit breakers and health scores per (vendor, method).
+    """
+
+    def __init__(self):
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, vendor: str, method: str) -> CircuitBreaker:
+        with self._lock:
+            key = (vendor, method)
+            if key not in self._breakers:
+                breaker_config = get_config().get("circuit_breaker", {})
+                self._breakers[key] = CircuitBreaker(
+                    failure_threshold=breaker_config.get("failure_threshold", 3),
+                    base_cooldown=breaker_config.get("base_cooldown_seconds", 30.0),
+                    max_cooldown=breaker_config.get("max_cooldown_seconds", 900.0),
+                    window=breaker_config.get("window", 50),
+                )
+            return self._breakers[key]
+
+    def allow_request(self, vendor: str, method: str) -> bool:
+        if not get_config().get("circuit_breaker", {}).get("enabled", False):
+            return True
+        return self.breaker(vendor, method).allow_request()
+
+    def acquire(self, vendor: str, method: str) -> bool:
+        """Admit a call to (vendor, method); see CircuitBreaker.acquire."""
+        if not get_config().get("circuit_breaker", {}).get("enabled", False):
+            return True
+        return self.breaker(vendor, method).acquire()
+
+    def release(self, vendor: str, method: str) -> None:
+        self.breaker(vendor, method).release()
+
+    def record_success(self, vendor: str, method: str) -> None:
+        self.breaker(vendor, method).record_success()
+
+    def record_failure(self, vendor: str, method: str, rate_limited: bool = False) -> None:
+        self.breaker(vendor, method).record_failure(rate_limited=rate_limited)
+
+    def score(self, vendor: str, method: str) -> float:
+        """
+        Health score in [0, 1]: rolling success rate discounted by median latency.
+
+        Vendors without history score 1.0 so they are not penalized before being tried.
+        """
+        latency_scale = get_config().get("circuit_breaker", {}).get("latency_scale_seconds", 5.0)
+        median_latency = get_latency_tracker().percentile(vendor, method, 50) or 0.0
+        return self.breaker(vendor, method).success_rate() / (1.0 + median_latency / latency_scale)
+
+    def order_by_health(self, vendors: list, method: str) -> list:
+        """Sort vendors by descending health score, keeping the given order on ties."""
+        if not get_config().get("circuit_breaker", {}).get("enabled", False):
+            return list(vendors)
+        return sorted(vendors, key=lambda vendor: -self.score(vendor, method))
+
+    def snapshot(self) -> dict:
+        """Return state, trips and score for every tracked (vendor, method)."""
+        with self._lock:
+            keys = list(self._breakers)
+        return {
+            f"{vendor}:{method}": {
+                "state": self.breaker(vendor, method).state,
+                "trips": self.breaker(vendor, method).trips,
+                "score": round(self.score(vendor, method), 4),
+            }
+            for vendor, method in keys
+        }
+
+
+_vendor_health = VendorHealthRegistry()
+
+
+def get_vendor_health() -> VendorHealthRegistry:
+    """Return the process-wide vendor health registry."""
+    return _vendor_health
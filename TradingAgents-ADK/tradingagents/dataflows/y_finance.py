@@ -1,9 +1,120 @@
-from typing import Annotated
+from typing import Annotated, List, Union
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import yfinance as yf
 import os
-from .stockstats_utils import StockstatsUtils
+import time
+import logging
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from .config import get_config
+from .stockstats_utils import StockstatsUtils, indicator_history_range
+from .price_store import get_price_store, frame_from_records, records_from_frame
+from .indicators import IndicatorFrame
+from .date_index import window_bounds
+from .utils import split_indicator_names
+
+logger = logging.getLogger("tradingagents.dataflows")
+
+# Per-(symbol, start, end) OHLCV frames fetched by get_YFin_data_online_batch; each
+# entry is (expires_at, frame), where expires_at is None for ranges that ended before
+# today (their bars no longer change)
+_batch_cache = OrderedDict()
+_batch_cache_lock = threading.Lock()
+
+# Per-(symbol, source) IndicatorFrame objects used by get_stock_stats_indicators_window
+_indicator_frames = OrderedDict()
+_indicator_frames_lock = threading.Lock()
+
+
+def get_YFin_data_online_batch(
+    symbols: Annotated[list, "ticker symbols"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+) -> dict:
+    """
+    Fetch OHLCV history for many symbols with bulk yfinance downloads.
+
+    Symbols whose range is already in the persistent price store, or in the batch
+    cache for the same date range, are not re-downloaded; the rest are fetched in
+    chunks of stock_batch.chunk_size symbols per request. Cached ranges that reach
+    today expire after stock_batch.open_range_ttl_seconds so new bars are picked up.
+
+    Returns:
+        Dict mapping each upper-cased symbol that returned data to its DataFrame
+    """
+    datetime.strptime(start_date, "%Y-%m-%d")
+    datetime.strptime(end_date, "%Y-%m-%d")
+
+    symbols = list(dict.fromkeys(s.upper() for s in symbols))
+    frames = {}
+    missing = []
+    store = get_price_store()
+    for symbol in symbols:
+        if store.covers(symbol, start_date, end_date):
+            frames[symbol] = frame_from_records(
+                store.history(symbol, start_date, end_date)
+            ).set_index("Date")
+    now = time.time()
+    with _batch_cache_lock:
+        for symbol in symbols:
+            if symbol in frames:
+                continue
+            key = (symbol, start_date, end_date)
+            cached = _batch_cache.get(key)
+            if cached is not None and (cached[0] is None or cached[0] > now):
+                _batch_cache.move_to_end(key)
+                frames[symbol] = cached[1]
+            else:
+                _batch_cache.pop(key, None)
+                missing.append(symbol)
+
+    batch_config = get_config().get("stock_batch", {})
+    chunk_size = batch_config.get("chunk_size", 100)
+    expires_at = None
+    if end_date >= datetime.now().strftime("%Y-%m-%d"):
+        expires_at = now + batch_config.get("open_range_ttl_seconds", 15 * 60)
+    for i in range(0, len(missing), chunk_size):
+        downloaded = _download_batch(missing[i:i + chunk_size], start_date, end_date)
+        with _batch_cache_lock:
+            for symbol, frame in downloaded.items():
+                _batch_cache[(symbol, start_date, end_date)] = (expires_at, frame)
+            while len(_batch_cache) > batch_config.get("max_cached_frames", 1000):
+                _batch_cache.popitem(last=False)
+        frames.update(downloaded)
+
+    return {symbol: frames[symbol].copy() for symbol in symbols if symbol in frames}
+
+
+def _download_batch(symbols: list, start_date: str, end_date: str) -> dict:
+    """Download several symbols in one yf.download call and split them per symbol."""
+    data = yf.download(
+        symbols,
+        start=start_date,
+        end=end_date,
+        group_by="ticker",
+        auto_adjust=True,
+        actions=True,
+        progress=False,
+        threads=True,
+        multi_level_index=True,
+    )
+
+    frames = {}
+    if data.empty:
+        return frames
+
+    available = set(data.columns.get_level_values(0))
+    for symbol in symbols:
+        if symbol not in available:
+            continue
+        frame = data[symbol].dropna(how="all")
+        if not frame.empty:
+            frames[symbol] = frame
+    return frames
+
 
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -14,14 +125,12 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    # Served from the batch cache, so a watchlist prefetch makes this a lookup
+    frames = get_YFin_data_online_batch([symbol], start_date, end_date)
+    data = frames.get(symbol.upper())
 
     # Check if data is empty
-    if data.empty:
+    if data is None or data.empty:
         return (
             f"No data found for symbol '{symbol}' between {start_date} and {end_date}"
         )
@@ -48,7 +157,10 @@ def get_YFin_data_online(
 
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
-    indicator: Annotated[str, "technical indicator to get the analysis and report of"],
+    indicator: Annotated[
+        Union[str, List[str]],
+        "technical indicator(s) to get the analysis and report of; a list or comma-separated names",
+    ],
     curr_date: Annotated[
         str, "The current trading date you are trading on, YYYY-mm-dd"
     ],
@@ -128,143 +240,153 @@ def get_stock_stats_indicators_window(
         ),
     }
 
-    if indicator not in best_ind_params:
-        raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
-        )
+    indicators = split_indicator_names(indicator)
+    for name in indicators:
+        if name not in best_ind_params:
+            raise ValueError(
+                f"Indicator {name} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            )
 
     end_date = curr_date
     curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date_dt - relativedelta(days=look_back_days)
 
-    # Optimized: Get stock data once and calculate indicators for all dates
-    try:
-        indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
-        
-        # Generate the date range we need
-        current_dt = curr_date_dt
-        date_values = []
-        
-        while current_dt >= before:
-            date_str = current_dt.strftime('%Y-%m-%d')
-            
-            # Look up the indicator value for this date
-            if date_str in indicator_data:
-                indicator_value = indicator_data[date_str]
-            else:
-                indicator_value = "N/A: Not a trading day (weekend or holiday)"
-            
-            date_values.append((date_str, indicator_value))
-            current_dt = current_dt - relativedelta(days=1)
-        
-        # Build the result string
-        ind_string = ""
-        for date_str, value in date_values:
-            ind_string += f"{date_str}: {value}\n"
-        
-    except Exception as e:
-        print(f"Error getting bulk stockstats data: {e}")
-        # Fallback to original implementation if bulk method fails
-        ind_string = ""
-        curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
-        while curr_date_dt >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date_dt.strftime("%Y-%m-%d")
-            )
-            ind_string += f"{curr_date_dt.strftime('%Y-%m-%d')}: {indicator_value}\n"
-            curr_date_dt = curr_date_dt - relativedelta(days=1)
-
-    result_str = (
-        f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
-        + ind_string
-        + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
-    )
+    # All indicators for the symbol share one price load and one indicator frame
+    sections = []
+    for name in indicators:
+        try:
+            ind_string = _get_stock_stats_bulk(symbol, name, curr_date_dt, before)
+        except Exception as e:
+            # Fallback to original implementation if bulk method fails
+            logger.warning("Error getting bulk stockstats data for %s %s, using stockstats per day: %s", symbol, name, e)
+            ind_string = ""
+            day_dt = curr_date_dt
+            while day_dt >= before:
+                indicator_value = get_stockstats_indicator(
+                    symbol, name, day_dt.strftime("%Y-%m-%d")
+                )
+                ind_string += f"{day_dt.strftime('%Y-%m-%d')}: {indicator_value}\n"
+                day_dt = day_dt - relativedelta(days=1)
+
+        sections.append(
+            f"## {name} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
+            + ind_string
+            + "\n\n"
+            + best_ind_params.get(name, "No description available.")
+        )
 
-    return result_str
+    return "\n\n".join(sections)
 
 
 def _get_stock_stats_bulk(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to calculate"],
-    curr_date: Annotated[str, "current date for reference"]
-) -> dict:
+    curr_date: Annotated[datetime, "last date of the window"],
+    before: Annotated[datetime, "first date of the window"],
+) -> str:
+    """
+    Vectorized calculation of an indicator over a look-back window.
+
+    Reads the indicator from the symbol's cached IndicatorFrame (computed with the
+    NumPy engine in indicators.py), then slices only the window and formats it in
+    one pass.
+    Returns the "YYYY-mm-dd: value" lines from curr_date back to before.
     """
-    Optimized bulk calculation of stock stats indicators.
-    Fetches data once and calculates indicator for all available dates.
-    Returns dict mapping date strings to indicator values.
+    frame = _get_indicator_frame(symbol)
+    values = frame.get(indicator)
+    dates = frame.dates
+
+    start, end = window_bounds(dates, before.date(), curr_date.date())
+    window = {
+        str(day): ("N/A" if np.isnan(value) else str(value))
+        for day, value in zip(dates[start:end], values[start:end])
+    }
+
+    days = np.arange(
+        np.datetime64(curr_date.date(), "D"),
+        np.datetime64(before.date(), "D") - np.timedelta64(1, "D"),
+        np.timedelta64(-1, "D"),
+    ).astype(str)
+    return "".join(
+        f"{day}: {window.get(day, 'N/A: Not a trading day (weekend or holiday)')}\n"
+        for day in days
+    )
+
+
+def _get_indicator_frame(symbol: str) -> IndicatorFrame:
+    """
+    Return the cached IndicatorFrame for symbol, rebuilding it when the prices change.
+
+    Frames are kept per (symbol, source) in a bounded LRU so repeated get_indicators
+    calls for a ticker reuse every column already computed.
+    """
+    config = get_config()
+    online = config["data_vendors"]["technical_indicators"] != "local"
+    # A frame stays valid until its backing file changes: any rewrite of the price
+    # store (including a re-adjusted refetch with the same row count) bumps its mtime
+    version = _indicator_prices_version(symbol)
+    key = (symbol.upper(), online)
+
+    with _indicator_frames_lock:
+        cached = _indicator_frames.get(key)
+        if cached is not None and cached[0] == version:
+            _indicator_frames.move_to_end(key)
+            return cached[1]
+
+    frame = IndicatorFrame(np.array(_load_indicator_prices(symbol)))
+    with _indicator_frames_lock:
+        _indicator_frames[key] = (version, frame)
+        _indicator_frames.move_to_end(key)
+        while len(_indicator_frames) > config.get("indicators", {}).get("max_cached_symbols", 64):
+            _indicator_frames.popitem(last=False)
+    return frame
+
+
+def _local_indicator_path(symbol: str) -> str:
+    return os.path.join(
+        get_config().get("data_cache_dir", "data"),
+        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
+    )
+
+
+def _indicator_prices_version(symbol: str):
+    """
+    Version of the prices _load_indicator_prices would return, like stockstats_utils uses.
+
+    Online, the price store is topped up first so the version reflects today's bars.
     """
-    from .config import get_config
-    import pandas as pd
-    from stockstats import wrap
-    import os
-    
+    if get_config()["data_vendors"]["technical_indicators"] == "local":
+        try:
+            return os.stat(_local_indicator_path(symbol)).st_mtime_ns
+        except OSError:
+            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+
+    start_date, end_date = indicator_history_range()
+    store = get_price_store()
+    store.ensure(symbol, start_date, end_date)
+    return (store.mtime(symbol), start_date)
+
+
+def _load_indicator_prices(symbol: str) -> np.ndarray:
+    """Return the date-sorted price array indicators are computed from."""
     config = get_config()
     online = config["data_vendors"]["technical_indicators"] != "local"
-    
+
     if not online:
         # Local data path
         try:
             data = pd.read_csv(
-                os.path.join(
-                    config.get("data_cache_dir", "data"),
-                    f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                )
+                _local_indicator_path(symbol),
+                index_col="Date",
+                parse_dates=["Date"],
             )
-            df = wrap(data)
         except FileNotFoundError:
             raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-    else:
-        # Online data fetching with caching
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
-        
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-        
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
-        
-        data_file = os.path.join(
-            config["data_cache_dir"],
-            f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
-        )
-        
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
-        else:
-            data = yf.download(
-                symbol,
-                start=start_date_str,
-                end=end_date_str,
-                multi_level_index=False,
-                progress=False,
-                auto_adjust=True,
-            )
-            data = data.reset_index()
-            data.to_csv(data_file, index=False)
-        
-        df = wrap(data)
-        df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-    
-    # Calculate the indicator for all rows at once
-    df[indicator]  # This triggers stockstats to calculate the indicator
-    
-    # Create a dictionary mapping date strings to indicator values
-    result_dict = {}
-    for _, row in df.iterrows():
-        date_str = row["Date"]
-        indicator_value = row[indicator]
-        
-        # Handle NaN/None values
-        if pd.isna(indicator_value):
-            result_dict[date_str] = "N/A"
-        else:
-            result_dict[date_str] = str(indicator_value)
-    
-    return result_dict
+        return records_from_frame(data)
+
+    # Same 15-year history the stockstats path uses, served from the price store
+    start_date, end_date = indicator_history_range()
+    return get_price_store().history(symbol, start_date, end_date)
 
 
 def get_stockstats_indicator(
@@ -383,6 +505,21 @@ def get_income_statement(
         return f"Error retrieving income statement for {ticker}: {str(e)}"
 
 
+def get_financial_statements(
+    ticker: Annotated[str, "ticker symbol of the company"],
+    freq: Annotated[str, "frequency of data: 'annual' or 'quarterly'"] = "quarterly",
+    curr_date: Annotated[str, "current date (not used for yfinance)"] = None
+):
+    """Get balance sheet, cash flow and income statement data from yfinance."""
+    return "\n\n".join(
+        [
+            get_balance_sheet(ticker, freq, curr_date),
+            get_cashflow(ticker, freq, curr_date),
+            get_income_statement(ticker, freq, curr_date),
+        ]
+    )
+
+
 def get_insider_transactions(
     ticker: Annotated[str, "ticker symbol of the company"]
 ):
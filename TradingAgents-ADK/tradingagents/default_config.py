@@ -30,4 +30,90 @@ DEFAULT_CONFIG = {
         # Example: "get_stock_data": "alpha_vantage",  # Override category default
         # Example: "get_news": "openai",               # Override category default
     },
+    # How route_to_vendor runs multiple primary implementations (comma-separated
+    # vendors, or vendors mapping to a list such as local get_news)
+    "vendor_execution": {
+        "mode": "sequential",       # Options: sequential, concurrent (opt in to fan out primaries at once)
+        "max_workers": 8,
+        "deadline_seconds": 60,     # Per-call deadline for the concurrent fan-out
+    },
+    # Hedged requests: if the primary vendor is slower than its observed latency
+    # percentile, start the next fallback vendor in parallel and keep the first answer
+    "hedging": {
+        "enabled": False,
+        "methods": ["get_stock_data", "get_indicators"],  # None hedges every method
+        "percentile": 95,
+        "min_samples": 10,             # Samples needed before the percentile is trusted
+        "default_delay_seconds": 3.0,  # Delay used until enough samples exist
+        "min_delay_seconds": 0.5,
+    },
+    # Per-(vendor, method) circuit breaker and health scoring used to skip
+    # known-bad vendors and reorder fallbacks
+    "circuit_breaker": {
+        "enabled": True,
+        "failure_threshold": 3,          # Consecutive failures before opening (rate limits open at once)
+        "base_cooldown_seconds": 30,     # Doubles on every consecutive trip
+        "max_cooldown_seconds": 15 * 60,
+        "window": 50,                    # Calls kept for the rolling success rate
+        "latency_scale_seconds": 5.0,    # Median latency at which the health score halves
+    },
+    # Structured per-vendor-attempt spans (method, vendor, latency, bytes, outcome)
+    # with a p50/p95 summary printed at the end of a run; zero cost when disabled
+    "instrumentation": {
+        "enabled": False,
+        "log_spans": False,  # Also log every span on the "tradingagents.dataflows" logger
+    },
+    # Coalesce concurrent identical route_to_vendor calls into one in-flight fetch
+    "single_flight": {
+        "enabled": True,
+    },
+    # Multi-ticker get_stock_data_batch (dataflows/interface.py)
+    "stock_batch": {
+        "chunk_size": 100,          # Symbols per bulk yfinance download
+        "max_cached_frames": 1000,  # Per-(symbol, range) frames kept for single-ticker lookups
+        "open_range_ttl_seconds": 15 * 60,  # Cached ranges reaching today are re-downloaded after this
+    },
+    # Persistent per-symbol daily price store (data_cache_dir/prices)
+    "price_store": {
+        "overlap_days": 5,         # Stored bars re-downloaded on every top-up to detect revisions
+        "max_cached_frames": 32,   # Parsed stockstats frames kept in memory (per symbol and source)
+    },
+    # Processed Finnhub files indexed under data_cache_dir/finnhub for the local vendor
+    "finnhub": {
+        "max_cached_tickers": 64,   # Loaded per-ticker date indexes kept in memory
+    },
+    # Computed indicator columns kept per symbol for get_indicators
+    "indicators": {
+        "max_cached_symbols": 64,
+    },
+    # Alpha Vantage client settings
+    "alpha_vantage": {
+        # Client-side token bucket per API key, shared across threads and processes
+        "rate_limit": True,
+        "calls_per_minute": 60,
+        "calls_per_day": None,      # Daily quota, e.g. 25 on the free tier (None = unlimited)
+        "max_queue_seconds": 120,   # Longest a call queues before failing over as rate limited
+        "timeout_seconds": (5, 30), # (connect, read) timeouts for the pooled HTTP session
+        "max_retries": 3,           # Retries for connection errors, 429 and 5xx (each takes a token)
+        "backoff_factor": 0.5,      # Exponential backoff between retries
+        "pool_maxsize": 16,         # Keep-alive connections kept by the shared session
+        # Keep daily series on disk (data_cache_dir/alpha_vantage) and slice date ranges locally
+        "cache_daily_series": True,
+        # Options: local (compute every indicator from one cached daily adjusted
+        # series download), remote (one indicator endpoint request per indicator)
+        "indicator_source": "local",
+    },
+    # Result cache in front of route_to_vendor (memory LRU + disk under data_cache_dir/results)
+    "result_cache": {
+        "enabled": True,
+        "disk": True,
+        "max_memory_entries": 512,
+        # Per-category time-to-live in seconds (0 disables caching for that category)
+        "ttl_seconds": {
+            "core_stock_apis": 15 * 60,               # Intraday prices move
+            "technical_indicators": 15 * 60,
+            "fundamental_data": 7 * 24 * 60 * 60,     # Statements change quarterly
+            "news_data": 30 * 60,
+        },
+    },
 }
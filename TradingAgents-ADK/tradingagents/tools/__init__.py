@@ -2,9 +2,29 @@
 Trading tools for ADK agents
 """
 
-from .stock_tools import get_stock_data, get_indicators
-from .fundamental_tools import get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement
-from .news_tools import get_news, get_global_news, get_insider_sentiment, get_insider_transactions
+from .stock_tools import get_stock_data, get_indicators, get_stock_data_async, get_indicators_async
+from .fundamental_tools import (
+    get_fundamentals,
+    get_balance_sheet,
+    get_cashflow,
+    get_income_statement,
+    get_financial_statements_asof,
+    get_fundamentals_async,
+    get_balance_sheet_async,
+    get_cashflow_async,
+    get_income_statement_async,
+    get_financial_statements_asof_async,
+)
+from .news_tools import (
+    get_news,
+    get_global_news,
+    get_insider_sentiment,
+    get_insider_transactions,
+    get_news_async,
+    get_global_news_async,
+    get_insider_sentiment_async,
+    get_insider_transactions_async,
+)
 
 __all__ = [
     "get_stock_data",
@@ -13,8 +33,21 @@ __all__ = [
     "get_balance_sheet",
     "get_cashflow",
     "get_income_statement",
+    "get_financial_statements_asof",
     "get_news",
     "get_global_news",
     "get_insider_sentiment",
     "get_insider_transactions",
+    # Async variants for agents that run tools on an event loop
+    "get_stock_data_async",
+    "get_indicators_async",
+    "get_fundamentals_async",
+    "get_balance_sheet_async",
+    "get_cashflow_async",
+    "get_income_statement_async",
+    "get_financial_statements_asof_async",
+    "get_news_async",
+    "get_global_news_async",
+    "get_insider_sentiment_async",
+    "get_insider_transactions_async",
 ]
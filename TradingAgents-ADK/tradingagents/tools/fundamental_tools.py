@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.async_interface import route_to_vendor_async
 
 
 def get_fundamentals(
@@ -87,3 +88,78 @@ def get_income_statement(
         A formatted report containing income statement data
     """
     return route_to_vendor("get_income_statement", ticker, freq, curr_date)
+
+
+def get_financial_statements_asof(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[str, "reporting frequency: annual/quarterly"] = "quarterly",
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"] = None,
+) -> str:
+    """
+    Retrieve the balance sheet, cash flow statement and income statement for a
+    given ticker symbol in one call, as published on or before curr_date.
+    Uses the configured fundamental_data vendor.
+    
+    Args:
+        ticker: Ticker symbol of the company
+        freq: Reporting frequency: annual/quarterly (default quarterly)
+        curr_date: Current date you are trading at, yyyy-mm-dd
+    
+    Returns:
+        A formatted report containing all three financial statements
+    """
+    return route_to_vendor("get_financial_statements_asof", ticker, freq, curr_date)
+
+
+async def get_fundamentals_async(
+    ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+) -> str:
+    return await route_to_vendor_async("get_fundamentals", ticker, curr_date)
+
+
+get_fundamentals_async.__doc__ = get_fundamentals.__doc__
+
+
+async def get_balance_sheet_async(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[str, "reporting frequency: annual/quarterly"] = "quarterly",
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"] = None,
+) -> str:
+    return await route_to_vendor_async("get_balance_sheet", ticker, freq, curr_date)
+
+
+get_balance_sheet_async.__doc__ = get_balance_sheet.__doc__
+
+
+async def get_cashflow_async(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[str, "reporting frequency: annual/quarterly"] = "quarterly",
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"] = None,
+) -> str:
+    return await route_to_vendor_async("get_cashflow", ticker, freq, curr_date)
+
+
+get_cashflow_async.__doc__ = get_cashflow.__doc__
+
+
+async def get_income_statement_async(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[str, "reporting frequency: annual/quarterly"] = "quarterly",
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"] = None,
+) -> str:
+    return await route_to_vendor_async("get_income_statement", ticker, freq, curr_date)
+
+
+get_income_statement_async.__doc__ = get_income_statement.__doc__
+
+
+async def get_financial_statements_asof_async(
+    ticker: Annotated[str, "ticker symbol"],
+    freq: Annotated[str, "reporting frequency: annual/quarterly"] = "quarterly",
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"] = None,
+) -> str:
+    return await route_to_vendor_async("get_financial_statements_asof", ticker, freq, curr_date)
+
+
+get_financial_statements_asof_async.__doc__ = get_financial_statements_asof.__doc__
@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.async_interface import route_to_vendor_async
 
 
 def get_news(
@@ -85,3 +86,45 @@ def get_insider_transactions(
         A report of insider transaction data
     """
     return route_to_vendor("get_insider_transactions", ticker, curr_date)
+
+
+async def get_news_async(
+    ticker: Annotated[str, "Ticker symbol"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+) -> str:
+    return await route_to_vendor_async("get_news", ticker, start_date, end_date)
+
+
+get_news_async.__doc__ = get_news.__doc__
+
+
+async def get_global_news_async(
+    curr_date: Annotated[str, "Current date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "Number of days to look back"] = 7,
+    limit: Annotated[int, "Maximum number of articles to return"] = 5,
+) -> str:
+    return await route_to_vendor_async("get_global_news", curr_date, look_back_days, limit)
+
+
+get_global_news_async.__doc__ = get_global_news.__doc__
+
+
+async def get_insider_sentiment_async(
+    ticker: Annotated[str, "ticker symbol for the company"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+) -> str:
+    return await route_to_vendor_async("get_insider_sentiment", ticker, curr_date)
+
+
+get_insider_sentiment_async.__doc__ = get_insider_sentiment.__doc__
+
+
+async def get_insider_transactions_async(
+    ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+) -> str:
+    return await route_to_vendor_async("get_insider_transactions", ticker, curr_date)
+
+
+get_insider_transactions_async.__doc__ = get_insider_transactions.__doc__
@@ -2,13 +2,15 @@
 Stock data tools for ADK agents
 """
 
-from typing import Annotated
+from typing import Annotated, List
 import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from tradingagents.dataflows.interface import route_to_vendor
+from tradingagents.dataflows.async_interface import route_to_vendor_async
+from tradingagents.dataflows.utils import split_indicator_names
 
 
 def get_stock_data(
@@ -33,21 +35,47 @@ def get_stock_data(
 
 def get_indicators(
     symbol: Annotated[str, "ticker symbol of the company"],
-    indicator: Annotated[str, "technical indicator to get the analysis and report of"],
+    indicators: Annotated[List[str], "technical indicators to get the analysis and report of"],
     curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
     look_back_days: Annotated[int, "how many days to look back"] = 30,
 ) -> str:
     """
     Retrieve technical indicators for a given ticker symbol.
     Uses the configured technical_indicators vendor.
+    Request all indicators in one call; they share a single price load.
     
     Args:
         symbol: Ticker symbol of the company, e.g. AAPL, TSM
-        indicator: Technical indicator to get the analysis and report of
+        indicators: Technical indicators to get the analysis and report of, e.g. ["rsi", "macd"]
         curr_date: The current trading date you are trading on, YYYY-mm-dd
         look_back_days: How many days to look back, default is 30
     
     Returns:
-        A formatted dataframe containing the technical indicators for the specified ticker symbol and indicator.
+        A formatted report with one section per indicator for the specified ticker symbol.
     """
-    return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
+    indicators = split_indicator_names(indicators)
+    return route_to_vendor("get_indicators", symbol, indicators, curr_date, look_back_days)
+
+
+async def get_stock_data_async(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+) -> str:
+    return await route_to_vendor_async("get_stock_data", symbol, start_date, end_date)
+
+
+get_stock_data_async.__doc__ = get_stock_data.__doc__
+
+
+async def get_indicators_async(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[List[str], "technical indicators to get the analysis and report of"],
+    curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
+    look_back_days: Annotated[int, "how many days to look back"] = 30,
+) -> str:
+    indicators = split_indicator_names(indicators)
+    return await route_to_vendor_async("get_indicators", symbol, indicators, curr_date, look_back_days)
+
+
+get_indicators_async.__doc__ = get_indicators.__doc__